@@ -4,12 +4,15 @@ from __future__ import annotations
 import logging as log
 import os
 import re
+import json
 import shutil
 import sys
+import time
 import tempfile
 from pathlib import Path
 from typing import Union, Callable, List, Tuple
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 from zipfile import ZipFile, BadZipFile
 
@@ -258,6 +261,8 @@ class BootstrapRepos:
         self._app = "openpype"
         self._log = log.getLogger(str(__class__))
         self.data_dir = Path(user_data_dir(self._app, self._vendor))
+        # version manifests by resolved repository location
+        self._version_manifests = {}
         self.secure_registry = OpenPypeSecureRegistry("mongodb")
         self.registry = OpenPypeSettingsRegistry()
         self.zip_filter = [".pyc", "__pycache__"]
@@ -555,6 +560,11 @@ class BootstrapRepos:
         of existing files in given path and compare. It will also compare
         lists of files together for missing files.
 
+        Successful validation is stored to validation cache next to
+        the version (or to user data dir if location is not writable).
+        Version is not validated again while its path, size, modification
+        time and hash of `checksums` file stays the same.
+
         Args:
             path (Path): Path to OpenPype version to validate.
 
@@ -566,9 +576,83 @@ class BootstrapRepos:
         if not path.exists():
             return False, "Path doesn't exist"
 
+        fingerprint = self._get_validation_fingerprint(path)
+        if fingerprint and self._read_validation_cache(path) == fingerprint:
+            return True, "All ok (validated before)"
+
         if path.is_file():
-            return self._validate_zip(path)
-        return self._validate_dir(path)
+            result = self._validate_zip(path)
+        else:
+            result = self._validate_dir(path)
+
+        # versions without checksums are not cached
+        if result[0] and fingerprint:
+            self._write_validation_cache(path, fingerprint)
+        return result
+
+    @staticmethod
+    def _get_validation_fingerprint(path: Path) -> Union[dict, None]:
+        """Get data identifying validated state of version.
+
+        Args:
+            path (Path): Path to OpenPype version zip file or directory.
+
+        Returns:
+            dict: Path, size and modification time of version with hash
+                of its `checksums`, None if checksums can't be read.
+
+        """
+        try:
+            if path.is_file():
+                with ZipFile(path, "r") as zip_file:
+                    checksums_data = zip_file.read("checksums")
+            else:
+                checksums_data = (path / "checksums").read_bytes()
+            stat = path.stat()
+        except (IOError, KeyError, BadZipFile):
+            return None
+
+        return {
+            "path": path.resolve().as_posix(),
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "checksums": hashlib.sha256(checksums_data).hexdigest()
+        }
+
+    def _get_validation_cache_paths(self, path: Path) -> List[Path]:
+        """Get possible paths of validation cache file of version.
+
+        Cache file is stored next to the version, cache in user data dir
+        is used for versions in read-only locations.
+        """
+        path_hash = hashlib.sha1(
+            path.resolve().as_posix().encode("utf-8")).hexdigest()
+        return [
+            path.parent / f"{path.name}.validation",
+            self.data_dir / "validation" / f"{path_hash}.json"
+        ]
+
+    def _read_validation_cache(self, path: Path) -> Union[dict, None]:
+        """Read validation cache of version, None if there is none."""
+        for cache_path in self._get_validation_cache_paths(path):
+            try:
+                with open(cache_path, "r") as cache_file:
+                    return json.load(cache_file)
+            except (IOError, ValueError):
+                continue
+        return None
+
+    def _write_validation_cache(self, path: Path, fingerprint: dict) -> None:
+        """Store validation cache of version to first writable location."""
+        for cache_path in self._get_validation_cache_paths(path):
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, "w") as cache_file:
+                    json.dump(fingerprint, cache_file)
+                return
+            except IOError:
+                continue
+        self._log.warning(f"Cannot store validation cache of {path}")
 
     @staticmethod
     def _validate_zip(path: Path) -> tuple:
@@ -576,7 +660,7 @@ class BootstrapRepos:
         with ZipFile(path, "r") as zip_file:
             # read checksums
             try:
-                checksums_data = str(zip_file.read("checksums"))
+                checksums_data = zip_file.read("checksums").decode("utf-8")
             except IOError:
                 # FIXME: This should be set to False sometimes in the future
                 return True, "Cannot read checksums for archive."
@@ -587,15 +671,22 @@ class BootstrapRepos:
                 for line in checksums_data.split("\n") if line
             ]
 
-            # calculate and compare checksums in the zip file
-            for file in checksums:
-                h = hashlib.sha256()
+            def zip_sha256sum(filename):
                 try:
-                    h.update(zip_file.read(file[1]))
-                except FileNotFoundError:
-                    return False, f"Missing file [ {file[1]} ]"
-                if h.hexdigest() != file[0]:
-                    return False, f"Invalid checksum on {file[1]}"
+                    return hashlib.sha256(
+                        zip_file.read(filename)).hexdigest()
+                except KeyError:
+                    return None
+
+            # calculate and compare checksums in the zip file
+            with ThreadPoolExecutor() as executor:
+                currents = executor.map(
+                    zip_sha256sum, [file[1] for file in checksums])
+                for file, current in zip(checksums, currents):
+                    if current is None:
+                        return False, f"Missing file [ {file[1]} ]"
+                    if current != file[0]:
+                        return False, f"Invalid checksum on {file[1]}"
 
             # get list of files in zip minus `checksums` file itself
             # and turn in to set to compare against list of files
@@ -630,14 +721,21 @@ class BootstrapRepos:
         files_in_dir = set(files_in_dir)
         files_in_checksum = set([file[1] for file in checksums])
 
-        for file in checksums:
+        def dir_sha256sum(filename):
             try:
-                current = sha256sum((path / file[1]).as_posix())
+                return sha256sum((path / filename).as_posix())
             except FileNotFoundError:
-                return False, f"Missing file [ {file[1]} ]"
+                return None
+
+        with ThreadPoolExecutor() as executor:
+            currents = executor.map(
+                dir_sha256sum, [file[1] for file in checksums])
+            for file, current in zip(checksums, currents):
+                if current is None:
+                    return False, f"Missing file [ {file[1]} ]"
 
-            if file[0] != current:
-                return False, f"Invalid checksum on {file[1]}"
+                if file[0] != current:
+                    return False, f"Invalid checksum on {file[1]}"
         diff = files_in_dir.difference(files_in_checksum)
         if diff:
             return False, f"Missing files {diff}"
@@ -1153,36 +1251,131 @@ class BootstrapRepos:
             raise ValueError("specified directory is invalid")
 
         _openpype_versions = []
-        # iterate over directory in first level and find all that might
-        # contain OpenPype.
-        for item in openpype_dir.iterdir():
+        for entry in self._get_version_manifest(openpype_dir)["entries"]:
+            if not entry["valid"] or entry["staging"] != staging:
+                continue
+            detected_version = OpenPypeVersion.parse(entry["version"])
+            detected_version.path = openpype_dir / entry["name"]
+            _openpype_versions.append(detected_version)
 
-            # if file, strip extension, in case of dir not.
-            name = item.name if item.is_dir() else item.stem
-            result = OpenPypeVersion.version_in_str(name)
+        return sorted(_openpype_versions)
 
-            if result[0]:
-                detected_version: OpenPypeVersion
-                detected_version = result[1]
+    def _get_version_manifest_path(self, openpype_dir: Path) -> Path:
+        """Get path to version manifest of repository location.
 
-                if item.is_dir() and not self._is_openpype_in_dir(
-                    item, detected_version
-                ):
-                    continue
+        Manifests are stored in user data dir so repository location
+        doesn't need to be writable (and its modification time is not
+        changed by manifest).
+        """
+        dir_hash = hashlib.sha1(
+            openpype_dir.resolve().as_posix().encode("utf-8")).hexdigest()
+        return self.data_dir / "version_manifests" / f"{dir_hash}.json"
 
-                if item.is_file() and not self._is_openpype_in_zip(
-                    item, detected_version
-                ):
-                    continue
+    def _get_version_manifest(self, openpype_dir: Path) -> dict:
+        """Get manifest of OpenPype versions in repository location.
 
-                detected_version.path = item
-                if staging and detected_version.is_staging():
-                    _openpype_versions.append(detected_version)
+        Manifest is loaded once per process and rescanned only if
+        modification time of location has changed. Only changed items
+        are checked for OpenPype version inside them again.
 
-                if not staging and not detected_version.is_staging():
-                    _openpype_versions.append(detected_version)
+        Args:
+            openpype_dir (Path): Directory to scan.
 
-        return sorted(_openpype_versions)
+        Returns:
+            dict: With modification time of location under `mtime` and
+                list of detected items under `entries`.
+
+        """
+        dir_key = openpype_dir.resolve().as_posix()
+        dir_mtime = openpype_dir.stat().st_mtime_ns
+        manifest = self._version_manifests.get(dir_key)
+        if manifest is None:
+            manifest_path = self._get_version_manifest_path(openpype_dir)
+            try:
+                with open(manifest_path, "r") as manifest_file:
+                    manifest = json.load(manifest_file)
+            except (IOError, ValueError):
+                manifest = None
+
+        if not manifest or manifest.get("mtime") != dir_mtime:
+            manifest = self._scan_openpype_versions(openpype_dir, manifest)
+            # changes in same moment as scan might not change
+            # modification time, don't trust it next time
+            if time.time_ns() - dir_mtime > 2 * 10 ** 9:
+                manifest["mtime"] = dir_mtime
+            self._write_version_manifest(openpype_dir, manifest)
+
+        self._version_manifests[dir_key] = manifest
+        return manifest
+
+    def _write_version_manifest(self, openpype_dir: Path,
+                                manifest: dict) -> None:
+        manifest_path = self._get_version_manifest_path(openpype_dir)
+        try:
+            manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(manifest_path, "w") as manifest_file:
+                json.dump(manifest, manifest_file, indent=4)
+        except IOError:
+            self._log.warning(
+                f"Cannot store version manifest of {openpype_dir}")
+
+    def _scan_openpype_versions(self, openpype_dir: Path,
+                                manifest: dict = None) -> dict:
+        """Scan directory for items that might contain OpenPype.
+
+        Items with same name and modification time as in previous
+        manifest are not opened again.
+
+        Args:
+            openpype_dir (Path): Directory to scan.
+            manifest (dict, optional): Previous manifest of directory.
+
+        Returns:
+            dict: New manifest without modification time of directory.
+
+        """
+        previous_entries = {}
+        if manifest:
+            previous_entries = {
+                entry["name"]: entry
+                for entry in manifest.get("entries") or []
+            }
+
+        entries = []
+        # iterate over directory in first level and find all that might
+        # contain OpenPype.
+        with os.scandir(openpype_dir) as dir_entries:
+            for dir_entry in dir_entries:
+                item = Path(dir_entry.path)
+                is_dir = dir_entry.is_dir()
+                # if file, strip extension, in case of dir not.
+                name = item.name if is_dir else item.stem
+                result = OpenPypeVersion.version_in_str(name)
+                if not result[0]:
+                    continue
+
+                mtime = dir_entry.stat().st_mtime_ns
+                previous_entry = previous_entries.get(item.name)
+                if previous_entry and previous_entry["mtime"] == mtime:
+                    entries.append(previous_entry)
+                    continue
+
+                detected_version: OpenPypeVersion
+                detected_version = result[1]
+                if is_dir:
+                    valid = self._is_openpype_in_dir(item, detected_version)
+                else:
+                    valid = self._is_openpype_in_zip(item, detected_version)
+
+                entries.append({
+                    "name": item.name,
+                    "version": str(detected_version),
+                    "staging": detected_version.is_staging(),
+                    "mtime": mtime,
+                    "valid": valid
+                })
+
+        return {"mtime": None, "entries": entries}
 
 
 class OpenPypeVersionExists(Exception):
@@ -11,6 +11,7 @@ from .settings import (
 from .lib import (
     PypeLogger,
     Anatomy,
+    get_anatomy,
     config,
     execute,
     run_subprocess,
@@ -78,6 +79,7 @@ __all__ = [
     "PypeLogger",
     "Logger",
     "Anatomy",
+    "get_anatomy",
     "config",
     "execute",
     "decompose_url",
@@ -263,6 +263,36 @@ def projectmanager():
     PypeCommands().launch_project_manager()
 
 
+@main.command("module-report")
+@click.option("--timing", is_flag=True,
+              help="Show import and initialization time per module")
+def module_report(timing):
+    """Report state of OpenPype modules."""
+    PypeCommands.report_modules(timing)
+
+
+@main.group()
+def db():
+    """Maintenance of OpenPype database."""
+    pass
+
+
+@db.command("ensure-indexes")
+@click.option("-p", "--project", "projects", multiple=True,
+              help="Project name, all projects if not passed")
+def ensure_indexes(projects):
+    """Create indexes of project collections required by frequent queries."""
+    PypeCommands.ensure_database_indexes(projects)
+
+
+@db.command("advise-indexes")
+@click.option("-p", "--project", "projects", multiple=True,
+              help="Project name, all projects if not passed")
+def advise_indexes(projects):
+    """Explain frequent queries and report which scan whole collection."""
+    PypeCommands.advise_database_indexes(projects)
+
+
 @main.command(
     context_settings=dict(
         ignore_unknown_options=True,
@@ -39,7 +39,9 @@ from .mongo import (
 )
 from .anatomy import (
     merge_dict,
-    Anatomy
+    Anatomy,
+    get_anatomy,
+    get_anatomy_cache
 )
 
 from .config import get_datetime_data
@@ -119,6 +121,7 @@ from .applications import (
     prepare_context_environments,
     get_app_environments_for_context,
     apply_project_environments_value,
+    get_launch_environments_cache,
 
     compile_list_of_regexes
 )
@@ -231,6 +234,7 @@ __all__ = [
     "prepare_context_environments",
     "get_app_environments_for_context",
     "apply_project_environments_value",
+    "get_launch_environments_cache",
 
     "compile_list_of_regexes",
 
@@ -256,6 +260,8 @@ __all__ = [
 
     "merge_dict",
     "Anatomy",
+    "get_anatomy",
+    "get_anatomy_cache",
 
     "get_datetime_data",
 
@@ -4,10 +4,13 @@ import copy
 import platform
 import collections
 import numbers
+import threading
 
 from openpype.settings.lib import (
     get_default_anatomy_settings,
-    get_anatomy_settings
+    get_anatomy_settings,
+    get_project_anatomy_version,
+    get_local_settings_version
 )
 from .log import PypeLogger
 
@@ -18,6 +21,11 @@ try:
 except NameError:
     StringType = str
 
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:
+    from collections import Mapping, Sequence
+
 
 def merge_dict(main_dict, enhance_dict):
     """Merges dictionaries by keys.
@@ -45,6 +53,87 @@ def merge_dict(main_dict, enhance_dict):
     return main_dict
 
 
+def freeze_value(value):
+    """Wrap value into read-only view if is mutable container.
+
+    Dictionaries are wrapped with `FrozenDict` and lists with `FrozenList`,
+    other values are returned as they are. Values are not copied.
+    """
+    if isinstance(value, dict):
+        return FrozenDict(value)
+    if isinstance(value, list):
+        return FrozenList(value)
+    return value
+
+
+class FrozenDict(Mapping):
+    """Read-only view of dictionary without copying it.
+
+    Nested dictionaries and lists are wrapped into read-only views on
+    access so wrapped data can't be modified through the view. Use `to_dict`
+    to get modifiable copy of data.
+
+    Args:
+        data (dict): Dictionary which is wrapped.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return freeze_value(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._data)
+
+    def to_dict(self):
+        """Modifiable copy of wrapped data."""
+        return copy.deepcopy(self._data)
+
+
+class FrozenList(Sequence):
+    """Read-only view of list without copying it.
+
+    Args:
+        data (list): List which is wrapped.
+    """
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrozenList(self._data[index])
+        return freeze_value(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        if isinstance(other, FrozenList):
+            other = other._data
+        return self._data == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, self._data)
+
+    def to_list(self):
+        """Modifiable copy of wrapped data."""
+        return copy.deepcopy(self._data)
+
+
 class ProjectNotSet(Exception):
     """Exception raised when is created Anatomy without project name."""
 
@@ -90,20 +179,40 @@ class Anatomy:
         self.project_name = project_name
 
         self._data = get_anatomy_settings(project_name, site_name)
+        self._data_view = None
 
         self._templates_obj = Templates(self)
         self._roots_obj = Roots(self)
 
+    @property
+    def data(self):
+        """Read-only view of anatomy data.
+
+        Anatomy data are not copied, so prefer this over dictionary like
+        getters of Anatomy which return deep copies. Nested dictionaries
+        and lists are read-only too.
+
+        Returns:
+            FrozenDict: Read-only view of anatomy data.
+        """
+        if self._data_view is None:
+            self._data_view = FrozenDict(self._data)
+        return self._data_view
+
     # Anatomy used as dictionary
     # - implemented only getters returning copy
+    # - use `data` property for read-only access without copying
     def __getitem__(self, key):
         return copy.deepcopy(self._data[key])
 
     def get(self, key, default=None):
-        return copy.deepcopy(self._data).get(key, default)
+        if key not in self._data:
+            return default
+        return copy.deepcopy(self._data[key])
 
     def keys(self):
-        return copy.deepcopy(self._data).keys()
+        # Keys are strings so shallow copy is enough
+        return copy.copy(self._data).keys()
 
     def values(self):
         return copy.deepcopy(self._data).values()
@@ -124,6 +233,7 @@ class Anatomy:
     def reset(self):
         """Reset values of cached data in templates and roots objects."""
         self._data = get_anatomy_settings(self.project_name)
+        self._data_view = None
         self.templates_obj.reset()
         self.roots_obj.reset()
 
@@ -145,6 +255,10 @@ class Anatomy:
         """Wrap `format_all` method of Anatomy's `templates_obj`."""
         return self._templates_obj.format_all(*args, **kwargs)
 
+    def format_single(self, *args, **kwargs):
+        """Wrap `format_single` method of Anatomy's `templates_obj`."""
+        return self._templates_obj.format_single(*args, **kwargs)
+
     @property
     def roots(self):
         """Wrap `roots` property of Anatomy's `roots_obj`."""
@@ -543,6 +657,7 @@ class Templates:
         self.anatomy = anatomy
         self.loaded_project = None
         self._templates = None
+        self._compiled_templates = {}
 
     def __getitem__(self, key):
         return self.templates[key]
@@ -552,6 +667,7 @@ class Templates:
 
     def reset(self):
         self._templates = None
+        self._compiled_templates = {}
 
     @property
     def project_name(self):
@@ -565,6 +681,7 @@ class Templates:
     def templates(self):
         if self.project_name != self.loaded_project:
             self._templates = None
+            self._compiled_templates = {}
 
         if self._templates is None:
             self._templates = self._discover()
@@ -781,19 +898,13 @@ class Templates:
         # Remove optional missing keys
         missing_keys = []
         invalid_types = []
-        for optional_group in self.optional_pattern.findall(template):
+        compiled = self.compile_template(template)
+        for optional_group, optional_keys in compiled.optional_groups:
             _missing_keys = []
             _invalid_types = []
-            for optional_key in self.key_pattern.findall(optional_group):
-                key = str(optional_key[1:-1])
-                key_padding = list(
-                    self.key_padding_pattern.findall(key)
-                )
-                if key_padding:
-                    key = key_padding[0]
-
+            for optional_key, key, key_subdict in optional_keys:
                 validation_result = self._validate_data_key(
-                    key, data
+                    key, data, key_subdict
                 )
                 missing_key = validation_result["missing_key"]
                 invalid_type = validation_result["invalid_type"]
@@ -824,15 +935,23 @@ class Templates:
             template = template.replace(optional_group, replacement)
         return (template, missing_keys, invalid_types)
 
-    def _validate_data_key(self, key, data):
-        """Check and prepare missing keys and invalid types of template."""
+    def _validate_data_key(self, key, data, key_subdict=None):
+        """Check and prepare missing keys and invalid types of template.
+
+        Args:
+            key (str): Key without padding specification.
+            data (dict): Containing keys to be filled into template.
+            key_subdict (tuple, optional): Precalculated parts of key
+                (e.g. `("project", "name")` for "project[name]").
+        """
         result = {
             "missing_key": None,
             "invalid_type": None
         }
 
         # check if key expects subdictionary keys (e.g. project[name])
-        key_subdict = list(self.sub_dict_pattern.findall(key))
+        if key_subdict is None:
+            key_subdict = self.sub_dict_pattern.findall(key)
         used_keys = []
         if len(key_subdict) <= 1:
             if key not in data:
@@ -989,30 +1108,26 @@ class Templates:
         invalid_required = []
         missing_required = []
         replace_keys = []
-        for group in self.key_pattern.findall(template):
-            orig_key = group[1:-1]
-            key = str(orig_key)
-            key_padding = list(self.key_padding_pattern.findall(key))
-            if key_padding:
-                key = key_padding[0]
-
-            validation_result = self._validate_data_key(key, data)
+        compiled = self.compile_template(orig_template)
+        for group, key, key_subdict in compiled.keys_for_template(template):
+            validation_result = self._validate_data_key(
+                key, data, key_subdict
+            )
             missing_key = validation_result["missing_key"]
             invalid_type = validation_result["invalid_type"]
 
             if invalid_type is not None:
                 invalid_required.append(invalid_type)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
                 continue
 
             if missing_key is not None:
                 missing_required.append(missing_key)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
                 continue
 
             try:
                 value = group.format(**data)
-                key_subdict = list(self.sub_dict_pattern.findall(key))
                 if len(key_subdict) <= 1:
                     used_values[key] = value
 
@@ -1023,11 +1138,11 @@ class Templates:
 
             except (TypeError, KeyError):
                 missing_required.append(key)
-                replace_keys.append(key)
+                replace_keys.append((key, key_subdict))
 
-        final_data = copy.deepcopy(data)
-        for key in replace_keys:
-            key_subdict = list(self.sub_dict_pattern.findall(key))
+        # Only top level keys are changed so shallow copy is enough
+        final_data = dict(data)
+        for key, key_subdict in replace_keys:
             if len(key_subdict) <= 1:
                 final_data[key] = "{" + key + "}"
                 continue
@@ -1118,8 +1233,69 @@ class Templates:
                 set to True so accessing unfilled keys in templates will
                 raise exceptions with explaned error.
         """
-        # Create a copy of inserted data
-        data = copy.deepcopy(in_data)
+        data = self._prepare_data(in_data, only_keys)
+        solved = self.solve_dict(self.templates, data)
+
+        return TemplatesDict(solved)
+
+    def format_single(
+        self, template_key, in_data, only_keys=True, strict=True
+    ):
+        """Solve only one template or one group of templates.
+
+        Much cheaper than `format` when only few templates are needed (e.g.
+        publish path of each integrated file) as other templates are not
+        solved at all.
+
+        Args:
+            template_key (Union[str, list]): Key of template. Nested keys can
+                be passed as list or joined with dot e.g. "publish.path".
+            in_data (dict): Containing keys to be filled into template.
+            only_keys (bool, optional): Decides if environ will be used to
+                fill templates or only keys in data.
+            strict (bool, optional): Raise exception when template is not
+                solved. Default is True.
+
+        Returns:
+            Union[TemplateResult, TemplatesDict]: Filled template or group of
+                templates if key leads to templates group.
+
+        Raises:
+            TemplateMissingKey: Template key is not available in anatomy.
+            TemplateUnsolved: Template is not solved and `strict` is True.
+        """
+        if isinstance(template_key, StringType):
+            keys = template_key.split(".")
+        else:
+            keys = list(template_key)
+
+        value = self.templates
+        for idx, key in enumerate(keys):
+            if not hasattr(value, "items") or key not in value:
+                raise TemplateMissingKey(keys[:idx + 1])
+            value = value[key]
+
+        data = self._prepare_data(in_data, only_keys)
+        if isinstance(value, StringType):
+            result = self._format(value, data)
+            if strict and not result.solved:
+                raise TemplateUnsolved(
+                    result.template, result.missing_keys, result.invalid_types
+                )
+            return result
+
+        if not hasattr(value, "items"):
+            return value
+
+        return TemplatesDict(self.solve_dict(value, data), strict=strict)
+
+    def _prepare_data(self, in_data, only_keys):
+        """Prepare copy of data with roots and environments for formatting.
+
+        Nested values are never modified during formatting so shallow copy
+        of entered data is enough.
+        """
+        data = dict(in_data)
 
         # Add environment variable to data
         if only_keys is False:
@@ -1130,9 +1306,175 @@ class Templates:
         roots = self.roots
         if roots:
             data["root"] = roots
-        solved = self.solve_dict(self.templates, data)
+        return data
 
-        return TemplatesDict(solved)
+    def compile_template(self, template):
+        """Get cached `CompiledTemplate` for passed template string.
+
+        Args:
+            template (str): Template string.
+
+        Returns:
+            CompiledTemplate: Preparsed template.
+        """
+        compiled = self._compiled_templates.get(template)
+        if compiled is None:
+            compiled = CompiledTemplate(template)
+            self._compiled_templates[template] = compiled
+        return compiled
+
+
+class CompiledTemplate:
+    """Template string with preparsed keys and optional groups.
+
+    Regex parsing of template is done only once instead of on each format
+    call. Keys of template without optional groups are cached for each
+    combination of solved optional groups.
+
+    Args:
+        template (str): Template which will be preparsed.
+    """
+
+    def __init__(self, template):
+        self.template = template
+        self.optional_groups = tuple(
+            (optional_group, self.parse_keys(optional_group))
+            for optional_group in Templates.optional_pattern.findall(template)
+        )
+        self._keys_by_template = {}
+
+    @staticmethod
+    def parse_keys(template):
+        """Parse formatting keys from template.
+
+        Returns:
+            tuple: Items with key group (e.g. "{frame:0>4}"), key without
+                padding (e.g. "frame") and parts of key (e.g.
+                `("project", "name")` for "{project[name]}").
+        """
+        output = []
+        for group in Templates.key_pattern.findall(template):
+            key = str(group[1:-1])
+            key_padding = Templates.key_padding_pattern.findall(key)
+            if key_padding:
+                key = key_padding[0]
+            key_subdict = tuple(Templates.sub_dict_pattern.findall(key))
+            output.append((group, key, key_subdict))
+        return tuple(output)
+
+    def keys_for_template(self, template):
+        """Keys of template with filtered optional groups.
+
+        Args:
+            template (str): Template where optional groups were already
+                removed or unwrapped.
+        """
+        keys = self._keys_by_template.get(template)
+        if keys is None:
+            keys = self.parse_keys(template)
+            self._keys_by_template[template] = keys
+        return keys
+
+
+class AnatomyCache:
+    """Process wide cache of resolved Anatomy objects.
+
+    Anatomy objects are cached by project and site name. Cached object is
+    validated on each access against versions of settings which define
+    anatomy (studio and project anatomy overrides and local settings).
+    Versions are taken from settings handlers caches so documents are queried
+    at most once per their cache lifetime. Settings are resolved again only if
+    any of them has changed.
+
+    Cached objects are shared so they should not be modified.
+    """
+
+    def __init__(self):
+        self._items = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _settings_version(project_name):
+        return (
+            get_project_anatomy_version(project_name),
+            get_local_settings_version()
+        )
+
+    def get(self, project_name, site_name=None):
+        """Get cached or newly created Anatomy object.
+
+        Args:
+            project_name (str): Name of project.
+            site_name (str, optional): Name of site for which are applied
+                local settings.
+
+        Returns:
+            Anatomy: Anatomy object for project and site.
+        """
+        key = (project_name, site_name)
+        version = self._settings_version(project_name)
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and item[0] == version:
+                self.hits += 1
+                return item[1]
+            self.misses += 1
+
+        anatomy = Anatomy(project_name, site_name)
+        with self._lock:
+            self._items[key] = (version, anatomy)
+        return anatomy
+
+    def clear(self):
+        """Remove all cached Anatomy objects and reset counters."""
+        with self._lock:
+            self._items = {}
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Cache hits, misses and count of cached objects."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self._items)
+        }
+
+
+_ANATOMY_CACHE = AnatomyCache()
+
+
+def get_anatomy(project_name=None, site_name=None):
+    """Get shared Anatomy object for project and site.
+
+    Anatomy is resolved only on first call or when settings which define it
+    have changed. Use `Anatomy` directly if object will be modified.
+
+    Args:
+        project_name (str, optional): Name of project. Value of
+            "AVALON_PROJECT" environment variable is used if not passed.
+        site_name (str, optional): Name of site for which are applied
+            local settings.
+
+    Returns:
+        Anatomy: Shared Anatomy object.
+    """
+    if not project_name:
+        project_name = os.environ.get("AVALON_PROJECT")
+
+    if not project_name:
+        raise ProjectNotSet((
+            "Implementation bug: Project name is not set. Anatomy requires"
+            " to load data for specific project."
+        ))
+    return _ANATOMY_CACHE.get(project_name, site_name)
+
+
+def get_anatomy_cache():
+    """Process wide `AnatomyCache` object used by `get_anatomy`."""
+    return _ANATOMY_CACHE
 
 
 class RootItem:
@@ -3,7 +3,10 @@ import sys
 import re
 import copy
 import json
+import hashlib
 import platform
+import time
+import threading
 import collections
 import inspect
 import subprocess
@@ -11,6 +14,7 @@ import distutils.spawn
 from abc import ABCMeta, abstractmethod
 
 import six
+import appdirs
 
 from openpype.settings import (
     get_system_settings,
@@ -306,7 +310,11 @@ class ApplicationManager:
         self.tools.clear()
 
         if self._system_settings is not None:
-            settings = copy.deepcopy(self._system_settings)
+            # Copy only parts which are used (and modified) by manager
+            settings = {
+                key: copy.deepcopy(self._system_settings[key])
+                for key in ("applications", "tools")
+            }
         else:
             settings = get_system_settings(
                 clear_metadata=False, exclude_locals=False
@@ -1083,6 +1091,254 @@ def _merge_env(env, current_env):
     return result
 
 
+def _compute_environments(env_definitions, env):
+    """Parse, merge and compute environment definitions on environments.
+
+    Args:
+        env_definitions (list): Environment values from settings in order
+            in which are merged.
+        env (dict): Environments on which definitions are applied.
+
+    Returns:
+        dict: New environments.
+    """
+    import acre
+
+    env_values = {}
+    for _env_values in env_definitions:
+        if not _env_values:
+            continue
+
+        # Choose right platform
+        tool_env = acre.parse(_env_values)
+        # Merge dictionaries
+        env_values = _merge_env(tool_env, env_values)
+
+    merged_env = _merge_env(env_values, env)
+    return acre.compute(merged_env, cleanup=False)
+
+
+class LaunchEnvironmentsCache:
+    """Cache of computed environments of applications, tools and projects.
+
+    Environments are cached by hash of environment definitions from settings
+    (which is version of settings for the combination), platform and values
+    of environments which can affect the result. Those are environments
+    referenced by definitions and environments with formatting keys in
+    value. Key has also names of application, tools or project.
+
+    Cached are only changes which computation made on passed environments.
+    Cache is held in memory and persisted to user data dir so new processes
+    (e.g. 'extractenvironments' on farm) don't have to compute them again.
+    Persisted files contain only hash of key and the changes. Files which
+    were not used for 'max_cache_age' seconds are removed and only
+    'max_cache_files' most recently used files are kept.
+
+    Args:
+        cache_dir (str): Directory where cache is persisted. User data dir
+            is used if not passed.
+    """
+    _reference_regex = re.compile(r"{([^{}\[\]:!]+)")
+    max_cache_files = 200
+    max_cache_age = 7 * 24 * 60 * 60
+
+    def __init__(self, cache_dir=None):
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                appdirs.user_data_dir("openpype", "pypeclub"),
+                "launch_environments"
+            )
+        self.cache_dir = cache_dir
+        self._items = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get_references(self, value, output):
+        if isinstance(value, dict):
+            # Keys may be dynamic too e.g. "{AVALON_APP}_PATH"
+            for key, item in value.items():
+                self._get_references(key, output)
+                self._get_references(item, output)
+
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._get_references(item, output)
+
+        elif isinstance(value, six.string_types):
+            output.update(self._reference_regex.findall(value))
+
+    def get_cache_key(self, env_definitions, env, names):
+        """Key of cached environments.
+
+        Returns:
+            tuple: Hash of key data and key data.
+        """
+        formatted_env = {
+            key: value
+            for key, value in env.items()
+            if isinstance(value, six.string_types) and "{" in value
+        }
+        references = set()
+        self._get_references(env_definitions, references)
+        self._get_references(formatted_env, references)
+
+        key_data = {
+            "names": list(names),
+            "platform": platform.system().lower(),
+            "definitions": env_definitions,
+            "env": {
+                key: env.get(key)
+                for key in references
+            },
+            "formatted_env": formatted_env
+        }
+        key_hash = hashlib.sha1(
+            json.dumps(key_data, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        return key_hash, key_data
+
+    def _get_cache_path(self, key_hash):
+        return os.path.join(self.cache_dir, "{}.json".format(key_hash))
+
+    def _read_cache_file(self, key_hash):
+        path = self._get_cache_path(key_hash)
+        try:
+            with open(path, "r") as stream:
+                changes = json.load(stream)["changes"]
+        except (IOError, ValueError, KeyError):
+            return None
+
+        # Modification time marks last usage for pruning
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return changes
+
+    def _write_cache_file(self, key_hash, changes):
+        path = self._get_cache_path(key_hash)
+        tmp_path = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            with open(tmp_path, "w") as stream:
+                json.dump(
+                    {"key": key_hash, "changes": changes},
+                    stream,
+                    indent=4,
+                    default=str
+                )
+            # Replace is atomic so other processes don't read partial file
+            os.replace(tmp_path, path)
+        except (IOError, OSError):
+            get_logger().warning(
+                "Failed to store launch environments cache to {}".format(
+                    path
+                ),
+                exc_info=True
+            )
+            return
+        self.prune()
+
+    def prune(self):
+        """Remove persisted cache files which were not used recently."""
+        now = time.time()
+        files = []
+        try:
+            filenames = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        for filename in filenames:
+            if not filename.endswith(".json"):
+                continue
+            path = os.path.join(self.cache_dir, filename)
+            try:
+                files.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+
+        files.sort(reverse=True)
+        for idx, (mtime, path) in enumerate(files):
+            if (
+                idx < self.max_cache_files
+                and now - mtime < self.max_cache_age
+            ):
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                # File could be removed by other process
+                pass
+
+    def compute(self, env_definitions, env, names=None):
+        """Compute environment definitions on environments or use cache.
+
+        Args:
+            env_definitions (list): Environment values from settings in order
+                in which are merged.
+            env (dict): Environments on which definitions are applied. Are
+                not modified.
+            names (list): Names of application, tools or project.
+
+        Returns:
+            dict: New environments.
+        """
+        key_hash, _ = self.get_cache_key(
+            env_definitions, env, names or []
+        )
+        with self._lock:
+            changes = self._items.get(key_hash)
+
+        if changes is None:
+            changes = self._read_cache_file(key_hash)
+            if changes is not None:
+                with self._lock:
+                    self._items[key_hash] = changes
+
+        if changes is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            computed_env = _compute_environments(env_definitions, env)
+            changes = {
+                key: value
+                for key, value in computed_env.items()
+                if env.get(key) != value
+            }
+            with self._lock:
+                self._items[key_hash] = changes
+            self._write_cache_file(key_hash, changes)
+
+        output = dict(env)
+        output.update(changes)
+        return output
+
+    def clear(self):
+        """Remove cached environments from memory and reset counters."""
+        with self._lock:
+            self._items = {}
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        """Cache hits, misses and count of cached environments."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self._items)
+        }
+
+
+_LAUNCH_ENVIRONMENTS_CACHE = LaunchEnvironmentsCache()
+
+
+def get_launch_environments_cache():
+    """Process wide `LaunchEnvironmentsCache` object."""
+    return _LAUNCH_ENVIRONMENTS_CACHE
+
+
 def prepare_host_environments(data, implementation_envs=True):
     """Modify launch environments based on launched app and context.
 
@@ -1090,8 +1346,6 @@ def prepare_host_environments(data, implementation_envs=True):
         data (EnvironmentPrepData): Dictionary where result and intermediate
             result will be stored.
     """
-    import acre
-
     app = data["app"]
     log = data["log"]
 
@@ -1131,18 +1385,9 @@ def prepare_host_environments(data, implementation_envs=True):
         )
     )
 
-    env_values = {}
-    for _env_values in environments:
-        if not _env_values:
-            continue
-
-        # Choose right platform
-        tool_env = acre.parse(_env_values)
-        # Merge dictionaries
-        env_values = _merge_env(tool_env, env_values)
-
-    merged_env = _merge_env(env_values, data["env"])
-    loaded_env = acre.compute(merged_env, cleanup=False)
+    loaded_env = get_launch_environments_cache().compute(
+        environments, data["env"], sorted(added_env_keys)
+    )
 
     final_env = None
     # Add host specific environments
@@ -1186,16 +1431,13 @@ def apply_project_environments_value(project_name, env, project_settings=None):
         KeyError: If project settings do not contain keys for project specific
             environments.
     """
-    import acre
-
     if project_settings is None:
         project_settings = get_project_settings(project_name)
 
     env_value = project_settings["global"]["project_environments"]
     if env_value:
-        env.update(acre.compute(
-            _merge_env(acre.parse(env_value), env),
-            cleanup=False
+        env.update(get_launch_environments_cache().compute(
+            [env_value], env, [project_name]
         ))
     return env
 
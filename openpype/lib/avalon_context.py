@@ -10,6 +10,7 @@ import functools
 
 from openpype.settings import get_project_settings
 from .anatomy import Anatomy
+from .database_indexes import ensure_project_indexes
 
 # avalon module is not imported at the top
 # - may not be in path at the time of pype.lib initialization
@@ -108,6 +109,15 @@ def create_project(
         database[project_name].delete_one({"type": "project"})
         raise
 
+    # Indexes of frequent queries
+    try:
+        ensure_project_indexes(database[project_name])
+    except Exception:
+        log.warning(
+            "Indexes of project \"{}\" were not created".format(project_name),
+            exc_info=True
+        )
+
     return project_doc
 
 
@@ -1432,7 +1442,7 @@ def _get_task_context_data_for_anatomy(
         anatomy = Anatomy(project_doc["name"])
 
     asset_name = asset_doc["name"]
-    project_task_types = anatomy["tasks"]
+    project_task_types = anatomy.data["tasks"]
 
     # get relevant task type from asset doc
     assert task_name in asset_doc["data"]["tasks"], (
@@ -0,0 +1,345 @@
+# -*- coding: utf-8 -*-
+"""Database writes of whole publish context collected into few requests.
+
+Integrator in batch mode does not write documents of each instance
+immediately. Documents are queued in `DatabaseWriteBatch` stored on publish
+context and written in ordered `bulk_write` calls (one per stage) after all
+instances were integrated. Documents which are needed for integration
+(subsets, versions and their representations) are prefetched for all
+instances with a single query per document type.
+
+When writing fails all already written changes are reverted so the database
+is not left with partially integrated context.
+"""
+import copy
+import logging
+
+from bson.objectid import ObjectId
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany, ReplaceOne
+
+log = logging.getLogger(__name__)
+
+
+class DatabaseWriteBatch(object):
+    """Collect database operations of publish context and write them at once.
+
+    Operations are split into stages which are written in order of `stages`.
+    Each stage is written with one ordered `bulk_write` call.
+
+    Attributes:
+        round_trips (int): Count of requests sent to database.
+        unbatched_round_trips (int): Count of requests which would be sent to
+            database without batching.
+
+    Args:
+        collection (pymongo.collection.Collection): Project collection.
+        logger (logging.Logger): Logger used for messages.
+    """
+    stages = ("subset", "version", "representation")
+    representation_types = ("representation", "archived_representation")
+
+    def __init__(self, collection, logger=None):
+        self._collection = collection
+        self.log = logger or log
+
+        self._operations = {stage: [] for stage in self.stages}
+        self._subsets = {}
+        self._versions = {}
+        self._repres_by_version_id = {}
+        # Documents as they were in database before any change
+        self._original_docs = {}
+        self._inserted_ids = set()
+        self._touched_ids = set()
+        self._commit_callbacks = []
+        self._rollback_callbacks = []
+
+        self.round_trips = 0
+        self.unbatched_round_trips = 0
+        self.committed = False
+        self.discarded = False
+
+    @property
+    def operations_count(self):
+        return sum(
+            len(operations)
+            for operations in self._operations.values()
+        )
+
+    @property
+    def round_trips_saved(self):
+        return self.unbatched_round_trips - self.round_trips
+
+    def _find(self, query):
+        self.round_trips += 1
+        docs = list(self._collection.find(query))
+        for doc in docs:
+            self._original_docs[doc["_id"]] = copy.deepcopy(doc)
+        return docs
+
+    def _find_one(self, query):
+        self.round_trips += 1
+        doc = self._collection.find_one(query)
+        if doc is not None:
+            self._original_docs[doc["_id"]] = copy.deepcopy(doc)
+        return doc
+
+    def prefetch(self, items):
+        """Query documents needed for integration of multiple instances.
+
+        Args:
+            items (list): Tuples with asset id, subset name and version
+                number of each integrated instance.
+        """
+        items = [
+            item
+            for item in items
+            if (item[0], item[1]) not in self._subsets
+        ]
+        if not items:
+            return
+
+        subset_keys = {(asset_id, name) for asset_id, name, _ in items}
+        subset_docs = self._find({
+            "type": "subset",
+            "$or": [
+                {"parent": asset_id, "name": name}
+                for asset_id, name in subset_keys
+            ]
+        })
+        for key in subset_keys:
+            self._subsets[key] = None
+        for subset_doc in subset_docs:
+            key = (subset_doc["parent"], subset_doc["name"])
+            self._subsets[key] = subset_doc
+
+        version_keys = set()
+        for asset_id, name, version_number in items:
+            subset_doc = self._subsets[(asset_id, name)]
+            if subset_doc is not None:
+                version_keys.add((subset_doc["_id"], version_number))
+
+        if not version_keys:
+            return
+
+        version_docs = self._find({
+            "type": "version",
+            "$or": [
+                {"parent": subset_id, "name": version_number}
+                for subset_id, version_number in version_keys
+            ]
+        })
+        for key in version_keys:
+            self._versions[key] = None
+        for version_doc in version_docs:
+            key = (version_doc["parent"], version_doc["name"])
+            self._versions[key] = version_doc
+
+        version_ids = [version_doc["_id"] for version_doc in version_docs]
+        for version_id in version_ids:
+            self._repres_by_version_id[version_id] = []
+
+        if not version_ids:
+            return
+
+        repre_docs = self._find({
+            "type": {"$in": list(self.representation_types)},
+            "parent": {"$in": version_ids}
+        })
+        for repre_doc in repre_docs:
+            self._repres_by_version_id[repre_doc["parent"]].append(repre_doc)
+
+    def find_subset(self, asset_id, name):
+        """Subset document by parent asset id and name.
+
+        Subsets queued for insertion are also returned.
+        """
+        self.unbatched_round_trips += 1
+        key = (asset_id, name)
+        if key not in self._subsets:
+            self._subsets[key] = self._find_one({
+                "type": "subset",
+                "parent": asset_id,
+                "name": name
+            })
+        return self._subsets[key]
+
+    def find_version(self, subset_id, version_number):
+        """Version document by parent subset id and version number.
+
+        Versions queued for insertion are also returned.
+        """
+        self.unbatched_round_trips += 1
+        key = (subset_id, version_number)
+        if key not in self._versions and subset_id in self._inserted_ids:
+            # Subset is not in database yet
+            self._versions[key] = None
+
+        elif key not in self._versions:
+            self._versions[key] = self._find_one({
+                "type": "version",
+                "parent": subset_id,
+                "name": version_number
+            })
+        return self._versions[key]
+
+    def find_representations(self, version_id, repre_type="representation"):
+        """Representation documents of version including queued changes."""
+        self.unbatched_round_trips += 1
+        if version_id not in self._repres_by_version_id:
+            if version_id in self._inserted_ids:
+                self._repres_by_version_id[version_id] = []
+            else:
+                self._repres_by_version_id[version_id] = self._find({
+                    "type": {"$in": list(self.representation_types)},
+                    "parent": version_id
+                })
+
+        return [
+            repre_doc
+            for repre_doc in self._repres_by_version_id[version_id]
+            if repre_doc["type"] == repre_type
+        ]
+
+    def _cache_doc(self, doc):
+        doc_type = doc["type"]
+        if doc_type == "subset":
+            self._subsets[(doc["parent"], doc["name"])] = doc
+
+        elif doc_type == "version":
+            self._versions[(doc["parent"], doc["name"])] = doc
+            self._repres_by_version_id.setdefault(doc["_id"], [])
+
+        elif doc_type in self.representation_types:
+            repre_docs = self._repres_by_version_id.setdefault(
+                doc["parent"], []
+            )
+            repre_docs.append(doc)
+
+    def _uncache_doc_id(self, doc_id):
+        for repre_docs in self._repres_by_version_id.values():
+            for repre_doc in tuple(repre_docs):
+                if repre_doc["_id"] == doc_id:
+                    repre_docs.remove(repre_doc)
+
+    def insert_many(self, stage, docs):
+        """Queue insertion of documents.
+
+        Documents without `_id` get new one so they can be referenced by
+        other documents before they are written.
+
+        Returns:
+            list: Ids of queued documents.
+        """
+        self.unbatched_round_trips += 1
+        doc_ids = []
+        for doc in docs:
+            if "_id" not in doc:
+                doc["_id"] = ObjectId()
+            self._inserted_ids.add(doc["_id"])
+            self._operations[stage].append(InsertOne(doc))
+            self._cache_doc(doc)
+            doc_ids.append(doc["_id"])
+        return doc_ids
+
+    def insert_one(self, stage, doc):
+        """Queue insertion of document.
+
+        Returns:
+            ObjectId: Id of queued document.
+        """
+        return self.insert_many(stage, [doc])[0]
+
+    def update_one(self, stage, doc_id, update):
+        """Queue update of document by it's id."""
+        self.unbatched_round_trips += 1
+        self._touched_ids.add(doc_id)
+        self._operations[stage].append(UpdateOne({"_id": doc_id}, update))
+
+    def delete_many(self, stage, doc_ids):
+        """Queue deletion of documents by their ids."""
+        self.unbatched_round_trips += 1
+        for doc_id in doc_ids:
+            self._touched_ids.add(doc_id)
+            self._operations[stage].append(DeleteOne({"_id": doc_id}))
+            self._uncache_doc_id(doc_id)
+
+    def on_commit(self, callback):
+        """Register callback called after successful commit."""
+        self._commit_callbacks.append(callback)
+
+    def on_rollback(self, callback):
+        """Register callback called on rollback or discard of batch."""
+        self._rollback_callbacks.append(callback)
+
+    def commit(self):
+        """Write all queued operations.
+
+        Raises:
+            Exception: Writing failed. All written changes were reverted.
+        """
+        if self.committed or self.discarded:
+            return
+
+        try:
+            for stage in self.stages:
+                operations = self._operations[stage]
+                if not operations:
+                    continue
+                self.log.debug("Writing {} {} operations".format(
+                    len(operations), stage
+                ))
+                self.round_trips += 1
+                self._collection.bulk_write(operations, ordered=True)
+
+        except Exception:
+            self.log.warning(
+                "Writing of batch failed. Reverting changes.", exc_info=True
+            )
+            self.rollback()
+            raise
+
+        self.committed = True
+        for callback in self._commit_callbacks:
+            callback()
+
+    def rollback(self):
+        """Revert documents changed by the batch to their original state.
+
+        Reverting is safe even if batch was written only partially. Inserted
+        documents are removed and touched documents are restored from state
+        before the batch.
+        """
+        reverts = []
+        if self._inserted_ids:
+            reverts.append(
+                DeleteMany({"_id": {"$in": list(self._inserted_ids)}})
+            )
+
+        for doc_id in self._touched_ids:
+            doc = self._original_docs.get(doc_id)
+            if doc is not None:
+                reverts.append(ReplaceOne({"_id": doc_id}, doc, upsert=True))
+
+        if reverts:
+            self.round_trips += 1
+            self._collection.bulk_write(reverts, ordered=True)
+        self.discard()
+
+    def discard(self):
+        """Drop queued operations without writing them."""
+        if self.discarded:
+            return
+        self.discarded = True
+        for stage in self.stages:
+            self._operations[stage] = []
+        for callback in self._rollback_callbacks:
+            callback()
+
+    def report(self):
+        """Short message about written operations and saved requests."""
+        return (
+            "Written {} operations in {} database requests"
+            " ({} requests saved by batching)."
+        ).format(
+            self.operations_count, self.round_trips, self.round_trips_saved
+        )
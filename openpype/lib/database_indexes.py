@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+"""Indexes of project collections required by frequent queries.
+
+Project collections don't have any index except '_id' when created by
+avalon. Queries of hosts, integrator, sync server and ftrack event server
+filter documents by 'type' with 'parent' and 'name', by sites of files or
+by content hash of files, which leads to collection scans on big projects.
+
+Indexes are created on project creation and can be created for existing
+projects with 'openpype_console db ensure-indexes'. Registered queries can
+be checked with 'explain()' by 'openpype_console db advise-indexes' to find
+queries still scanning whole collection.
+"""
+import os
+import logging
+import collections
+
+import pymongo
+from bson.objectid import ObjectId
+
+from .mongo import OpenPypeMongoConnection
+
+log = logging.getLogger(__name__)
+
+# Compound indexes for 'type' + 'parent' + 'name' serve also queries by
+# their prefixes ('type', 'type' + 'parent') and sort by 'name' of children.
+PROJECT_INDEXES = (
+    pymongo.IndexModel(
+        [
+            ("type", pymongo.ASCENDING),
+            ("parent", pymongo.ASCENDING),
+            ("name", pymongo.ASCENDING)
+        ],
+        name="type_parent_name"
+    ),
+    pymongo.IndexModel(
+        [
+            ("type", pymongo.ASCENDING),
+            ("name", pymongo.ASCENDING)
+        ],
+        name="type_name"
+    ),
+    # Multikey index for sync server queries of site states
+    pymongo.IndexModel(
+        [
+            ("type", pymongo.ASCENDING),
+            ("files.sites.name", pymongo.ASCENDING),
+            ("files.sites.created_dt", pymongo.ASCENDING)
+        ],
+        name="type_files_sites"
+    ),
+    # Multikey index for integrator lookup of published files by content
+    pymongo.IndexModel(
+        [
+            ("type", pymongo.ASCENDING),
+            ("files.content_hash", pymongo.ASCENDING)
+        ],
+        name="type_files_content_hash"
+    ),
+)
+
+QueryDef = collections.namedtuple("QueryDef", ("label", "filter", "sort"))
+
+
+def get_registered_queries():
+    """Frequent queries of project collections with example values.
+
+    Returns:
+        list: Of 'QueryDef' items.
+    """
+    object_id = ObjectId()
+    return [
+        QueryDef("project document", {"type": "project"}, None),
+        QueryDef("all assets (ftrack sync)", {"type": "asset"}, None),
+        QueryDef("asset by name", {"type": "asset", "name": "sh010"}, None),
+        QueryDef(
+            "subset by asset and name",
+            {"type": "subset", "parent": object_id, "name": "modelMain"},
+            None
+        ),
+        QueryDef(
+            "latest version of subset",
+            {"type": "version", "parent": object_id},
+            [("name", pymongo.DESCENDING)]
+        ),
+        QueryDef(
+            "representations of version",
+            {"type": "representation", "parent": object_id},
+            None
+        ),
+        QueryDef(
+            "representations of sync site",
+            {
+                "type": "representation",
+                "files.sites": {
+                    "$elemMatch": {
+                        "name": "studio",
+                        "created_dt": {"$exists": True}
+                    }
+                }
+            },
+            None
+        ),
+        QueryDef(
+            "published files by content hash",
+            {
+                "type": "representation",
+                "files.content_hash": {"$in": ["xxh3_128:0123456789abcdef"]}
+            },
+            None
+        ),
+    ]
+
+
+def get_avalon_database(mongo_url=None):
+    """Database with project collections."""
+    client = OpenPypeMongoConnection.get_mongo_client(mongo_url)
+    return client[os.environ.get("AVALON_DB") or "avalon"]
+
+
+def get_project_names(database):
+    """Names of collections containing project document."""
+    return [
+        collection_name
+        for collection_name in database.list_collection_names()
+        if database[collection_name].find_one(
+            {"type": "project"}, {"_id": True}
+        )
+    ]
+
+
+def ensure_project_indexes(collection):
+    """Create required indexes of project collection.
+
+    Existing indexes are kept, creation of already existing index is no-op.
+
+    Returns:
+        list: Names of required indexes.
+    """
+    return collection.create_indexes(list(PROJECT_INDEXES))
+
+
+def ensure_indexes(database=None, project_names=None):
+    """Create required indexes of all (or passed) projects.
+
+    Returns:
+        dict: Names of indexes by project name.
+    """
+    if database is None:
+        database = get_avalon_database()
+
+    if project_names is None:
+        project_names = get_project_names(database)
+
+    output = {}
+    for project_name in project_names:
+        log.info("Creating indexes of project \"{}\"".format(project_name))
+        output[project_name] = ensure_project_indexes(database[project_name])
+    return output
+
+
+def _plan_stages(plan):
+    """Stages of query plan with used index names (depth first)."""
+    stages = [(plan.get("stage"), plan.get("indexName"))]
+    children = list(plan.get("inputStages") or [])
+    if "inputStage" in plan:
+        children.append(plan["inputStage"])
+    # Plans of sharded clusters are nested in 'shards'
+    for shard in plan.get("shards") or []:
+        children.append(shard.get("winningPlan") or {})
+    for child in children:
+        stages.extend(_plan_stages(child))
+    return stages
+
+
+def explain_query(collection, query_def):
+    """Explain which plan is used for query.
+
+    Returns:
+        dict: With 'label', 'collscan' (bool) and used 'indexes'.
+    """
+    cursor = collection.find(query_def.filter)
+    if query_def.sort:
+        cursor = cursor.sort(query_def.sort)
+    explanation = cursor.limit(1).explain()
+    winning_plan = explanation["queryPlanner"]["winningPlan"]
+    # Newer servers nest plan of query engine
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+
+    stages = _plan_stages(winning_plan)
+    return {
+        "label": query_def.label,
+        "collscan": any(stage == "COLLSCAN" for stage, _ in stages),
+        "indexes": [index for _, index in stages if index]
+    }
+
+
+def advise_indexes(database=None, project_names=None, queries=None):
+    """Explain registered queries on projects.
+
+    Returns:
+        dict: List of explained queries (output of 'explain_query') by
+            project name.
+    """
+    if database is None:
+        database = get_avalon_database()
+
+    if project_names is None:
+        project_names = get_project_names(database)
+
+    if queries is None:
+        queries = get_registered_queries()
+
+    output = {}
+    for project_name in project_names:
+        collection = database[project_name]
+        output[project_name] = [
+            explain_query(collection, query_def)
+            for query_def in queries
+        ]
+    return output
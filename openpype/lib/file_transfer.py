@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""Parallel and verified transfers of files.
+
+Engine is used by integrator to copy published files. Transfers run in
+bounded thread pool, destination directories are created only once for all
+transfers and each copy is verified by size (and optionally checksum) with
+limited count of retries.
+
+On Linux are used faster copy methods when source and destination are on
+the same filesystem. Reflink (copy on write clone) is tried first and
+`copy_file_range` second which allows server side copy on NFS 4.2.
+
+Content hashes (`content_hash`) identify files by their bytes and are used
+to find already published files with the same content. Hash is prefixed
+with name of used algorithm, xxhash is used if available otherwise blake2b.
+"""
+import os
+import sys
+import errno
+import hashlib
+import logging
+import threading
+import collections
+
+import six
+
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
+# Linux ioctl request to clone file (reflink)
+FICLONE = 0x40049409
+
+CHUNK_SIZE = 8 * 1024 * 1024
+
+# Errors of fast copy methods meaning that method can't be used for files
+#   on the devices (other errors are related to the copied file)
+UNSUPPORTED_COPY_ERRNOS = frozenset(
+    getattr(errno, name)
+    for name in (
+        "EOPNOTSUPP", "ENOTSUP", "EXDEV", "EINVAL", "ENOSYS", "ENOTTY"
+    )
+    if hasattr(errno, name)
+)
+
+log = logging.getLogger(__name__)
+
+
+class FileTransferError(Exception):
+    """Transfer of file failed even after retries."""
+
+
+def file_checksum(path, chunk_size=CHUNK_SIZE):
+    """Checksum of file content calculated in chunks.
+
+    Blake2b is used if available (Python 3) otherwise sha1.
+
+    Args:
+        path (str): Path to file.
+        chunk_size (int): Size of chunk read at once.
+
+    Returns:
+        str: Hexadecimal digest of file content.
+    """
+    hash_obj = getattr(hashlib, "blake2b", hashlib.sha1)()
+    return _hash_file(path, hash_obj, chunk_size)
+
+
+def _hash_file(path, hash_obj, chunk_size):
+    with open(path, "rb") as stream:
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+
+def content_hash(path, chunk_size=CHUNK_SIZE):
+    """Hash of file content prefixed with name of hash algorithm.
+
+    Content is read in chunks so memory usage does not depend on file size.
+
+    Args:
+        path (str): Path to file.
+        chunk_size (int): Size of chunk read at once.
+
+    Returns:
+        str: Hash in format "<algorithm>:<hexdigest>".
+    """
+    if xxhash is not None:
+        algorithm = "xxh3_128"
+        hash_obj = xxhash.xxh3_128()
+    elif hasattr(hashlib, "blake2b"):
+        algorithm = "blake2b"
+        hash_obj = hashlib.blake2b()
+    else:
+        algorithm = "sha1"
+        hash_obj = hashlib.sha1()
+    return "{}:{}".format(algorithm, _hash_file(path, hash_obj, chunk_size))
+
+
+def content_hashes(paths, max_workers=4):
+    """Content hashes of multiple files calculated in thread pool.
+
+    Args:
+        paths (list): Paths to files.
+        max_workers (int): Maximum count of files hashed at once.
+
+    Returns:
+        dict: Content hash by file path.
+    """
+    paths = list(set(paths))
+    if ThreadPoolExecutor is None or max_workers <= 1 or len(paths) < 2:
+        return {path: content_hash(path) for path in paths}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(content_hash, paths)))
+
+
+# Fast copy methods use file descriptors directly, overhead of file objects
+#   is noticeable when many small files are copied
+def _reflink(src, dst):
+    import fcntl
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+def _copy_file_range(src, dst):
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            size = os.fstat(src_fd).st_size
+            copied = 0
+            while copied < size:
+                result = os.copy_file_range(src_fd, dst_fd, size - copied)
+                if result == 0:
+                    break
+                copied += result
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
+# Copy methods by name ordered by preference
+COPY_METHODS = collections.OrderedDict((
+    ("reflink", _reflink),
+    ("copy_file_range", _copy_file_range),
+    ("copy", copyfile)
+))
+
+
+def available_copy_methods(same_filesystem):
+    """Names of copy methods which can be used on current platform.
+
+    Args:
+        same_filesystem (bool): Source and destination are on the same
+            filesystem.
+    """
+    if not same_filesystem or not sys.platform.startswith("linux"):
+        return ["copy"]
+
+    methods = ["reflink"]
+    if hasattr(os, "copy_file_range"):
+        methods.append("copy_file_range")
+    methods.append("copy")
+    return methods
+
+
+class FileTransferEngine(object):
+    """Copy files in bounded thread pool with verification of copies.
+
+    Args:
+        max_workers (int): Maximum count of parallel transfers.
+        max_retries (int): How many times is copy retried when verification
+            fails.
+        verify_checksum (bool): Compare checksums of source and destination
+            not only their sizes.
+        progress_callback (callable): Called after each finished transfer
+            with source, destination, count of finished transfers and
+            count of all transfers.
+        logger (logging.Logger): Logger used for messages.
+    """
+    # Maximum count of transfers processed by one task of thread pool
+    max_chunk_size = 32
+
+    def __init__(
+        self, max_workers=4, max_retries=3, verify_checksum=False,
+        progress_callback=None, logger=None
+    ):
+        if ThreadPoolExecutor is None:
+            max_workers = 1
+        self.max_workers = max(1, int(max_workers or 1))
+        self.max_retries = max(0, int(max_retries or 0))
+        self.verify_checksum = verify_checksum
+        self.progress_callback = progress_callback
+        self.log = logger or log
+
+        self.method_counts = {}
+        self._lock = threading.Lock()
+        self._finished = 0
+        self._total = 0
+        self._devices_by_dirname = {}
+        self._methods_by_devices = {}
+
+    def _device(self, dirname):
+        device = self._devices_by_dirname.get(dirname)
+        if device is None:
+            device = os.stat(dirname).st_dev
+            self._devices_by_dirname[dirname] = device
+        return device
+
+    def _copy_methods(self, src, dst):
+        """Copy methods which may be used for source and destination.
+
+        Methods which failed are not tried again for the same pair of
+        devices.
+        """
+        devices = (
+            self._device(os.path.dirname(src)),
+            self._device(os.path.dirname(dst))
+        )
+        methods = self._methods_by_devices.get(devices)
+        if methods is None:
+            methods = available_copy_methods(devices[0] == devices[1])
+            self._methods_by_devices[devices] = methods
+        return devices, methods
+
+    def fast_copy(self, src, dst):
+        """Copy file content using fastest available method.
+
+        Returns:
+            str: Name of used method.
+        """
+        devices, methods = self._copy_methods(src, dst)
+        for method in tuple(methods):
+            if method == "copy":
+                break
+            try:
+                COPY_METHODS[method](src, dst)
+                return method
+
+            except (IOError, OSError) as exc:
+                # Regular copy handles errors of the file (e.g. missing
+                #   source or full disk), method is kept for other files
+                if exc.errno not in UNSUPPORTED_COPY_ERRNOS:
+                    break
+
+                # Do not try unsupported method again on the same devices
+                with self._lock:
+                    self._methods_by_devices[devices] = [
+                        _method
+                        for _method in self._methods_by_devices[devices]
+                        if _method != method
+                    ]
+
+        copyfile(src, dst)
+        return "copy"
+
+    def create_directories(self, destinations):
+        """Create destination directories, each only once."""
+        dirnames = {os.path.dirname(dst) for dst in destinations}
+        for dirname in sorted(dirnames):
+            try:
+                os.makedirs(dirname)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    self.log.critical("An unexpected error occurred.")
+                    six.reraise(*sys.exc_info())
+
+    def verify(self, src, dst):
+        """Verify that destination is the same as source.
+
+        Returns:
+            bool: Copy is valid.
+        """
+        if os.path.getsize(src) != os.path.getsize(dst):
+            return False
+        if self.verify_checksum:
+            return file_checksum(src) == file_checksum(dst)
+        return True
+
+    def copy_file(self, src, dst):
+        """Copy one file with verification and retries.
+
+        Returns:
+            int: Size of copied file.
+
+        Raises:
+            FileTransferError: File could not be copied correctly.
+        """
+        src = os.path.normpath(src)
+        dst = os.path.normpath(dst)
+        self.log.debug("Copying file ... {} -> {}".format(src, dst))
+        # Destination may be hardlink of source from previous publish
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            os.remove(dst)
+
+        for attempt in range(self.max_retries + 1):
+            method = self.fast_copy(src, dst)
+            if self.verify(src, dst):
+                with self._lock:
+                    self.method_counts[method] = (
+                        self.method_counts.get(method, 0) + 1
+                    )
+                return os.path.getsize(dst)
+
+            self.log.warning(
+                "Copy verification failed ({}/{}) {} -> {}".format(
+                    attempt + 1, self.max_retries + 1, src, dst
+                )
+            )
+
+        raise FileTransferError(
+            "Failed to copy \"{}\" to \"{}\" after {} attempts.".format(
+                src, dst, self.max_retries + 1
+            )
+        )
+
+    def _process(self, src, dst):
+        size = self.copy_file(src, dst)
+        with self._lock:
+            self._finished += 1
+            finished = self._finished
+        if self.progress_callback is not None:
+            self.progress_callback(src, dst, finished, self._total)
+        return size
+
+    def transfer(self, transfers):
+        """Copy all transfers.
+
+        Args:
+            transfers (list): Pairs of source and destination paths.
+
+        Returns:
+            dict: Size of each destination file by it's path.
+
+        Raises:
+            FileTransferError: Any file could not be copied.
+        """
+        transfers = list(transfers)
+        self._finished = 0
+        self._total = len(transfers)
+        if not transfers:
+            return {}
+
+        self.create_directories(dst for _, dst in transfers)
+
+        if self.max_workers == 1 or len(transfers) == 1:
+            return {
+                dst: self._process(src, dst)
+                for src, dst in transfers
+            }
+
+        # Transfers are submitted in chunks as overhead of pool task is
+        #   not negligible compared to copy of small file
+        chunk_size = max(
+            1, min(
+                self.max_chunk_size,
+                len(transfers) // (self.max_workers * 4)
+            )
+        )
+        output = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(
+                    self._process_chunk, transfers[idx:idx + chunk_size]
+                )
+                for idx in range(0, len(transfers), chunk_size)
+            ]
+            for future in futures:
+                output.update(future.result())
+        return output
+
+    def _process_chunk(self, transfers):
+        return [
+            (dst, self._process(src, dst))
+            for src, dst in transfers
+        ]
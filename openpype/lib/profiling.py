@@ -27,3 +27,34 @@ def do_profile(fn, to_file=None):
                 profiler.dump_stats(to_file)
             else:
                 profiler.print_stats()
+
+
+def measure_allocations(fn, *args, **kwargs):
+    """Measure memory allocated during function call.
+
+    Uses `tracemalloc` so it's available only in Python 3. Can be used to
+    compare allocations of different approaches, e.g. copying Anatomy
+    getters against read-only `Anatomy.data` view.
+
+    Args:
+        fn (callable): Function which will be measured.
+        *args: Arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        tuple: Result of function and peak of allocated memory in bytes
+            during the call.
+    """
+    import tracemalloc
+
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    tracemalloc.clear_traces()
+    try:
+        result = fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return result, peak
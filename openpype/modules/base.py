@@ -6,6 +6,7 @@ import json
 import time
 import inspect
 import logging
+import importlib
 import platform
 import threading
 import collections
@@ -43,12 +44,17 @@ class _ModuleClass(object):
         # Where modules and interfaces are stored
         super(_ModuleClass, self).__setattr__("__attributes__", dict())
         super(_ModuleClass, self).__setattr__("__defaults__", set())
+        # Manifests of modules and directories of not yet imported modules
+        super(_ModuleClass, self).__setattr__("__manifests__", dict())
+        super(_ModuleClass, self).__setattr__("__lazy__", dict())
 
         super(_ModuleClass, self).__setattr__("_log", None)
 
     def __getattr__(self, attr_name):
         if attr_name not in self.__attributes__:
-            if attr_name in ("__path__"):
+            if attr_name in self.__lazy__:
+                return self.import_lazy_module(attr_name)
+            if attr_name in ("__path__", "__spec__"):
                 return None
             raise ImportError("No module named {}.{}".format(
                 self.name, attr_name
@@ -83,17 +89,72 @@ class _ModuleClass(object):
         return self._log
 
     def get(self, key, default=None):
+        if key in self.__lazy__:
+            try:
+                return self.import_lazy_module(key)
+            except ImportError:
+                return default
         return self.__attributes__.get(key, default)
 
     def keys(self):
-        return self.__attributes__.keys()
+        return list(self.__attributes__.keys()) + list(self.__lazy__.keys())
 
     def values(self):
+        self.import_lazy_modules()
         return self.__attributes__.values()
 
     def items(self):
+        self.import_lazy_modules()
         return self.__attributes__.items()
 
+    def add_lazy_module(self, dirpath, module_name, manifest):
+        """Register module which is imported on first access."""
+        self.__manifests__[module_name] = manifest
+        if module_name not in self.__attributes__:
+            self.__lazy__[module_name] = dirpath
+
+    def get_manifests(self):
+        """Manifests of modules by python module name."""
+        return dict(self.__manifests__)
+
+    def import_lazy_module(self, module_name):
+        """Import registered lazy module.
+
+        Raises:
+            ImportError: When import of module failed.
+        """
+        from openpype.lib import import_module_from_dirpath
+
+        if module_name not in self.__lazy__:
+            return getattr(self, module_name)
+
+        dirpath = self.__lazy__.pop(module_name)
+        start = time.time()
+        try:
+            module = import_module_from_dirpath(
+                dirpath, module_name, self.name
+            )
+        except Exception:
+            self.log.error(
+                "Failed to import '{}'.".format(
+                    os.path.join(dirpath, module_name)
+                ),
+                exc_info=True
+            )
+            raise ImportError("Failed to import {}.{}".format(
+                self.name, module_name
+            ))
+        _LoadCache.import_times[module_name] = time.time() - start
+        return module
+
+    def import_lazy_modules(self):
+        """Import all registered lazy modules."""
+        for module_name in tuple(self.__lazy__.keys()):
+            try:
+                self.import_lazy_module(module_name)
+            except ImportError:
+                pass
+
 
 class _InterfacesClass(_ModuleClass):
     """Fake module class for storing OpenPype interfaces.
@@ -114,11 +175,79 @@ class _InterfacesClass(_ModuleClass):
         return self.__attributes__[attr_name]
 
 
+class _LazyModulesFinder(object):
+    """Import finder of lazy modules registered in `openpype_modules`.
+
+    Makes possible to import not yet imported module with import statement
+    e.g. `from openpype_modules.ftrack import FtrackModule`.
+    """
+    modules_key = "openpype_modules"
+
+    def _get_lazy_module_name(self, fullname):
+        parts = fullname.split(".")
+        if len(parts) != 2 or parts[0] != self.modules_key:
+            return None
+
+        openpype_modules = sys.modules.get(self.modules_key)
+        if (
+            not isinstance(openpype_modules, _ModuleClass)
+            or parts[1] not in openpype_modules.__lazy__
+        ):
+            return None
+        return parts[1]
+
+    def _import_lazy_module(self, fullname):
+        module_name = self._get_lazy_module_name(fullname)
+        openpype_modules = sys.modules[self.modules_key]
+        return openpype_modules.import_lazy_module(module_name)
+
+    # Python 3 finder
+    def find_spec(self, fullname, path=None, target=None):
+        if self._get_lazy_module_name(fullname) is None:
+            return None
+        import importlib.util
+
+        module = self._import_lazy_module(fullname)
+        spec = importlib.util.spec_from_loader(
+            fullname, _ImportedModuleLoader(module)
+        )
+        spec.submodule_search_locations = getattr(module, "__path__", None)
+        return spec
+
+    # Python 2 finder
+    def find_module(self, fullname, path=None):
+        if self._get_lazy_module_name(fullname) is None:
+            return None
+        return self
+
+    def load_module(self, fullname):
+        return self._import_lazy_module(fullname)
+
+
+class _ImportedModuleLoader(object):
+    """Loader returning module imported by `_LazyModulesFinder`."""
+    def __init__(self, module):
+        self._module = module
+        self._spec = getattr(module, "__spec__", None)
+
+    def create_module(self, spec):
+        return self._module
+
+    def exec_module(self, module):
+        # Module is already executed, keep its original spec
+        module.__spec__ = self._spec
+
+
 class _LoadCache:
     interfaces_lock = threading.Lock()
     modules_lock = threading.Lock()
     interfaces_loaded = False
     modules_loaded = False
+    # Import time of python modules in `openpype_modules` by name
+    import_times = {}
+
+
+MODULE_MANIFEST_FILENAME = "manifest.json"
 
 
 def get_default_modules_dir():
@@ -160,6 +289,60 @@ def get_dynamic_modules_dirs():
     return output
 
 
+def get_module_manifest(dirpath):
+    """Load manifest of module directory.
+
+    Manifest describes module without need to import it. It is json file
+    "manifest.json" in root of module directory, e.g.:
+    ```json
+    {
+        "name": "ftrack",
+        "class": "ftrack_module.FtrackModule",
+        "interfaces": ["ITrayModule", "IPluginPaths"],
+        "settings_key": "ftrack"
+    }
+    ```
+    - "name" - name of module (`name` attribute of module class)
+    - "class" - path to module class relative to the module directory
+    - "interfaces" - interfaces implemented by module class
+    - "settings_key" - key in system settings of modules with "enabled"
+        value, module without settings key is always imported
+    - "settings_def" - optional, module defines settings definition
+        (`ModuleSettingsDef`) so it must be imported for settings
+
+    Returns:
+        dict: Content of manifest or None if module does not have manifest.
+    """
+    manifest_path = os.path.join(dirpath, MODULE_MANIFEST_FILENAME)
+    if not os.path.exists(manifest_path):
+        return None
+
+    manifest = load_json_file(manifest_path)
+    if not manifest.get("name") or not manifest.get("class"):
+        PypeLogger.get_logger("ModulesLoader").warning((
+            "Manifest \"{}\" does not contain \"name\" or \"class\"."
+        ).format(manifest_path))
+        return None
+    return manifest
+
+
+def is_module_enabled_by_manifest(manifest, modules_settings):
+    """Is module enabled by settings based on it's manifest.
+
+    Module is considered enabled if manifest does not define settings key
+    or settings don't have "enabled" value. Final decision is up to module
+    itself on initialization.
+    """
+    settings_key = manifest.get("settings_key")
+    if not settings_key:
+        return True
+
+    module_settings = modules_settings.get(settings_key)
+    if not isinstance(module_settings, dict):
+        return True
+    return bool(module_settings.get("enabled", True))
+
+
 def get_module_dirs():
     """List of paths where OpenPype modules can be found."""
     _dirpaths = []
@@ -305,6 +488,12 @@ def _load_modules():
 
     # Change `sys.modules`
     sys.modules[modules_key] = openpype_modules = _ModuleClass(modules_key)
+    # Finder of modules with manifest which are imported on demand
+    if not any(
+        isinstance(finder, _LazyModulesFinder)
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.append(_LazyModulesFinder())
 
     log = PypeLogger.get_logger("ModulesLoader")
 
@@ -326,8 +515,25 @@ def _load_modules():
             fullpath = os.path.join(dirpath, filename)
             basename, ext = os.path.splitext(filename)
 
+            # Modules with manifest are imported when are used
+            if os.path.isdir(fullpath):
+                try:
+                    manifest = get_module_manifest(fullpath)
+                except Exception:
+                    log.error(
+                        "Failed to read manifest of '{}'.".format(fullpath),
+                        exc_info=True
+                    )
+                    manifest = None
+
+                if manifest:
+                    openpype_modules.add_lazy_module(
+                        dirpath, filename, manifest
+                    )
+                    continue
+
             # TODO add more logic how to define if folder is module or not
-            # - check manifest and content of manifest
+            start = time.time()
             try:
                 if os.path.isdir(fullpath):
                     import_module_from_dirpath(dirpath, filename, modules_key)
@@ -336,11 +542,16 @@ def _load_modules():
                     module = import_filepath(fullpath)
                     setattr(openpype_modules, basename, module)
 
+                else:
+                    continue
+
             except Exception:
                 log.error(
                     "Failed to import '{}'.".format(fullpath),
                     exc_info=True
                 )
+                continue
+            _LoadCache.import_times[basename] = time.time() - start
 
 
 class _OpenPypeInterfaceMeta(ABCMeta):
@@ -443,6 +654,29 @@ class OpenPypeAddOn(OpenPypeModule):
         pass
 
 
+class _ModulesByName(dict):
+    """Initialized modules by name.
+
+    Modules which were not imported because are disabled are imported and
+    initialized on first access.
+    """
+    def __init__(self, manager):
+        super(_ModulesByName, self).__init__()
+        self._manager = manager
+
+    def __missing__(self, key):
+        module = self._manager.initialize_disabled_module(key)
+        if module is None:
+            raise KeyError(key)
+        return module
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class ModulesManager:
     """Manager of Pype modules helps to load and prepare them to work.
 
@@ -460,7 +694,10 @@ class ModulesManager:
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        # Manifests of modules which are disabled and were not imported
+        self._disabled_manifests = {}
+        self._modules_settings = None
         # For report of time consumption
         self._report = {}
 
@@ -468,7 +705,12 @@ class ModulesManager:
         self.connect_modules()
 
     def initialize_modules(self):
-        """Import and initialize modules."""
+        """Import and initialize modules.
+
+        Modules with manifest are imported and initialized only if are
+        enabled in settings. Disabled modules are initialized on first
+        access by name through `modules_by_name`.
+        """
         # Make sure modules are loaded
         load_modules()
 
@@ -480,72 +722,189 @@ class ModulesManager:
         if system_settings is None:
             system_settings = get_system_settings()
         modules_settings = system_settings["modules"]
+        self._modules_settings = modules_settings
 
         report = {}
         time_start = time.time()
         prev_start_time = time_start
 
+        manifests = openpype_modules.get_manifests()
         module_classes = []
-        for module in openpype_modules:
-            # Go through globals in `pype.modules`
-            for name in dir(module):
-                modules_item = getattr(module, name, None)
-                # Filter globals that are not classes which inherit from
-                #   OpenPypeModule
-                if (
-                    not inspect.isclass(modules_item)
-                    or modules_item is OpenPypeModule
-                    or not issubclass(modules_item, OpenPypeModule)
-                ):
-                    continue
+        for module_name in openpype_modules.keys():
+            manifest = manifests.get(module_name)
+            if manifest is None:
+                module = getattr(openpype_modules, module_name)
+                module_classes.extend(self._get_module_classes(module))
+                continue
 
-                # Check if class is abstract (Developing purpose)
-                if inspect.isabstract(modules_item):
-                    # Find missing implementations by convetion on `abc` module
-                    not_implemented = []
-                    for attr_name in dir(modules_item):
-                        attr = getattr(modules_item, attr_name, None)
-                        abs_method = getattr(
-                            attr, "__isabstractmethod__", None
-                        )
-                        if attr and abs_method:
-                            not_implemented.append(attr_name)
-
-                    # Log missing implementations
-                    self.log.warning((
-                        "Skipping abstract Class: {}."
-                        " Missing implementations: {}"
-                    ).format(name, ", ".join(not_implemented)))
-                    continue
+            if not is_module_enabled_by_manifest(manifest, modules_settings):
+                self._disabled_manifests[manifest["name"]] = (
+                    module_name, manifest
+                )
+                self.log.debug("[ ] {} (not imported)".format(
+                    manifest["name"]
+                ))
+                continue
+
+            modules_item = self._get_manifest_class(module_name, manifest)
+            if modules_item is not None:
                 module_classes.append(modules_item)
 
         for modules_item in module_classes:
-            try:
-                name = modules_item.__name__
-                # Try initialize module
-                module = modules_item(self, modules_settings)
-                # Store initialized object
-                self.modules.append(module)
-                self.modules_by_id[module.id] = module
-                self.modules_by_name[module.name] = module
-                enabled_str = "X"
-                if not module.enabled:
-                    enabled_str = " "
-                self.log.debug("[{}] {}".format(enabled_str, name))
-
+            module = self._initialize_module(modules_item, modules_settings)
+            if module is not None:
                 now = time.time()
                 report[module.__class__.__name__] = now - prev_start_time
                 prev_start_time = now
 
-            except Exception:
-                self.log.warning(
-                    "Initialization of module {} failed.".format(name),
-                    exc_info=True
-                )
-
         if self._report is not None:
             report[self._report_total_key] = time.time() - time_start
             self._report["Initialization"] = report
+            self._report["Import"] = self._get_import_report()
+
+    def _get_module_classes(self, module):
+        """Find module classes in python module."""
+        module_classes = []
+        # Go through globals in `pype.modules`
+        for name in dir(module):
+            modules_item = getattr(module, name, None)
+            # Filter globals that are not classes which inherit from
+            #   OpenPypeModule
+            if (
+                not inspect.isclass(modules_item)
+                or modules_item is OpenPypeModule
+                or not issubclass(modules_item, OpenPypeModule)
+            ):
+                continue
+
+            # Check if class is abstract (Developing purpose)
+            if inspect.isabstract(modules_item):
+                # Find missing implementations by convetion on `abc` module
+                not_implemented = []
+                for attr_name in dir(modules_item):
+                    attr = getattr(modules_item, attr_name, None)
+                    abs_method = getattr(
+                        attr, "__isabstractmethod__", None
+                    )
+                    if attr and abs_method:
+                        not_implemented.append(attr_name)
+
+                # Log missing implementations
+                self.log.warning((
+                    "Skipping abstract Class: {}."
+                    " Missing implementations: {}"
+                ).format(name, ", ".join(not_implemented)))
+                continue
+            module_classes.append(modules_item)
+        return module_classes
+
+    def _get_manifest_class(self, module_name, manifest):
+        """Import module class defined in manifest.
+
+        Returns:
+            type: Module class or None if import failed.
+        """
+        import openpype_interfaces
+
+        class_path = manifest["class"]
+        python_module_name = "openpype_modules.{}".format(module_name)
+        if "." in class_path:
+            submodule_name, class_name = class_path.rsplit(".", 1)
+            python_module_name += "." + submodule_name
+        else:
+            class_name = class_path
+
+        try:
+            python_module = importlib.import_module(python_module_name)
+            modules_item = getattr(python_module, class_name)
+        except Exception:
+            self.log.warning(
+                "Import of module class {} failed.".format(class_path),
+                exc_info=True
+            )
+            return None
+
+        # Keep manifests in sync with implementation
+        for interface_name in manifest.get("interfaces") or []:
+            interface = getattr(openpype_interfaces, interface_name)
+            if not issubclass(modules_item, interface):
+                self.log.warning((
+                    "Module class {} does not implement interface {}"
+                    " defined in manifest."
+                ).format(class_path, interface_name))
+        return modules_item
+
+    def _initialize_module(self, modules_item, modules_settings):
+        """Initialize module class and store the object.
+
+        Returns:
+            OpenPypeModule: Initialized module or None if failed.
+        """
+        name = modules_item.__name__
+        try:
+            # Try initialize module
+            module = modules_item(self, modules_settings)
+
+        except Exception:
+            self.log.warning(
+                "Initialization of module {} failed.".format(name),
+                exc_info=True
+            )
+            return None
+
+        # Store initialized object
+        self.modules.append(module)
+        self.modules_by_id[module.id] = module
+        dict.__setitem__(self.modules_by_name, module.name, module)
+        enabled_str = "X"
+        if not module.enabled:
+            enabled_str = " "
+        self.log.debug("[{}] {}".format(enabled_str, name))
+        return module
+
+    def initialize_disabled_module(self, module_name):
+        """Import and initialize module which was skipped as disabled.
+
+        Args:
+            module_name (str): Name of module.
+
+        Returns:
+            OpenPypeModule: Initialized module or None if module with the
+                name is not available.
+        """
+        item = self._disabled_manifests.pop(module_name, None)
+        if item is None:
+            return None
+
+        python_module_name, manifest = item
+        modules_item = self._get_manifest_class(python_module_name, manifest)
+        if modules_item is None:
+            return None
+        return self._initialize_module(modules_item, self._modules_settings)
+
+    def get_disabled_manifests(self):
+        """Manifests of modules which were not imported because are disabled.
+
+        Returns:
+            dict: Manifests by module name.
+        """
+        return {
+            module_name: manifest
+            for module_name, (_, manifest) in self._disabled_manifests.items()
+        }
+
+    def _get_import_report(self):
+        """Import time of python modules of initialized modules."""
+        report = {}
+        for module in self.modules:
+            # e.g. 'openpype_modules.ftrack.ftrack_module'
+            parts = module.__class__.__module__.split(".")
+            import_time = None
+            if len(parts) > 1 and parts[0] == "openpype_modules":
+                import_time = _LoadCache.import_times.get(parts[1])
+            if import_time is not None:
+                report[module.__class__.__name__] = import_time
+        return report
 
     def connect_modules(self):
         """Trigger connection with other enabled modules.
@@ -840,7 +1199,9 @@ class TrayModulesManager(ModulesManager):
 
         self.modules = []
         self.modules_by_id = {}
-        self.modules_by_name = {}
+        self.modules_by_name = _ModulesByName(self)
+        self._disabled_manifests = {}
+        self._modules_settings = None
         self._report = {}
 
         self.tray_manager = None
@@ -999,7 +1360,8 @@ def get_module_settings_defs():
 
     Check if OpenPype addon/module as python module has class that inherit
     from `ModuleSettingsDef` in python module variables (imported
-    in `__init__py`).
+    in `__init__py`). Modules with manifest are checked only if manifest
+    has set "settings_def" to true.
 
     Returns:
         list: All valid and not abstract settings definitions from imported
@@ -1014,7 +1376,16 @@ def get_module_settings_defs():
 
     log = PypeLogger.get_logger("ModuleSettingsLoad")
 
-    for raw_module in openpype_modules:
+    manifests = openpype_modules.get_manifests()
+    for module_name in openpype_modules.keys():
+        manifest = manifests.get(module_name)
+        if manifest is not None and not manifest.get("settings_def"):
+            continue
+
+        raw_module = openpype_modules.get(module_name)
+        if raw_module is None:
+            continue
+
         for attr_name in dir(raw_module):
             attr = getattr(raw_module, attr_name)
             if (
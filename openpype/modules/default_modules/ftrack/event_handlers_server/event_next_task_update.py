@@ -53,6 +53,7 @@ class NextTaskUpdate(BaseEvent):
     ```
     """
     settings_key = "next_task_update"
+    concurrent_safe = True
 
     def launch(self, session, event):
         '''Propagates status from version to task when changed'''
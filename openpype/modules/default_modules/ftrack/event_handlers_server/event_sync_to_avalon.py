@@ -10,6 +10,7 @@ import traceback
 
 from bson.objectid import ObjectId
 from pymongo import UpdateOne
+from pymongo.errors import PyMongoError
 
 import arrow
 import ftrack_api
@@ -29,6 +30,164 @@ from openpype_modules.ftrack.lib import (
 from openpype.lib import CURRENT_DOC_SCHEMAS
 
 
+class ProjectDocsCache(object):
+    """Documents of project used by sync kept between events.
+
+    Project, asset and archived asset documents and parents of subsets are
+    loaded once. Before each event are applied changes of project collection
+    made since last check, read from change stream which continues from
+    resume token of previous check. Only documents which changed are queried.
+
+    Change streams require replica set, documents are reloaded on each
+    revalidation if they're not available.
+
+    Args:
+        collection (pymongo.collection.Collection): Project collection.
+    """
+    doc_types = ("project", "asset", "archived_asset")
+    # Server waits for new changes of empty stream this long
+    max_await_time_ms = 10
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.project_doc = None
+        self.asset_docs_by_id = {}
+        self.subset_parents_by_id = {}
+        self._resume_token = None
+        self._loaded = False
+
+    def _watch(self, **kwargs):
+        # Inserts contain the document, other changes only document id
+        pipeline = [{"$match": {"$or": [
+            {"operationType": {"$ne": "insert"}},
+            {"fullDocument.type": {"$in": self.doc_types + ("subset", )}}
+        ]}}]
+        return self.collection.watch(
+            pipeline, max_await_time_ms=self.max_await_time_ms, **kwargs
+        )
+
+    def _add_doc(self, doc):
+        doc_id = doc["_id"]
+        self.asset_docs_by_id.pop(doc_id, None)
+        self.subset_parents_by_id.pop(doc_id, None)
+        doc_type = doc.get("type")
+        if doc_type == "project":
+            self.project_doc = doc
+        elif doc_type == "subset":
+            self.subset_parents_by_id[doc_id] = doc["parent"]
+        elif doc_type in self.doc_types:
+            self.asset_docs_by_id[doc_id] = doc
+
+    def _remove_doc(self, doc_id):
+        self.asset_docs_by_id.pop(doc_id, None)
+        self.subset_parents_by_id.pop(doc_id, None)
+
+    def load(self):
+        """Load all documents."""
+        # Open change stream before query so no change is missed
+        try:
+            with self._watch() as stream:
+                resume_token = stream.resume_token
+        except PyMongoError:
+            resume_token = None
+
+        self.project_doc = None
+        self.asset_docs_by_id = {}
+        self.subset_parents_by_id = {}
+        for doc in self.collection.find({"type": {"$in": self.doc_types}}):
+            self._add_doc(doc)
+
+        for doc in self.collection.find(
+            {"type": "subset"}, {"_id": True, "parent": True, "type": True}
+        ):
+            self._add_doc(doc)
+
+        self._resume_token = resume_token
+        self._loaded = True
+
+    def revalidate(self):
+        """Apply changes made since last load or revalidation.
+
+        Returns:
+            bool: Cached documents were reused.
+        """
+        if not self._loaded or self._resume_token is None:
+            self.load()
+            return False
+
+        changed_ids = set()
+        try:
+            with self._watch(resume_after=self._resume_token) as stream:
+                while True:
+                    change = stream.try_next()
+                    if change is None:
+                        break
+
+                    operation = change["operationType"]
+                    if operation == "insert":
+                        self._add_doc(change["fullDocument"])
+                    elif operation in ("update", "replace"):
+                        changed_ids.add(change["documentKey"]["_id"])
+                    elif operation == "delete":
+                        doc_id = change["documentKey"]["_id"]
+                        changed_ids.discard(doc_id)
+                        self._remove_doc(doc_id)
+                    else:
+                        # Collection was dropped or renamed
+                        self.load()
+                        return False
+                resume_token = stream.resume_token
+
+        except PyMongoError:
+            # Resume token is not in oplog anymore
+            self.load()
+            return False
+
+        # Update documents of tracked types
+        project_id = None
+        if self.project_doc is not None:
+            project_id = self.project_doc["_id"]
+        changed_ids = [
+            doc_id
+            for doc_id in changed_ids
+            if (
+                doc_id == project_id
+                or doc_id in self.asset_docs_by_id
+                or doc_id in self.subset_parents_by_id
+            )
+        ]
+        if changed_ids:
+            for doc_id in changed_ids:
+                self._remove_doc(doc_id)
+            for doc in self.collection.find({"_id": {"$in": changed_ids}}):
+                self._add_doc(doc)
+
+        self._resume_token = resume_token
+        return True
+
+    @staticmethod
+    def _copy_doc(doc):
+        # Sync changes only top level keys and keys of 'data' in place
+        if doc is None:
+            return None
+        return dict(doc, data=dict(doc.get("data") or {}))
+
+    def get_project_doc(self):
+        """Copy of project document which can be modified."""
+        return self._copy_doc(self.project_doc)
+
+    def get_docs_by_type(self, doc_type):
+        """Copies of documents which can be modified.
+
+        Cached documents are changed only by changes of database.
+        """
+        return [
+            self._copy_doc(doc)
+            for doc in self.asset_docs_by_id.values()
+            if doc["type"] == doc_type
+        ]
+
+
 class SyncToAvalonEvent(BaseEvent):
     interest_entTypes = ["show", "task"]
     ignore_ent_types = ["Milestone"]
@@ -81,6 +240,13 @@ class SyncToAvalonEvent(BaseEvent):
         self.debug_sync_types = collections.defaultdict(list)
 
         self.dbcon = AvalonMongoDB()
+        # Documents of projects kept between events by project name
+        self._project_docs_caches = {}
+        # Custom attributes are reused between events for this time (sec)
+        self.cust_attrs_cache_lifetime = 5 * 60
+        self._cust_attrs_cache_time = None
+        self._avalon_cust_attrs = None
+        self._cust_attr_types_by_id = None
         # Set processing session to not use global
         self.set_process_session(session)
         super().__init__(session)
@@ -143,16 +309,34 @@ class SyncToAvalonEvent(BaseEvent):
             }
         return self._cust_attr_types_by_id
 
+    @property
+    def project_docs_cache(self):
+        """Cache of project documents revalidated once per event."""
+        if self._project_docs_cache is None:
+            project_name = self.cur_project["full_name"]
+            self.dbcon.install()
+            self.dbcon.Session["AVALON_PROJECT"] = project_name
+            cache = self._project_docs_caches.get(project_name)
+            if cache is None:
+                cache = ProjectDocsCache(self.dbcon.database[project_name])
+                self._project_docs_caches[project_name] = cache
+
+            if cache.revalidate():
+                self.log.debug(
+                    "Reused cached documents of project <{}>".format(
+                        project_name
+                    )
+                )
+            self._project_docs_cache = cache
+        return self._project_docs_cache
+
     @property
     def avalon_entities(self):
         if self._avalon_ents is None:
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
+            cache = self.project_docs_cache
+            self._avalon_ents = (
+                cache.get_project_doc(), cache.get_docs_by_type("asset")
             )
-            avalon_project = self.dbcon.find_one({"type": "project"})
-            avalon_entities = list(self.dbcon.find({"type": "asset"}))
-            self._avalon_ents = (avalon_project, avalon_entities)
         return self._avalon_ents
 
     @property
@@ -206,13 +390,12 @@ class SyncToAvalonEvent(BaseEvent):
     def avalon_subsets_by_parents(self):
         if self._avalon_subsets_by_parents is None:
             self._avalon_subsets_by_parents = collections.defaultdict(list)
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
+            subset_parents_by_id = (
+                self.project_docs_cache.subset_parents_by_id
             )
-            for subset in self.dbcon.find({"type": "subset"}):
-                self._avalon_subsets_by_parents[subset["parent"]].append(
-                    subset
+            for subset_id, parent_id in subset_parents_by_id.items():
+                self._avalon_subsets_by_parents[parent_id].append(
+                    {"_id": subset_id, "parent": parent_id}
                 )
         return self._avalon_subsets_by_parents
 
@@ -220,11 +403,10 @@ class SyncToAvalonEvent(BaseEvent):
     def avalon_archived_by_id(self):
         if self._avalon_archived_by_id is None:
             self._avalon_archived_by_id = {}
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
+            archived_docs = self.project_docs_cache.get_docs_by_type(
+                "archived_asset"
             )
-            for asset in self.dbcon.find({"type": "archived_asset"}):
+            for asset in archived_docs:
                 self._avalon_archived_by_id[asset["_id"]] = asset
         return self._avalon_archived_by_id
 
@@ -394,9 +576,16 @@ class SyncToAvalonEvent(BaseEvent):
         """Reset variables so each event callback has clear env."""
         self._cur_project = None
 
-        self._avalon_cust_attrs = None
-        self._cust_attr_types_by_id = None
+        if (
+            self._cust_attrs_cache_time is None
+            or (
+                time.time() - self._cust_attrs_cache_time
+                > self.cust_attrs_cache_lifetime
+            )
+        ):
+            self.reset_cust_attrs_cache()
 
+        self._project_docs_cache = None
         self._avalon_ents = None
         self._avalon_ents_by_id = None
         self._avalon_ents_by_parent_id = None
@@ -410,6 +599,9 @@ class SyncToAvalonEvent(BaseEvent):
         self._ent_types_by_name = None
 
         self.ftrack_ents_by_id = {}
+        self._ftrack_ents_query = None
+        self._hier_values_by_ftrack_id = {}
+        self._call_count_start = self.process_session.call_count
         self.obj_id_ent_type_map = {}
         self.ftrack_recreated_mapping = {}
 
@@ -439,12 +631,19 @@ class SyncToAvalonEvent(BaseEvent):
             "error": collections.defaultdict(list)
         }
 
+    def reset_cust_attrs_cache(self):
+        self._cust_attrs_cache_time = time.time()
+        self._avalon_cust_attrs = None
+        self._cust_attr_types_by_id = None
+
     def set_process_session(self, session):
+        # Cached entities belong to previous session
+        self.reset_cust_attrs_cache()
         try:
             self.process_session.close()
         except Exception:
             pass
-        self.process_session = ftrack_api.Session(
+        self.process_session = avalon_sync.CallCountingSession(
             server_url=session.server_url,
             api_key=session.api_key,
             api_user=session.api_user,
@@ -507,19 +706,27 @@ class SyncToAvalonEvent(BaseEvent):
         Returns:
             (string) - example : "/test_project/assets/my_asset"
         """
-        entity = self.ftrack_ents_by_id.get(ftrack_id)
+        entity = self.ftrack_ents_query.get(ftrack_id)
         if not entity:
-            entity = self.process_session.query(
-                self.entities_query_by_id.format(
-                    self.cur_project["id"], ftrack_id
-                )
-            ).first()
-            if entity:
-                self.ftrack_ents_by_id[ftrack_id] = entity
-            else:
-                return "unknown hierarchy"
+            return "unknown hierarchy"
         return "/".join([ent["name"] for ent in entity["link"]])
 
+    @property
+    def ftrack_ents_query(self):
+        """Batched and memoized queries of entities by id.
+
+        Queried entities are stored to 'ftrack_ents_by_id'.
+        """
+        if self._ftrack_ents_query is None:
+            self._ftrack_ents_query = avalon_sync.EntitiesQueryBatcher(
+                self.process_session,
+                self.entities_query_by_id.format(
+                    self.cur_project["id"], "{}"
+                ),
+                self.ftrack_ents_by_id
+            )
+        return self._ftrack_ents_query
+
     def launch(self, session, event):
         """
             Main entry port for synchronization.
@@ -689,13 +896,8 @@ class SyncToAvalonEvent(BaseEvent):
                 ftrack_ids |= set(_ftrack_ids)
 
         # collect entity records data which might not be in event
-        if ftrack_ids:
-            joined_ids = ", ".join(["\"{}\"".format(id) for id in ftrack_ids])
-            ftrack_entities = self.process_session.query(
-                self.entities_query_by_id.format(ft_project["id"], joined_ids)
-            ).all()
-            for entity in ftrack_entities:
-                self.ftrack_ents_by_id[entity["id"]] = entity
+        self.ftrack_ents_query.request(ftrack_ids)
+        self.ftrack_ents_query.fetch()
 
         # Filter updates where name is changing
         for ftrack_id, ent_info in updated.items():
@@ -758,10 +960,11 @@ class SyncToAvalonEvent(BaseEvent):
             time_total = time_8 - time_1
             self.log.debug((
                 "Process time: {:.2f} <{:.2f}, {:.2f}, {:.2f}, "
-                "{:.2f}, {:.2f}, {:.2f}, {:.2f}>"
+                "{:.2f}, {:.2f}, {:.2f}, {:.2f}> Ftrack API calls: {}"
             ).format(
                 time_total, time_removed, time_renamed, time_added,
-                time_moved, time_updated, time_cleanup, time_task_updates
+                time_moved, time_updated, time_cleanup, time_task_updates,
+                self.process_session.call_count - self._call_count_start
             ))
 
         except Exception:
@@ -830,6 +1033,8 @@ class SyncToAvalonEvent(BaseEvent):
                 " it or its children contain published data"
             )
             proj, ents = self.avalon_entities
+            self._request_recreated_parents(recreate_ents)
+
             for avalon_entity in recreate_ents:
                 old_ftrack_id = avalon_entity["data"]["ftrackId"]
                 vis_par = avalon_entity["data"]["visualParent"]
@@ -844,11 +1049,9 @@ class SyncToAvalonEvent(BaseEvent):
                     if parent_ent["type"].lower() == "project":
                         parent_ftrack_ent = self.cur_project
                     else:
-                        parent_ftrack_ent = self.process_session.query(
-                            self.entities_query_by_id.format(
-                                self.cur_project["id"], parent_ftrack_id
-                            )
-                        ).one()
+                        parent_ftrack_ent = self.ftrack_ents_query.get(
+                            parent_ftrack_id
+                        )
                 entity_type = avalon_entity["data"]["entityType"]
                 new_entity = self.process_session.create(entity_type, {
                     "name": avalon_entity["name"],
@@ -977,6 +1180,16 @@ class SyncToAvalonEvent(BaseEvent):
 
         self.check_names_synchronizable(removed_names)
 
+    def _request_recreated_parents(self, recreate_ents):
+        """Query ftrack parents of all entities to recreate at once."""
+        parent_ftrack_ids = set()
+        for avalon_entity in recreate_ents:
+            vis_par = avalon_entity["data"]["visualParent"]
+            parent_ent = self.avalon_ents_by_id.get(vis_par)
+            if parent_ent and parent_ent["type"] != "project":
+                parent_ftrack_ids.add(parent_ent["data"]["ftrackId"])
+        self.ftrack_ents_query.request(parent_ftrack_ids)
+
     def check_names_synchronizable(self, names):
         """Check if entities with specific names are importable.
 
@@ -1255,12 +1468,14 @@ class SyncToAvalonEvent(BaseEvent):
             if key in entity["custom_attributes"]:
                 output[key] = entity["custom_attributes"][key]
 
-        hier_values = avalon_sync.get_hierarchical_attributes_values(
-            self.process_session,
-            entity,
-            hier_attrs,
-            self.cust_attr_types_by_id.values()
-        )
+        hier_values = self._hier_values_by_ftrack_id.get(entity["id"])
+        if hier_values is None:
+            hier_values = avalon_sync.get_hierarchical_attributes_values(
+                self.process_session,
+                entity,
+                hier_attrs,
+                self.cust_attr_types_by_id.values()
+            )
         for key, val in hier_values.items():
             output[key] = val
 
@@ -1448,14 +1663,7 @@ class SyncToAvalonEvent(BaseEvent):
                 .get("ftrackId")
             )
             if avalon_ent_by_name and avalon_ent_by_name_ftrack_id is None:
-                ftrack_ent = self.ftrack_ents_by_id.get(ftrack_id)
-                if not ftrack_ent:
-                    ftrack_ent = self.process_session.query(
-                        self.entities_query_by_id.format(
-                            self.cur_project["id"], ftrack_id
-                        )
-                    ).one()
-                    self.ftrack_ents_by_id[ftrack_id] = ftrack_ent
+                ftrack_ent = self.ftrack_ents_query.get(ftrack_id)
 
                 ent_path_items = [ent["name"] for ent in ftrack_ent["link"]]
                 parents = ent_path_items[1:len(ent_path_items)-1:]
@@ -1573,6 +1781,17 @@ class SyncToAvalonEvent(BaseEvent):
             ft_id = ent_info["entityId"]
             to_sync_by_id[ft_id] = self.ftrack_ents_by_id[ft_id]
 
+        # Query hierarchical attribute values of all entities at once
+        if to_sync_by_id:
+            self._hier_values_by_ftrack_id.update(
+                avalon_sync.get_hierarchical_attributes_values_by_entity_id(
+                    self.process_session,
+                    to_sync_by_id.values(),
+                    hier_attrs,
+                    self.cust_attr_types_by_id.values()
+                )
+            )
+
         # cache regex success (for tasks)
         for ftrack_id, entity in to_sync_by_id.items():
             if entity.entity_type.lower() == "project":
@@ -1696,14 +1915,7 @@ class SyncToAvalonEvent(BaseEvent):
                         self.ftrack_recreated_mapping[parent_id]
                     )
 
-                ftrack_ent = self.ftrack_ents_by_id.get(ftrack_id)
-                if not ftrack_ent:
-                    ftrack_ent = self.process_session.query(
-                        self.entities_query_by_id.format(
-                            self.cur_project["id"], ftrack_id
-                        )
-                    ).one()
-                    self.ftrack_ents_by_id[ftrack_id] = ftrack_ent
+                ftrack_ent = self.ftrack_ents_query.get(ftrack_id)
 
                 if parent_id == ftrack_ent["parent_id"]:
                     continue
@@ -1879,6 +2091,18 @@ class SyncToAvalonEvent(BaseEvent):
             return value.split(", ")
         return value
 
+    def _ftrack_link_lengths(self, mongo_ids_by_ftrack_id):
+        """Query ftrack entities at once and return link lengths by mongo id.
+        """
+        self.ftrack_ents_query.request(mongo_ids_by_ftrack_id.keys())
+        self.ftrack_ents_query.fetch()
+        output = {}
+        for ftrack_id, mongo_id in mongo_ids_by_ftrack_id.items():
+            entity = self.ftrack_ents_by_id.get(ftrack_id)
+            if entity is not None:
+                output[mongo_id] = len(entity["link"])
+        return output
+
     def process_hier_cleanup(self):
         if (
             not self.moved_in_avalon and
@@ -1925,19 +2149,9 @@ class SyncToAvalonEvent(BaseEvent):
             mongo_to_ftrack_parents[mongo_id] = len(ftrack_ent["link"])
 
         if missing_ftrack_ents:
-            joine_ids = ", ".join(
-                ["\"{}\"".format(id) for id in missing_ftrack_ents.keys()]
+            mongo_to_ftrack_parents.update(
+                self._ftrack_link_lengths(missing_ftrack_ents)
             )
-            entities = self.process_session.query(
-                self.entities_query_by_id.format(
-                    self.cur_project["id"], joine_ids
-                )
-            ).all()
-            for entity in entities:
-                ftrack_id = entity["id"]
-                self.ftrack_ents_by_id[ftrack_id] = entity
-                mongo_id = missing_ftrack_ents[ftrack_id]
-                mongo_to_ftrack_parents[mongo_id] = len(entity["link"])
 
         stored_parents_by_mongo = {}
         # sort by hierarchy level
@@ -2321,15 +2535,11 @@ class SyncToAvalonEvent(BaseEvent):
 
         ft_project = self.cur_project
         duplicated_names = []
+        self.ftrack_ents_query.request(self.duplicated)
         for ftrack_id in self.duplicated:
-            ftrack_ent = self.ftrack_ents_by_id.get(ftrack_id)
+            ftrack_ent = self.ftrack_ents_query.get(ftrack_id)
             if not ftrack_ent:
-                ftrack_ent = self.process_session.query(
-                    self.entities_query_by_id.format(
-                        ft_project["id"], ftrack_id
-                    )
-                ).one()
-                self.ftrack_ents_by_id[ftrack_id] = ftrack_ent
+                continue
             name = ftrack_ent["name"]
             if name not in duplicated_names:
                 duplicated_names.append(name)
@@ -2411,16 +2621,11 @@ class SyncToAvalonEvent(BaseEvent):
             )
         })
 
-        ft_project = self.cur_project
+        self.ftrack_ents_query.request(self.regex_failed)
         for ftrack_id in self.regex_failed:
-            ftrack_ent = self.ftrack_ents_by_id.get(ftrack_id)
+            ftrack_ent = self.ftrack_ents_query.get(ftrack_id)
             if not ftrack_ent:
-                ftrack_ent = self.process_session.query(
-                    self.entities_query_by_id.format(
-                        ft_project["id"], ftrack_id
-                    )
-                ).one()
-                self.ftrack_ents_by_id[ftrack_id] = ftrack_ent
+                continue
 
             name = ftrack_ent["name"]
             ent_path_items = [_ent["name"] for _ent in ftrack_ent["link"][:-1]]
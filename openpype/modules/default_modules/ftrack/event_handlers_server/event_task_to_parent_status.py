@@ -3,6 +3,7 @@ from openpype_modules.ftrack.lib import BaseEvent
 
 
 class TaskStatusToParent(BaseEvent):
+    concurrent_safe = True
     settings_key = "status_task_to_parent"
 
     def launch(self, session, event):
@@ -3,6 +3,7 @@ from openpype_modules.ftrack.lib import BaseEvent
 
 
 class ThumbnailEvents(BaseEvent):
+    concurrent_safe = True
     settings_key = "thumbnail_updates"
 
     def launch(self, session, event):
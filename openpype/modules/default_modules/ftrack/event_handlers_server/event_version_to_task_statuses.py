@@ -3,6 +3,8 @@ from openpype_modules.ftrack.lib import BaseEvent
 
 class VersionToTaskStatus(BaseEvent):
     """Propagates status from version to task when changed."""
+    concurrent_safe = True
+
     def launch(self, session, event):
         # Filter event entities
         # - output is dictionary where key is project id and event info in
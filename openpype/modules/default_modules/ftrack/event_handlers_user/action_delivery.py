@@ -5,7 +5,7 @@ import collections
 
 from bson.objectid import ObjectId
 
-from openpype.api import Anatomy, config
+from openpype.api import get_anatomy, config
 from openpype_modules.ftrack.lib import BaseAction, statics_icon
 from openpype_modules.ftrack.lib.avalon_sync import CUST_ATTR_ID_KEY
 from openpype.lib.delivery import (
@@ -75,7 +75,7 @@ class Delivery(BaseAction):
         })
 
         # Prepare anatomy data
-        anatomy = Anatomy(project_name)
+        anatomy = get_anatomy(project_name)
         new_anatomies = []
         first = None
         for key, template in (anatomy.templates.get("delivery") or {}).items():
@@ -474,7 +474,7 @@ class Delivery(BaseAction):
             "name": {"$in": repre_names}
         }))
 
-        anatomy = Anatomy(project_name)
+        anatomy = get_anatomy(project_name)
 
         format_dict = get_format_dict(anatomy, location_path)
 
@@ -4,11 +4,13 @@ import logging
 import getpass
 import atexit
 import threading
-import datetime
 import time
 import queue
+import operator
+import collections
 import appdirs
 import pymongo
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 import ftrack_api
@@ -30,6 +32,19 @@ from openpype.api import Logger
 TOPIC_STATUS_SERVER = "openpype.event.server.status"
 TOPIC_STATUS_SERVER_RESULT = "openpype.event.server.status.result"
 
+# Session used by handlers in current thread (workers of event processor)
+_thread_data = threading.local()
+
+
+def get_thread_session():
+    """Session set for current thread or None."""
+    return getattr(_thread_data, "session", None)
+
+
+def set_thread_session(session):
+    """Set session used by handlers in current thread."""
+    _thread_data.session = session
+
 
 def check_ftrack_url(url, log_errors=True):
     """Checks if Ftrack server is responding"""
@@ -129,16 +144,145 @@ class StorerEventHub(SocketBaseEventHub):
         )
 
 
+class PartitionedWorkerPool(object):
+    """Thread pool running tasks of same partition in order of submit.
+
+    Each partition has own queue (lane) of tasks. Lane is processed by one
+    worker at a time, one task per worker run so lanes with many tasks don't
+    block other partitions.
+
+    Args:
+        max_workers (int): Count of worker threads.
+        initializer (callable): Called in each worker thread on start.
+    """
+    log = Logger().get_logger("PartitionedWorkerPool")
+
+    def __init__(self, max_workers, initializer=None):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, initializer=initializer
+        )
+        self._lanes = {}
+        self._lock = threading.Lock()
+
+    def submit(self, partition, func, *args):
+        with self._lock:
+            lane = self._lanes.get(partition)
+            start = lane is None
+            if start:
+                lane = collections.deque()
+                self._lanes[partition] = lane
+            lane.append((func, args))
+
+        if start:
+            self._executor.submit(self._run_next, partition)
+
+    def _run_next(self, partition):
+        with self._lock:
+            func, args = self._lanes[partition].popleft()
+
+        try:
+            func(*args)
+        except Exception:
+            self.log.warning("Task of partition {} failed".format(
+                partition
+            ), exc_info=True)
+
+        with self._lock:
+            if not self._lanes[partition]:
+                self._lanes.pop(partition)
+                return
+        # Continue at the end of executor queue to let other lanes run
+        self._executor.submit(self._run_next, partition)
+
+    def queue_depths(self):
+        """Count of waiting tasks by partition."""
+        with self._lock:
+            return {
+                partition: len(lane)
+                for partition, lane in self._lanes.items()
+            }
+
+    def shutdown(self, timeout=None):
+        """Wait until all lanes are processed and stop workers."""
+        started = time.time()
+        while self.queue_depths():
+            if timeout is not None and time.time() - started > timeout:
+                break
+            time.sleep(0.1)
+        self._executor.shutdown(wait=True)
+
+
+class EventAcknowledgement(object):
+    """Acknowledge stored event when all parts of it's handling finished.
+
+    Event may be handled in more parts (subscribers in event hub thread and
+    in worker pool) and is acknowledged only when all of them finished so
+    event is not lost on crash or restart.
+
+    Args:
+        hub (ProcessEventHub): Hub acknowledging the event.
+        event (ftrack_api.event.base.Event): Handled event.
+        parts (int): Count of parts handling the event.
+    """
+
+    def __init__(self, hub, event, parts):
+        self._hub = hub
+        self._event = event
+        self._parts = parts
+        self._lock = threading.Lock()
+
+    def part_done(self):
+        with self._lock:
+            self._parts -= 1
+            finished = self._parts == 0
+        if finished:
+            self._hub.add_ack(self._event)
+
+
 class ProcessEventHub(SocketBaseEventHub):
+    """Event hub processing events stored in Mongo by storer.
+
+    Stored events are pushed to the hub by change stream of events
+    collection. Polling of collection is used when change streams are not
+    available (Mongo is not a replica set). Handled events are marked as
+    processed in batches and removed by TTL index after
+    'processed_events_ttl' seconds.
+    """
     hearbeat_msg = b"processor"
 
     is_collection_created = False
     pypelog = Logger().get_logger("Session Processor")
 
+    processed_events_ttl = 3 * 24 * 60 * 60
+    # mark handled events as processed after count or seconds
+    ack_batch_size = 100
+    ack_interval = 1.0
+    poll_interval = 0.5
+    use_change_stream = True
+    # worker threads for handlers with 'concurrent_safe' set (0 to disable)
+    handler_workers = 4
+    metrics_interval = 60
+
     def __init__(self, *args, **kwargs):
         self.mongo_url = None
         self.dbcon = None
 
+        self._handler_pool = None
+        self._handler_stats = {}
+        self._handler_stats_lock = threading.Lock()
+        self._last_metrics = time.time()
+
+        self._watch_thread = None
+        self._watching = False
+        self._queued_ids = set()
+        self._queued_ids_lock = threading.Lock()
+        self._acks = []
+        self._acks_lock = threading.Lock()
+        self._last_ack = time.time()
+
+        self.processed_count = 0
+        self.ack_round_trips = 0
+
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
@@ -147,6 +291,7 @@ class ProcessEventHub(SocketBaseEventHub):
             mongo_client = OpenPypeMongoConnection.get_mongo_client()
             self.dbcon = mongo_client[database_name][collection_name]
             self.mongo_client = mongo_client
+            self.ensure_indexes()
 
         except pymongo.errors.AutoReconnect:
             self.pypelog.error((
@@ -163,53 +308,383 @@ class ProcessEventHub(SocketBaseEventHub):
             self.sock.sendall(b"MongoError")
             sys.exit(0)
 
+    def ensure_indexes(self):
+        """Index of not processed events and TTL index of processed."""
+        self.dbcon.create_index(
+            [
+                ("pype_data.is_processed", pymongo.ASCENDING),
+                ("pype_data.stored", pymongo.ASCENDING)
+            ],
+            name="events_to_process"
+        )
+        try:
+            self.dbcon.create_index(
+                "pype_data.stored",
+                name="processed_events_ttl",
+                expireAfterSeconds=self.processed_events_ttl,
+                partialFilterExpression={"pype_data.is_processed": True}
+            )
+        except pymongo.errors.OperationFailure:
+            self.pypelog.warning(
+                "TTL index of processed events couldn't be created",
+                exc_info=True
+            )
+
+    def start_watching(self):
+        """Start thread pushing newly stored events to queue.
+
+        Returns:
+            bool: Change stream is available.
+        """
+        if not self.use_change_stream:
+            return False
+
+        try:
+            stream = self.dbcon.watch(
+                [{"$match": {"operationType": {"$in": ["insert", "replace"]}}}]
+            )
+        except pymongo.errors.OperationFailure:
+            self.pypelog.info(
+                "Change streams are not available, polling stored events."
+            )
+            return False
+
+        self._watching = True
+        self._watch_thread = threading.Thread(
+            target=self._watch, args=(stream, ), daemon=True
+        )
+        self._watch_thread.start()
+        return True
+
+    def _watch(self, stream):
+        try:
+            with stream:
+                for change in stream:
+                    self._queue_event_data(change["fullDocument"])
+        except Exception:
+            self.pypelog.warning(
+                "Change stream of events failed, polling stored events.",
+                exc_info=True
+            )
+        self._watching = False
+
     def wait(self, duration=None):
         """Overriden wait
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Events stored to Mongo DB are pushed to queue by change stream or
+        loaded when queue is empty. Handled events are set as processed in
+        Mongo DB in batches.
         """
         started = time.time()
         self.prepare_dbcon()
-        while True:
-            try:
-                event = self._event_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
-            else:
+        if self.handler_workers:
+            self._handler_pool = PartitionedWorkerPool(
+                self.handler_workers, self._init_handler_worker
+            )
+        # start watching before load so no event is missed
+        self.start_watching()
+        self.load_events()
+        try:
+            while True:
+                if time.time() - self._last_metrics > self.metrics_interval:
+                    self.log_metrics()
+
                 try:
+                    event = self._event_queue.get(timeout=0.1)
+                except queue.Empty:
+                    self.acknowledge_events(force=True)
+                    if not self._watching and not self.load_events():
+                        time.sleep(self.poll_interval)
+                else:
+                    # Event is acknowledged when handled by all subscribers
                     self._handle(event)
+                    self.processed_count += 1
+
+                    # Additional special processing of events.
+                    if event['topic'] == 'ftrack.meta.disconnected':
+                        self.acknowledge_events(force=True)
+                        break
+                    self.acknowledge_events()
+
+                if duration is not None:
+                    if (time.time() - started) > duration:
+                        self.acknowledge_events(force=True)
+                        break
+
+        except pymongo.errors.AutoReconnect:
+            self.pypelog.error((
+                "Mongo server \"{}\" is not responding, exiting."
+            ).format(OpenPypeMongoConnection.get_default_mongo_url()))
+            sys.exit(0)
+
+        if self._handler_pool is not None:
+            self._handler_pool.shutdown(timeout=60)
+            self._handler_pool = None
+            # Events handled by workers after last acknowledge
+            self.acknowledge_events(force=True)
+
+    def _init_handler_worker(self):
+        """Each worker thread uses own session, session is not thread safe."""
+        set_thread_session(ftrack_api.Session(
+            server_url=self._server_url,
+            api_user=self._api_user,
+            api_key=self._api_key,
+            auto_connect_event_hub=False
+        ))
+
+    @staticmethod
+    def get_event_partition(event):
+        """Id of project of event entities, None if not found."""
+        for entity_info in event["data"].get("entities") or []:
+            if entity_info.get("entityType") == "show":
+                return entity_info.get("entityId")
+            for parent in entity_info.get("parents") or []:
+                if parent.get("entityType") == "show":
+                    return parent.get("entityId")
+        return None
+
+    def _handle(self, event, synchronous=False):
+        """Handle event by interested subscribers.
+
+        Subscribers of handlers with 'concurrent_safe' enabled are run in
+        worker pool, partitioned by project so events of one project are
+        handled in order. Other subscribers run in this thread one after
+        another as before. Synchronous events are handled only in this
+        thread as results of subscribers are returned.
+
+        Stored event is acknowledged when all subscribers finished.
+
+        Returns:
+            list: Results of subscribers which were run in this thread.
+        """
+        target = event.get("target", None)
+        target_expression = None
+        if target:
+            try:
+                target_expression = self._expression_parser.parse(target)
+            except Exception:
+                self.logger.exception(L(
+                    "Cannot handle event as failed to parse event target "
+                    "information: {0}", event
+                ))
+                self.add_ack(event)
+                return []
+
+        serial_subscribers = []
+        concurrent_subscribers = []
+        subscribers = sorted(
+            self._subscribers, key=operator.attrgetter("priority")
+        )
+        for subscriber in subscribers:
+            if (
+                target_expression is not None
+                and not target_expression.match(subscriber.metadata)
+            ):
+                continue
+
+            if not subscriber.interested_in(event):
+                continue
+
+            handler = getattr(subscriber.callback, "__self__", None)
+            if (
+                not synchronous
+                and self._handler_pool is not None
+                and getattr(handler, "concurrent_safe", False)
+            ):
+                concurrent_subscribers.append(subscriber)
+            else:
+                serial_subscribers.append(subscriber)
+
+        if not concurrent_subscribers:
+            results = self._run_subscribers(
+                serial_subscribers, event, synchronous
+            )
+            self.add_ack(event)
+            return results
+
+        acknowledgement = EventAcknowledgement(self, event, 2)
+        self._handler_pool.submit(
+            self.get_event_partition(event),
+            self._run_concurrent_subscribers,
+            concurrent_subscribers,
+            event,
+            acknowledgement
+        )
+        try:
+            return self._run_subscribers(
+                serial_subscribers, event, synchronous
+            )
+        finally:
+            acknowledgement.part_done()
+
+    def _run_concurrent_subscribers(self, subscribers, event, acknowledgement):
+        try:
+            self._run_subscribers(subscribers, event, False)
+        finally:
+            acknowledgement.part_done()
+
+    def _run_subscribers(self, subscribers, event, synchronous):
+        results = []
+        for subscriber in subscribers:
+            # Check whether to continue processing topic event.
+            if event.is_stopped():
+                self.logger.debug(L(
+                    "Event {0} was stopped. Will not process remaining"
+                    " subscribers.", event
+                ))
+                break
+
+            handler = getattr(subscriber.callback, "__self__", None)
+            handler_name = handler.__class__.__name__ if handler else str(
+                subscriber.callback
+            )
+            start = time.perf_counter()
+            try:
+                response = subscriber.callback(event)
+                results.append(response)
 
-                    mongo_id = event["data"].get("_event_mongo_id")
-                    if mongo_id is None:
-                        continue
+            except Exception:
+                self.logger.exception(L(
+                    "Error calling subscriber {0} for event {1}.",
+                    subscriber, event
+                ))
+                continue
+
+            finally:
+                self._add_handler_time(
+                    handler_name, time.perf_counter() - start
+                )
+
+            if synchronous or response is None:
+                continue
+
+            try:
+                self.publish_reply(
+                    event, data=response, source=subscriber.metadata
+                )
+            except Exception:
+                self.logger.exception(L(
+                    "Error publishing response {0} from subscriber {1} "
+                    "for event {2}.", response, subscriber, event
+                ))
+        return results
+
+    def _add_handler_time(self, handler_name, duration):
+        with self._handler_stats_lock:
+            stats = self._handler_stats.get(handler_name)
+            if stats is None:
+                stats = {"count": 0, "total": 0.0, "max": 0.0}
+                self._handler_stats[handler_name] = stats
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+
+    def get_metrics(self):
+        """Timing of handlers and depths of event queues.
+
+        Returns:
+            dict: 'handlers' with count, total and max time by handler name,
+                'queue_depth' of not handled events and 'partition_depths'
+                with waiting events by project id.
+        """
+        with self._handler_stats_lock:
+            handlers = {
+                name: dict(stats)
+                for name, stats in self._handler_stats.items()
+            }
+        partition_depths = {}
+        if self._handler_pool is not None:
+            partition_depths = self._handler_pool.queue_depths()
+        return {
+            "handlers": handlers,
+            "queue_depth": self._event_queue.qsize(),
+            "partition_depths": partition_depths
+        }
+
+    def log_metrics(self):
+        self._last_metrics = time.time()
+        metrics = self.get_metrics()
+        lines = [
+            "Events in queue: {}".format(metrics["queue_depth"])
+        ]
+        for partition, depth in metrics["partition_depths"].items():
+            lines.append("Project {} waiting events: {}".format(
+                partition, depth
+            ))
+        for name, stats in sorted(
+            metrics["handlers"].items(),
+            key=lambda item: item[1]["total"],
+            reverse=True
+        ):
+            lines.append(
+                "{}: {} calls, {:.2f}s total, {:.2f}s max".format(
+                    name, stats["count"], stats["total"], stats["max"]
+                )
+            )
+        self.pypelog.debug("\n".join(lines))
 
-                    self.dbcon.update_one(
-                        {"_id": mongo_id},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+    def add_ack(self, event):
+        """Add handled event to events which will be marked as processed."""
+        mongo_id = event["data"].get("_event_mongo_id")
+        if mongo_id is None:
+            return
+        with self._acks_lock:
+            self._acks.append(mongo_id)
+
+    def acknowledge_events(self, force=False):
+        """Mark handled events as processed with single request."""
+        with self._acks_lock:
+            if not self._acks:
+                return
+
+            if not force and (
+                len(self._acks) < self.ack_batch_size
+                and time.time() - self._last_ack < self.ack_interval
+            ):
+                return
+
+            acks = self._acks
+            self._acks = []
+        self._last_ack = time.time()
+        self.ack_round_trips += 1
+        self.dbcon.update_many(
+            {"_id": {"$in": acks}},
+            {"$set": {"pype_data.is_processed": True}}
+        )
+        with self._queued_ids_lock:
+            self._queued_ids.difference_update(acks)
 
-                except pymongo.errors.AutoReconnect:
-                    self.pypelog.error((
-                        "Mongo server \"{}\" is not responding, exiting."
-                    ).format(os.environ["AVALON_MONGO"]))
-                    sys.exit(0)
-                # Additional special processing of events.
-                if event['topic'] == 'ftrack.meta.disconnected':
-                    break
+    def _queue_event_data(self, event_data):
+        """Put stored event to queue if is not queued yet.
 
-            if duration is not None:
-                if (time.time() - started) > duration:
-                    break
+        Returns:
+            bool: Event was added to queue.
+        """
+        if event_data["pype_data"].get("is_processed"):
+            return False
+
+        with self._queued_ids_lock:
+            if event_data["_id"] in self._queued_ids:
+                return False
+            self._queued_ids.add(event_data["_id"])
+
+        new_event_data = {
+            k: v for k, v in event_data.items()
+            if k not in ["_id", "pype_data"]
+        }
+        try:
+            event = ftrack_api.event.base.Event(**new_event_data)
+            event["data"]["_event_mongo_id"] = event_data["_id"]
+        except Exception:
+            self.logger.exception(L(
+                'Failed to convert payload into event: {0}',
+                event_data
+            ))
+            return False
+        self._event_queue.put(event)
+        return True
 
     def load_events(self):
         """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
-        self.dbcon.delete_many({
-            "pype_data.stored": {"$lte": ago_date},
-            "pype_data.is_processed": True
-        })
-
         not_processed_events = self.dbcon.find(
             {"pype_data.is_processed": False}
         ).sort(
@@ -218,21 +693,8 @@ class ProcessEventHub(SocketBaseEventHub):
 
         found = False
         for event_data in not_processed_events:
-            new_event_data = {
-                k: v for k, v in event_data.items()
-                if k not in ["_id", "pype_data"]
-            }
-            try:
-                event = ftrack_api.event.base.Event(**new_event_data)
-                event["data"]["_event_mongo_id"] = event_data["_id"]
-            except Exception:
-                self.logger.exception(L(
-                    'Failed to convert payload into event: {0}',
-                    event_data
-                ))
-                continue
-            found = True
-            self._event_queue.put(event)
+            if self._queue_event_data(event_data):
+                found = True
 
         return found
 
@@ -211,6 +211,21 @@ def get_project_apps(in_app_list):
 def get_hierarchical_attributes_values(
     session, entity, hier_attrs, cust_attr_types=None
 ):
+    return get_hierarchical_attributes_values_by_entity_id(
+        session, [entity], hier_attrs, cust_attr_types
+    )[entity["id"]]
+
+
+def get_hierarchical_attributes_values_by_entity_id(
+    session, entities, hier_attrs, cust_attr_types=None
+):
+    """Values of hierarchical attributes of multiple entities.
+
+    Values of all entities and their parents are queried with one call.
+
+    Returns:
+        dict: Values by attribute key by entity id.
+    """
     if not cust_attr_types:
         cust_attr_types = session.query(
             "select id, name from CustomAttributeType"
@@ -238,56 +253,146 @@ def get_hierarchical_attributes_values(
         )
         convert_types_by_attr_id[attr_id] = convert_type
 
-    entity_ids = [item["id"] for item in entity["link"]]
+    link_ids_by_entity_id = {}
+    all_link_ids = set()
+    for entity in entities:
+        link_ids = [item["id"] for item in entity["link"]]
+        link_ids_by_entity_id[entity["id"]] = link_ids
+        all_link_ids |= set(link_ids)
 
-    join_ent_ids = join_query_keys(entity_ids)
-    join_attribute_ids = join_query_keys(attr_key_by_id.keys())
+    output = {
+        entity_id: copy.deepcopy(defaults)
+        for entity_id in link_ids_by_entity_id.keys()
+    }
+    if not all_link_ids or not attr_key_by_id:
+        return output
 
+    join_attribute_ids = join_query_keys(attr_key_by_id.keys())
+    all_link_ids = list(all_link_ids)
+    chunk_size = max(1, int(5000 / len(attr_key_by_id)))
     queries = []
-    queries.append({
-        "action": "query",
-        "expression": (
-            "select value, configuration_id, entity_id"
-            " from CustomAttributeValue"
-            " where entity_id in ({}) and configuration_id in ({})"
-        ).format(join_ent_ids, join_attribute_ids)
-    })
+    for idx in range(0, len(all_link_ids), chunk_size):
+        queries.append({
+            "action": "query",
+            "expression": (
+                "select value, configuration_id, entity_id"
+                " from CustomAttributeValue"
+                " where entity_id in ({}) and configuration_id in ({})"
+            ).format(
+                join_query_keys(all_link_ids[idx:idx + chunk_size]),
+                join_attribute_ids
+            )
+        })
 
     if hasattr(session, "call"):
-        [values] = session.call(queries)
+        results = session.call(queries)
     else:
-        [values] = session._call(queries)
-
-    hier_values = {}
-    for key, val in defaults.items():
-        hier_values[key] = val
-
-    if not values["data"]:
-        return hier_values
+        results = session._call(queries)
 
     values_by_entity_id = collections.defaultdict(dict)
-    for item in values["data"]:
-        value = item["value"]
-        if value is None:
-            continue
+    for result in results:
+        for item in result["data"]:
+            value = item["value"]
+            if value is None:
+                continue
 
-        attr_id = item["configuration_id"]
+            attr_id = item["configuration_id"]
 
-        convert_type = convert_types_by_attr_id[attr_id]
-        if convert_type:
-            value = convert_type(value)
+            convert_type = convert_types_by_attr_id[attr_id]
+            if convert_type:
+                value = convert_type(value)
 
-        key = attr_key_by_id[attr_id]
-        entity_id = item["entity_id"]
-        values_by_entity_id[entity_id][key] = value
+            key = attr_key_by_id[attr_id]
+            values_by_entity_id[item["entity_id"]][key] = value
 
-    for entity_id in entity_ids:
-        for key in attr_key_by_id.values():
-            value = values_by_entity_id[entity_id].get(key)
-            if value is not None:
+    for entity_id, link_ids in link_ids_by_entity_id.items():
+        hier_values = output[entity_id]
+        for link_id in link_ids:
+            for key, value in values_by_entity_id[link_id].items():
                 hier_values[key] = value
 
-    return hier_values
+    return output
+
+
+class CallCountingSession(ftrack_api.Session):
+    """Session counting calls (requests) to ftrack server.
+
+    Queries and commits are calls, as well as lazy loading of attributes
+    which were not queried.
+    """
+    def __init__(self, *args, **kwargs):
+        self.call_count = 0
+        super(CallCountingSession, self).__init__(*args, **kwargs)
+
+    def call(self, data):
+        self.call_count += 1
+        return super(CallCountingSession, self).call(data)
+
+
+class EntitiesQueryBatcher(object):
+    """Query entities by ids in chunks and keep them for session lifetime.
+
+    Ids of entities which will be needed are passed to 'request' and queried
+    together on first 'get' instead of a query for each entity.
+
+    Args:
+        session (ftrack_api.Session): Session used for queries.
+        query (str): Query with "{}" placeholder for joined ids.
+        entities_by_id (dict): Storage of queried entities. Can be shared
+            with code which fills it with entities queried in other way.
+    """
+    chunk_size = 200
+
+    def __init__(self, session, query, entities_by_id=None):
+        if entities_by_id is None:
+            entities_by_id = {}
+        self.session = session
+        self.query = query
+        self.entities_by_id = entities_by_id
+        self.query_count = 0
+        self._requested_ids = set()
+        self._missing_ids = set()
+
+    def request(self, entity_ids):
+        """Register ids which will be queried with next query."""
+        for entity_id in entity_ids:
+            if (
+                entity_id
+                and entity_id not in self.entities_by_id
+                and entity_id not in self._missing_ids
+            ):
+                self._requested_ids.add(entity_id)
+
+    def fetch(self):
+        """Query all requested entities which were not queried yet."""
+        entity_ids = [
+            entity_id
+            for entity_id in self._requested_ids
+            if entity_id not in self.entities_by_id
+        ]
+        self._requested_ids = set()
+        for idx in range(0, len(entity_ids), self.chunk_size):
+            chunk_ids = entity_ids[idx:idx + self.chunk_size]
+            self.query_count += 1
+            entities = self.session.query(
+                self.query.format(join_query_keys(chunk_ids))
+            ).all()
+            for entity in entities:
+                self.entities_by_id[entity["id"]] = entity
+
+            for entity_id in chunk_ids:
+                if entity_id not in self.entities_by_id:
+                    self._missing_ids.add(entity_id)
+
+    def get(self, entity_id):
+        """Entity by id, queried with all requested entities if needed.
+
+        Returns:
+            ftrack_api.entity.base.Entity: Entity or None if not found.
+        """
+        self.request([entity_id])
+        self.fetch()
+        return self.entities_by_id.get(entity_id)
 
 
 class SyncEntitiesFactory:
@@ -314,6 +419,8 @@ class SyncEntitiesFactory:
     )
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
+    # Chunked queries of custom attribute values sent in one call
+    queries_per_call = 10
 
     report_splitter = {"type": "label", "value": "---"}
 
@@ -329,7 +436,7 @@ class SyncEntitiesFactory:
         except Exception:
             pass
 
-        self.session = ftrack_api.Session(
+        self.session = CallCountingSession(
             server_url=self._server_url,
             api_key=self._api_key,
             api_user=self._api_user,
@@ -853,25 +960,30 @@ class SyncEntitiesFactory:
         attributes_joined = join_query_keys(conf_ids)
         attributes_len = len(conf_ids)
         chunk_size = int(5000 / attributes_len)
+        call_expr = []
         for idx in range(0, len(entity_ids), chunk_size):
             entity_ids_joined = join_query_keys(
                 entity_ids[idx:idx + chunk_size]
             )
 
-            call_expr = [{
+            call_expr.append({
                 "action": "query",
                 "expression": (
                     "select value, entity_id from ContextCustomAttributeValue "
                     "where entity_id in ({}) and configuration_id in ({})"
                 ).format(entity_ids_joined, attributes_joined)
-            }]
+            })
+
+        # Send multiple queries in one call
+        for idx in range(0, len(call_expr), self.queries_per_call):
+            queries = call_expr[idx:idx + self.queries_per_call]
             if hasattr(session, "call"):
-                [result] = session.call(call_expr)
+                results = session.call(queries)
             else:
-                [result] = session._call(call_expr)
+                results = session._call(queries)
 
-            for item in result["data"]:
-                output.append(item)
+            for result in results:
+                output.extend(result["data"])
         return output
 
     def set_cutom_attributes(self):
@@ -1820,6 +1932,9 @@ class SyncEntitiesFactory:
         self.prepare_changes()
         self.update_entities()
         self.session.commit()
+        self.log.debug("* Ftrack API calls of synchronization: {}".format(
+            self.session.call_count
+        ))
 
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
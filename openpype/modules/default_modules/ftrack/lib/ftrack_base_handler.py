@@ -44,6 +44,9 @@ class BaseHandler(object):
     type = 'No-type'
     ignore_me = False
     preactions = []
+    # Handler can be processed in worker thread of event server with own
+    #   session (handler must not keep state between events)
+    concurrent_safe = False
 
     @staticmethod
     def join_query_keys(keys):
@@ -150,7 +153,7 @@ class BaseHandler(object):
     @property
     def session(self):
         '''Return current session.'''
-        return self._session
+        return ftrack_server.lib.get_thread_session() or self._session
 
     def reset_session(self):
         self.session.reset()
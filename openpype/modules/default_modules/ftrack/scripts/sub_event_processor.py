@@ -11,6 +11,7 @@ from openpype_modules.ftrack.ftrack_server.lib import (
     TOPIC_STATUS_SERVER
 )
 from openpype.modules import ModulesManager
+from openpype.settings.lib import enable_settings_change_stream
 
 from openpype.api import Logger
 
@@ -74,6 +75,8 @@ def main(args):
 
     returncode = 0
     try:
+        # Refetch settings only when changed
+        enable_settings_change_stream()
         session = SocketSession(
             auto_connect_event_hub=True, sock=sock, Eventhub=ProcessEventHub
         )
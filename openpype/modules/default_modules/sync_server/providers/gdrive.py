@@ -9,6 +9,7 @@ from openpype.api import Logger
 from openpype.api import get_system_settings
 from .abstract_provider import AbstractProvider
 from ..utils import time_function, ResumableError
+from .gdrive_cache import GDriveFolderCache, get_folder_cache_path
 
 log = Logger().get_logger("SyncServer")
 
@@ -59,6 +60,8 @@ class GDriveHandler(AbstractProvider):
     FOLDER_STR = 'application/vnd.google-apps.folder'
     MY_DRIVE_STR = 'My Drive'  # name of root folder of regular Google drive
     CHUNK_SIZE = 2097152  # must be divisible by 256! used for upload chunks
+    # store folders on disk and update them from changes feed on start
+    USE_FOLDER_CACHE = True
 
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -67,6 +70,8 @@ class GDriveHandler(AbstractProvider):
         self.site_name = site_name
         self.service = None
         self.root = None
+        self.folder_cache = None
+        self._tree = tree
 
         self.presets = presets
         if not self.presets:
@@ -84,7 +89,17 @@ class GDriveHandler(AbstractProvider):
 
         self.service = self._get_gd_service(cred_path)
 
-        self._tree = tree
+        if self.USE_FOLDER_CACHE:
+            try:
+                self.folder_cache = GDriveFolderCache(
+                    get_folder_cache_path(site_name, cred_path)
+                )
+            except Exception:
+                log.warning(
+                    "Folder cache couldn't be opened, all folders will be "
+                    "listed.", exc_info=True
+                )
+
         self.active = True
 
     def is_active(self):
@@ -178,9 +193,28 @@ class GDriveHandler(AbstractProvider):
              (dictionary) - url to id mapping
         """
         if not self._tree:
-            self._tree = self._build_tree(self.list_folders())
+            self._tree = self._build_tree(self._get_folders())
         return self._tree
 
+    def _get_folders(self):
+        """
+            Returns all folders, from cache updated by changes since last
+            run if cache is available.
+        Returns:
+            (list) of dictionaries('id', 'name', [parents])
+        """
+        if self.folder_cache is None:
+            return self.list_folders()
+
+        try:
+            return self.folder_cache.sync(self.service, self.list_folders)
+        except errors.HttpError:
+            # stored start page token might be expired or invalid
+            log.warning("Update of folder cache failed, listing all folders",
+                        exc_info=True)
+            self.folder_cache.clear()
+            return self.folder_cache.sync(self.service, self.list_folders)
+
     def create_folder(self, path):
         """
             Create all nonexistent folders and subfolders in 'path'.
@@ -215,10 +249,15 @@ class GDriveHandler(AbstractProvider):
                         body=folder_metadata,
                         supportsAllDrives=True,
                         fields='id').execute()
+                    parent_id = folder_id
                     folder_id = folder["id"]
 
                     new_path_key = path + '/' + new_folder_name
                     self.get_tree()[new_path_key] = {"id": folder_id}
+                    if self.folder_cache is not None:
+                        self.folder_cache.add_folder(folder_id,
+                                                     new_folder_name,
+                                                     parent_id)
 
                     path = new_path_key
                 return folder_id
@@ -0,0 +1,240 @@
+"""Persistent cache of GDrive folders.
+
+GDrive API doesn't have real folder structure so provider must know all
+folders to resolve paths to folder ids. Listing of all folders on big drive
+may take minutes. Folder records are stored in SQLite database per site and
+updated incrementally from Drive changes feed (changes.list) so only changes
+since last start are queried.
+"""
+import os
+import json
+import sqlite3
+import hashlib
+import threading
+import contextlib
+
+import appdirs
+
+FOLDER_MIME_TYPE = "application/vnd.google-apps.folder"
+
+CHANGE_FIELDS = (
+    "nextPageToken, newStartPageToken, changes(fileId, removed, "
+    "file(id, name, parents, mimeType, trashed))"
+)
+
+
+def get_folder_cache_path(site_name, credentials_path):
+    """Path to cache database of site.
+
+    Different service accounts may see different folders, that's why
+    path to credentials is part of the filename.
+    """
+    credentials_hash = hashlib.sha1(
+        credentials_path.encode("utf-8")
+    ).hexdigest()[:8]
+    return os.path.join(
+        appdirs.user_data_dir("openpype", "pypeclub"),
+        "sync_server",
+        "gdrive_{}_{}.sqlite".format(site_name, credentials_hash)
+    )
+
+
+class GDriveFolderCache(object):
+    """Folder records of GDrive stored in SQLite database.
+
+    Args:
+        path (str): Path to database file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        dirpath = os.path.dirname(path)
+        if dirpath and not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS folders ("
+                "id TEXT PRIMARY KEY, name TEXT, parent TEXT)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta ("
+                "key TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    @contextlib.contextmanager
+    def _connection(self):
+        with self._lock:
+            conn = sqlite3.connect(self.path, timeout=30)
+            try:
+                # Commit on success, rollback on error
+                with conn:
+                    yield conn
+            finally:
+                conn.close()
+
+    def get_value(self, key):
+        """Value stored in meta table decoded from json."""
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key, )
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0])
+
+    def set_value(self, key, value):
+        """Store json serializable value to meta table."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                (key, json.dumps(value))
+            )
+
+    @property
+    def start_page_token(self):
+        return self.get_value("start_page_token")
+
+    def clear(self):
+        """Remove all cached data so next sync lists all folders."""
+        with self._connection() as conn:
+            conn.execute("DELETE FROM folders")
+            conn.execute("DELETE FROM meta")
+
+    def get_folders(self):
+        """All cached folders.
+
+        Returns:
+            (list) of dictionaries('id', 'name', [parents]) same as
+                folders returned by GDrive API
+        """
+        with self._connection() as conn:
+            rows = conn.execute(
+                "SELECT id, name, parent FROM folders"
+            ).fetchall()
+
+        folders = []
+        for folder_id, name, parent in rows:
+            folder = {"id": folder_id, "name": name}
+            if parent:
+                folder["parents"] = [parent]
+            folders.append(folder)
+        return folders
+
+    def add_folder(self, folder_id, name, parent):
+        """Add or update single folder record."""
+        with self._connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO folders (id, name, parent)"
+                " VALUES (?, ?, ?)",
+                (folder_id, name, parent)
+            )
+
+    def reset(self, folders, start_page_token):
+        """Replace all cached folders with full listing.
+
+        Args:
+            folders (list): Folders from GDrive API.
+            start_page_token (str): Token of changes feed from the time
+                before listing started.
+        """
+        with self._connection() as conn:
+            conn.execute("DELETE FROM folders")
+            conn.executemany(
+                "INSERT OR REPLACE INTO folders (id, name, parent)"
+                " VALUES (?, ?, ?)",
+                [
+                    (
+                        folder["id"],
+                        folder["name"],
+                        (folder.get("parents") or [None])[0]
+                    )
+                    for folder in folders
+                ]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                ("start_page_token", json.dumps(start_page_token))
+            )
+
+    def apply_changes(self, changes, start_page_token):
+        """Apply changes from changes feed.
+
+        Removed or trashed folders are deleted, new or modified folders
+        are updated. Changes of files are skipped.
+
+        Args:
+            changes (list): Changes returned by changes.list.
+            start_page_token (str): Token for next changes query.
+        """
+        removed_ids = []
+        updated = []
+        for change in changes:
+            item = change.get("file") or {}
+            if change.get("removed") or item.get("trashed"):
+                removed_ids.append((change["fileId"], ))
+                continue
+
+            if item.get("mimeType") != FOLDER_MIME_TYPE:
+                continue
+
+            updated.append((
+                item["id"],
+                item["name"],
+                (item.get("parents") or [None])[0]
+            ))
+
+        with self._connection() as conn:
+            conn.executemany("DELETE FROM folders WHERE id = ?", removed_ids)
+            conn.executemany(
+                "INSERT OR REPLACE INTO folders (id, name, parent)"
+                " VALUES (?, ?, ?)",
+                updated
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                ("start_page_token", json.dumps(start_page_token))
+            )
+
+    def sync(self, service, list_folders):
+        """Update cache from GDrive.
+
+        Full listing is used only when cache is empty, otherwise only
+        changes since last sync are queried.
+
+        Args:
+            service: GDrive service.
+            list_folders (callable): Returns list of all folders on drive.
+
+        Returns:
+            (list) of dictionaries('id', 'name', [parents])
+        """
+        start_page_token = self.start_page_token
+        if start_page_token is None:
+            # Token must be queried before listing to not miss any change
+            start_page_token = service.changes().getStartPageToken(
+                supportsAllDrives=True
+            ).execute()["startPageToken"]
+            self.reset(list_folders(), start_page_token)
+            return self.get_folders()
+
+        changes = []
+        page_token = start_page_token
+        while page_token is not None:
+            response = service.changes().list(
+                pageToken=page_token,
+                spaces="drive",
+                includeItemsFromAllDrives=True,
+                supportsAllDrives=True,
+                includeRemoved=True,
+                pageSize=1000,
+                fields=CHANGE_FIELDS
+            ).execute()
+            changes.extend(response.get("changes", []))
+            if "newStartPageToken" in response:
+                start_page_token = response["newStartPageToken"]
+            page_token = response.get("nextPageToken")
+
+        self.apply_changes(changes, start_page_token)
+        return self.get_folders()
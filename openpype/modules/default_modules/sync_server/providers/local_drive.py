@@ -1,10 +1,12 @@
 from __future__ import print_function
 import os.path
 import shutil
+import hashlib
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from openpype.api import Logger, Anatomy
+from openpype.api import Logger, get_anatomy
 from .abstract_provider import AbstractProvider
 
 log = Logger().get_logger("SyncServer")
@@ -14,6 +16,15 @@ class LocalDriveHandler(AbstractProvider):
     CODE = 'local_drive'
     LABEL = 'Local drive'
 
+    MAX_WORKERS = 4  # max count of files copied at the same time
+    CHUNK_SIZE = 8 * 1024 * 1024
+    # interrupted copy of larger files continues from last checkpoint
+    RESUMABLE_SIZE = 512 * 1024 * 1024
+    TEMP_SUFFIX = ".partial"
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
     """ Handles required operations on mounted disks with OS """
     def __init__(self, project_name, site_name, tree=None, presets=None):
         self.presets = None
@@ -84,16 +95,15 @@ class LocalDriveHandler(AbstractProvider):
         if not os.path.isfile(source_path):
             raise FileNotFoundError("Source file {} doesn't exist."
                                     .format(source_path))
-        if overwrite:
-            thread = threading.Thread(target=self._copy,
-                                      args=(source_path, target_path))
-            thread.start()
-            self._mark_progress(collection, file, representation, server,
-                                site, source_path, target_path, direction)
-        else:
-            if os.path.exists(target_path):
-                raise ValueError("File {} exists, set overwrite".
-                                 format(target_path))
+        if not overwrite and os.path.exists(target_path):
+            raise ValueError("File {} exists, set overwrite".
+                             format(target_path))
+
+        future = self._get_executor().submit(
+            self._copy, source_path, target_path, server, collection,
+            file, representation, site, direction
+        )
+        future.result()
 
         return os.path.basename(target_path)
 
@@ -156,8 +166,8 @@ class LocalDriveHandler(AbstractProvider):
             Format is importing for usage of python's format ** approach
         """
         if not anatomy:
-            anatomy = Anatomy(self.project_name,
-                              self._normalize_site_name(self.site_name))
+            anatomy = get_anatomy(self.project_name,
+                                  self._normalize_site_name(self.site_name))
 
         return {'root': anatomy.roots}
 
@@ -174,38 +184,131 @@ class LocalDriveHandler(AbstractProvider):
         """
         pass
 
-    def _copy(self, source_path, target_path):
-        print("copying {}->{}".format(source_path, target_path))
-        shutil.copy(source_path, target_path)
-
-    def _mark_progress(self, collection, file, representation, server, site,
-                       source_path, target_path, direction):
+    @classmethod
+    def _get_executor(cls):
+        """Shared pool limiting count of parallel copies."""
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS)
+        return cls._executor
+
+    def _copy(self, source_path, target_path, server=None, collection=None,
+              file=None, representation=None, site=None, direction="Upload"):
         """
-            Updates progress field in DB by values 0-1.
+            Copies file by chunks to temporary file renamed to 'target_path'
+            when finished.
 
-            Compares file sizes of source and target.
+            Progress is stored to DB from copy loop. Files larger than
+            RESUMABLE_SIZE store checkpoint (copied size and its checksum)
+            with progress, next attempt continues from checkpoint if
+            temporary file matches.
         """
-        source_file_size = os.path.getsize(source_path)
-        target_file_size = 0
-        last_tick = status_val = None
-        while source_file_size != target_file_size:
-            if not last_tick or \
-                    time.time() - last_tick >= server.LOG_PROGRESS_SEC:
-                status_val = target_file_size / source_file_size
+        log.debug("copying {}->{}".format(source_path, target_path))
+        source_size = os.path.getsize(source_path)
+        source_mtime = os.path.getmtime(source_path)
+        temp_path = target_path + self.TEMP_SUFFIX
+        resumable = server is not None and source_size >= self.RESUMABLE_SIZE
+
+        offset = 0
+        checksum = hashlib.sha1()
+        if resumable:
+            offset = self._get_resume_offset(file, site, temp_path,
+                                             source_size, source_mtime,
+                                             checksum)
+        if not offset:
+            checksum = hashlib.sha1()
+
+        mode = "r+b" if offset else "wb"
+        last_tick = 0
+        with open(source_path, "rb") as src, open(temp_path, mode) as dst:
+            src.seek(offset)
+            dst.seek(offset)
+            dst.truncate()
+            while True:
+                chunk = src.read(self.CHUNK_SIZE)
+                if not chunk:
+                    break
+                dst.write(chunk)
+                offset += len(chunk)
+                if resumable:
+                    checksum.update(chunk)
+
+                if server is None or \
+                        time.time() - last_tick < server.LOG_PROGRESS_SEC:
+                    continue
+
                 last_tick = time.time()
+                resume_info = None
+                if resumable:
+                    # checkpoint only data which are really written
+                    dst.flush()
+                    os.fsync(dst.fileno())
+                    resume_info = {
+                        "offset": offset,
+                        "checksum": checksum.hexdigest(),
+                        "size": source_size,
+                        "mtime": source_mtime
+                    }
+                status_val = offset / source_size
                 log.debug(direction + "ed %d%%." % int(status_val * 100))
                 server.update_db(collection=collection,
                                  new_file_id=None,
                                  file=file,
                                  representation=representation,
                                  site=site,
-                                 progress=status_val
+                                 progress=status_val,
+                                 resume_info=resume_info
                                  )
-            try:
-                target_file_size = os.path.getsize(target_path)
-            except FileNotFoundError:
-                pass
-            time.sleep(0.5)
+
+        shutil.copymode(source_path, temp_path)
+        os.replace(temp_path, target_path)
+
+    def _get_resume_offset(self, file, site, temp_path,
+                           source_size, source_mtime, checksum):
+        """
+            Returns offset where copy of file should continue.
+
+            Checkpoint stored in site record must belong to same source file
+            and checksum of temporary file up to checkpoint must match.
+            'checksum' is updated with content of temporary file.
+
+        Returns:
+            (int) - 0 if copy must start from beginning
+        """
+        site_rec = None
+        for rec in (file or {}).get("sites", []):
+            if rec.get("name") == site:
+                site_rec = rec
+                break
+        resume_info = (site_rec or {}).get("resume")
+        if not resume_info or not os.path.exists(temp_path):
+            return 0
+
+        offset = resume_info.get("offset") or 0
+        if (
+            resume_info.get("size") != source_size
+            or resume_info.get("mtime") != source_mtime
+            or os.path.getsize(temp_path) < offset
+        ):
+            return 0
+
+        remaining = offset
+        with open(temp_path, "rb") as stream:
+            while remaining > 0:
+                chunk = stream.read(min(self.CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                checksum.update(chunk)
+                remaining -= len(chunk)
+
+        if remaining or checksum.hexdigest() != resume_info.get("checksum"):
+            log.debug("Checkpoint of {} doesn't match, copying from "
+                      "beginning".format(temp_path))
+            return 0
+
+        log.debug("Resuming copy of {} from {} bytes".format(
+            temp_path, offset))
+        return offset
 
     def _normalize_site_name(self, site_name):
         """Transform user id to 'local' for Local settings"""
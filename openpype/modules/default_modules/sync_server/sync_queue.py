@@ -0,0 +1,149 @@
+"""Queue of representations waiting for synchronization.
+
+Sync server in queue mode doesn't scan whole project for representations
+to synchronize in each loop. Jobs are pushed to queue collection when site
+of representation is added or reset (by loader actions, Tray GUI or
+integrator) and loop pulls only pending jobs ordered by priority. Full scan
+is used only as rare reconciliation.
+
+Job document:
+    {
+        "project": "ProjectName",
+        "representation_id": ObjectId("..."),
+        "site": "gdrive",
+        "priority": 50,
+        "created_dt": datetime
+    }
+"""
+import os
+from datetime import datetime
+
+import pymongo
+from pymongo import UpdateOne
+
+from openpype.lib import OpenPypeMongoConnection
+
+
+class SyncQueue(object):
+    """Access to jobs in queue collection of OpenPype database.
+
+    Args:
+        collection (pymongo.collection.Collection): Queue collection, queue
+            collection of OpenPype database is used if not passed.
+    """
+    COLLECTION_NAME = "sync_queue"
+    DEFAULT_PRIORITY = 50
+
+    def __init__(self, collection=None):
+        self._collection = collection
+        self._indexes_ensured = False
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            database_name = os.environ["OPENPYPE_DATABASE_NAME"]
+            client = OpenPypeMongoConnection.get_mongo_client()
+            self._collection = client[database_name][self.COLLECTION_NAME]
+        if not self._indexes_ensured:
+            self._indexes_ensured = True
+            self.ensure_indexes()
+        return self._collection
+
+    def ensure_indexes(self):
+        """Create indexes used by queue queries."""
+        self._collection.create_index(
+            [
+                ("project", pymongo.ASCENDING),
+                ("representation_id", pymongo.ASCENDING),
+                ("site", pymongo.ASCENDING)
+            ],
+            unique=True
+        )
+        self._collection.create_index([
+            ("project", pymongo.ASCENDING),
+            ("site", pymongo.ASCENDING),
+            ("priority", pymongo.DESCENDING),
+            ("_id", pymongo.ASCENDING)
+        ])
+
+    def enqueue(self, project_name, representation_ids, site_name,
+                priority=None):
+        """Add jobs for representations, existing jobs are kept.
+
+        Args:
+            project_name (str)
+            representation_ids (list): of ObjectId
+            site_name (str): site which should be synchronized
+            priority (int): priority of jobs, existing jobs are updated if
+                passed
+        """
+        if not representation_ids:
+            return
+
+        operations = []
+        for representation_id in representation_ids:
+            update = {
+                "$setOnInsert": {"created_dt": datetime.now()}
+            }
+            if priority is None:
+                update["$setOnInsert"]["priority"] = self.DEFAULT_PRIORITY
+            else:
+                update["$set"] = {"priority": int(priority)}
+
+            operations.append(UpdateOne(
+                {
+                    "project": project_name,
+                    "representation_id": representation_id,
+                    "site": site_name
+                },
+                update,
+                upsert=True
+            ))
+        self.collection.bulk_write(operations, ordered=False)
+
+    def remove(self, project_name, representation_ids, site_name=None):
+        """Remove jobs of representations, of all sites if not passed."""
+        if not representation_ids:
+            return
+
+        query = {
+            "project": project_name,
+            "representation_id": {"$in": list(representation_ids)}
+        }
+        if site_name:
+            query["site"] = site_name
+        self.collection.delete_many(query)
+
+    def pull(self, project_name, site_names, limit=0, after_job=None):
+        """Jobs of sites ordered by priority (higher first).
+
+        Args:
+            project_name (str)
+            site_names (list): of site names
+            limit (int): max count of jobs, 0 for no limit
+            after_job (dict): last job of previous page, jobs ordered after
+                it are returned
+
+        Returns:
+            (list) of job documents
+        """
+        query = {"project": project_name, "site": {"$in": list(site_names)}}
+        if after_job is not None:
+            priority = after_job["priority"]
+            query["$or"] = [
+                {"priority": {"$lt": priority}},
+                {"priority": priority, "_id": {"$gt": after_job["_id"]}}
+            ]
+        return list(self.collection.find(
+            query,
+            sort=[("priority", pymongo.DESCENDING),
+                  ("_id", pymongo.ASCENDING)],
+            limit=limit
+        ))
+
+    def clear(self, project_name, site_name=None):
+        """Remove all jobs of project (and site)."""
+        query = {"project": project_name}
+        if site_name:
+            query["site"] = site_name
+        self.collection.delete_many(query)
@@ -245,6 +245,7 @@ class SyncServerThread(threading.Thread):
 
             asyncio.ensure_future(self.check_shutdown(), loop=self.loop)
             asyncio.ensure_future(self.sync_loop(), loop=self.loop)
+            asyncio.ensure_future(self.flush_loop(), loop=self.loop)
             self.loop.run_forever()
         except Exception:
             log.warning(
@@ -282,11 +283,19 @@ class SyncServerThread(threading.Thread):
                     if not all([local_site, remote_site]):
                         continue
 
-                    sync_repres = self.module.get_sync_representations(
-                        collection,
-                        local_site,
-                        remote_site
-                    )
+                    if self.module.sync_queue_mode:
+                        sync_repres = self.module.get_queued_representations(
+                            collection,
+                            local_site,
+                            remote_site,
+                            self.module.REPRESENTATION_LIMIT
+                        )
+                    else:
+                        sync_repres = self.module.get_sync_representations(
+                            collection,
+                            local_site,
+                            remote_site
+                        )
 
                     task_files_to_process = []
                     files_processed_info = []
@@ -386,6 +395,15 @@ class SyncServerThread(threading.Thread):
                                               representation,
                                               site,
                                               error)
+                    # results of whole batch in single bulk write
+                    await self.loop.run_in_executor(
+                        None, self.module.flush_db_updates)
+                    if self.module.sync_queue_mode:
+                        # jobs are removed only if sync is finished in DB
+                        self.module.finish_sync_jobs(
+                            collection,
+                            [sync["_id"] for sync in sync_repres],
+                            [local_site, remote_site])
 
                 duration = time.time() - start_time
                 log.debug("One loop took {:.2f}s".format(duration))
@@ -411,6 +429,18 @@ class SyncServerThread(threading.Thread):
                 log.warning("Unhandled except. in sync loop, stopping server",
                             exc_info=True)
 
+    async def flush_loop(self):
+        """Writes buffered progress updates periodically."""
+        while self.is_running:
+            await asyncio.sleep(0.5)
+            try:
+                await self.loop.run_in_executor(
+                    None, self.module.flush_db_updates, True)
+            except CancelledError:
+                pass
+            except Exception:
+                log.warning("Flush of DB updates failed", exc_info=True)
+
     def stop(self):
         """Sets is_running flag to false, 'check_shutdown' shuts server down"""
         self.is_running = False
@@ -427,6 +457,7 @@ class SyncServerThread(threading.Thread):
         results = await asyncio.gather(*tasks, return_exceptions=True)
         log.debug(f'Finished awaiting cancelled tasks, results: {results}...')
         await self.loop.shutdown_asyncgens()
+        self.module.flush_db_updates()
         # to really make sure everything else has time to stop
         self.executor.shutdown(wait=True)
         await asyncio.sleep(0.07)
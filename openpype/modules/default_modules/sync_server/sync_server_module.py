@@ -4,13 +4,14 @@ from datetime import datetime
 import threading
 import platform
 import copy
+import time
 
 from avalon.api import AvalonMongoDB
 
 from openpype.modules import OpenPypeModule
 from openpype_interfaces import ITrayModule
 from openpype.api import (
-    Anatomy,
+    get_anatomy,
     get_project_settings,
     get_system_settings,
     get_local_site_id)
@@ -23,6 +24,8 @@ from .providers.local_drive import LocalDriveHandler
 from .providers import lib
 
 from .utils import time_function, SyncStatus
+from .write_buffer import SyncWriteBuffer
+from .sync_queue import SyncQueue
 
 
 log = PypeLogger().get_logger("SyncServer")
@@ -92,6 +95,12 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
     LOCAL_SITE = 'local'
     LOG_PROGRESS_SEC = 5  # how often log progress to DB
     DEFAULT_PRIORITY = 50  # higher is better, allowed range 1 - 1000
+    DB_FLUSH_INTERVAL = 5  # how often write buffered updates to DB (sec)
+    DB_FLUSH_BATCH_SIZE = 500  # write buffered updates when reached
+    # how often check all representations of project in queue mode (sec)
+    QUEUE_RECONCILE_INTERVAL = 3600
+    # max count of queued jobs pulled (and representations queried) at once
+    QUEUE_CHUNK_SIZE = 500
 
     name = "sync_server"
     label = "Sync Queue"
@@ -116,10 +125,24 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         self._paused = False
         self._paused_projects = set()
         self._paused_representations = set()
-        self._anatomies = {}
 
         self._connection = None
 
+        self.db_flush_interval = module_settings[self.name].get(
+            "db_flush_interval", self.DB_FLUSH_INTERVAL)
+        self.db_flush_batch_size = module_settings[self.name].get(
+            "db_flush_batch_size", self.DB_FLUSH_BATCH_SIZE)
+        # buffer of updates to DB, used only in tray by running server
+        self.write_buffer = None
+
+        # jobs are pushed to queue instead of scanning all representations
+        self.sync_queue_mode = module_settings[self.name].get(
+            "sync_queue_mode", False)
+        self.queue_reconcile_interval = module_settings[self.name].get(
+            "queue_reconcile_interval", self.QUEUE_RECONCILE_INTERVAL)
+        self._sync_queue = None
+        self._last_reconcile = {}
+
     """ Start of Public API """
     def add_site(self, collection, representation_id, site_name=None,
                  force=False):
@@ -702,6 +725,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             return
 
         self.lock = threading.Lock()
+        self.write_buffer = SyncWriteBuffer(
+            lambda collection: self.connection.database[collection],
+            flush_interval=self.db_flush_interval,
+            batch_size=self.db_flush_batch_size
+        )
 
         try:
             self.sync_server_thread = SyncServerThread(self)
@@ -778,13 +806,15 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         """
             Get already created or newly created anatomy for project
 
+            Anatomy objects are shared in process, don't modify them.
+
             Args:
                 project_name (string):
 
             Return:
                 (Anatomy)
         """
-        return self._anatomies.get('project_name') or Anatomy(project_name)
+        return get_anatomy(project_name)
 
     @property
     def connection(self):
@@ -964,46 +994,7 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         """
         log.debug("Check representations for : {}".format(collection))
         self.connection.Session["AVALON_PROJECT"] = collection
-        # retry_cnt - number of attempts to sync specific file before giving up
-        retries_arr = self._get_retries_arr(collection)
-        match = {
-            "type": "representation",
-            "$or": [
-                {"$and": [
-                    {
-                        "files.sites": {
-                            "$elemMatch": {
-                                "name": active_site,
-                                "created_dt": {"$exists": True}
-                            }
-                        }}, {
-                        "files.sites": {
-                            "$elemMatch": {
-                                "name": {"$in": [remote_site]},
-                                "created_dt": {"$exists": False},
-                                "tries": {"$in": retries_arr}
-                            }
-                        }
-                    }]},
-                {"$and": [
-                    {
-                        "files.sites": {
-                            "$elemMatch": {
-                                "name": active_site,
-                                "created_dt": {"$exists": False},
-                                "tries": {"$in": retries_arr}
-                            }
-                        }}, {
-                        "files.sites": {
-                            "$elemMatch": {
-                                "name": {"$in": [remote_site]},
-                                "created_dt": {"$exists": True}
-                            }
-                        }
-                    }
-                ]}
-            ]
-        }
+        match = self._get_sync_match(collection, active_site, remote_site)
 
         aggr = [
             {"$match": match},
@@ -1048,6 +1039,64 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
 
         return representations
 
+    def _get_sync_match(self, collection, active_site, remote_site):
+        """
+            Query of representations which should be synchronized between
+            'active_site' and 'remote_site'.
+
+            Representation must have file with 'created_dt' on one site and
+            without it on the other one where it wasn't tried to be
+            synchronized 'retry_cnt' times yet.
+
+        Args:
+            collection (string): project name
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+
+        Returns:
+            (dict) query for 'find' or '$match' of aggregation
+        """
+        # retry_cnt - number of attempts to sync specific file before giving up
+        retries_arr = self._get_retries_arr(collection)
+        return {
+            "type": "representation",
+            "$or": [
+                {"$and": [
+                    {
+                        "files.sites": {
+                            "$elemMatch": {
+                                "name": active_site,
+                                "created_dt": {"$exists": True}
+                            }
+                        }}, {
+                        "files.sites": {
+                            "$elemMatch": {
+                                "name": {"$in": [remote_site]},
+                                "created_dt": {"$exists": False},
+                                "tries": {"$in": retries_arr}
+                            }
+                        }
+                    }]},
+                {"$and": [
+                    {
+                        "files.sites": {
+                            "$elemMatch": {
+                                "name": active_site,
+                                "created_dt": {"$exists": False},
+                                "tries": {"$in": retries_arr}
+                            }
+                        }}, {
+                        "files.sites": {
+                            "$elemMatch": {
+                                "name": {"$in": [remote_site]},
+                                "created_dt": {"$exists": True}
+                            }
+                        }
+                    }
+                ]}
+            ]
+        }
+
     def check_status(self, file, local_site, remote_site, config_preset):
         """
             Check synchronization status for single 'file' of single
@@ -1103,7 +1152,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         return SyncStatus.DO_NOTHING
 
     def update_db(self, collection, new_file_id, file, representation,
-                  site, error=None, progress=None, priority=None):
+                  site, error=None, progress=None, priority=None,
+                  resume_info=None):
         """
             Update 'provider' portion of records in DB with success (file_id)
             or error (exception)
@@ -1118,6 +1168,8 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             error (string): exception message
             progress (float): 0-1 of progress of upload/download
             priority (int): 0-100 set priority
+            resume_info (dict): checkpoint of interrupted transfer stored
+                with progress
 
         Returns:
             None
@@ -1136,8 +1188,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             update["$set"] = self._get_success_dict(new_file_id)
             # reset previous errors if any
             update["$unset"] = self._get_error_dict("", "", "")
+            update["$unset"]["files.$[f].sites.$[s].resume"] = ""
         elif progress is not None:
             update["$set"] = self._get_progress_dict(progress)
+            if resume_info:
+                update["$set"]["files.$[f].sites.$[s].resume"] = resume_info
         elif priority is not None:
             update["$set"] = self._get_priority_dict(priority, file_id)
         else:
@@ -1152,12 +1207,26 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
         if file_id:
             arr_filter.append({'f._id': ObjectId(file_id)})
 
-        self.connection.database[collection].update_one(
-            query,
-            update,
-            upsert=True,
-            array_filters=arr_filter
-        )
+        # priority is set by user, must be visible immediately
+        if self.write_buffer is not None and priority is None:
+            if new_file_id:
+                kind = "success"
+            elif progress is not None:
+                kind = "progress"
+            else:
+                kind = "error"
+            self.write_buffer.add(collection, query, update, arr_filter,
+                                  kind, representation_id, file_id, site)
+        else:
+            self.connection.database[collection].update_one(
+                query,
+                update,
+                upsert=True,
+                array_filters=arr_filter
+            )
+
+        if priority is not None:
+            self.enqueue_sync(collection, [representation_id], site, priority)
 
         if progress is not None or priority is not None:
             return
@@ -1175,6 +1244,232 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
                          source_file=source_file,
                          error_str=error_str))
 
+    @property
+    def sync_queue(self):
+        if self._sync_queue is None:
+            self._sync_queue = SyncQueue()
+        return self._sync_queue
+
+    def enqueue_sync(self, collection, representation_ids, site_name,
+                     priority=None):
+        """
+            Push sync jobs of representations to queue in queue mode.
+
+        Args:
+            collection (string): project name
+            representation_ids (list): of ObjectId
+            site_name (string): site to be synchronized
+            priority (int): priority of jobs, keeps current if not passed
+        """
+        if not self.sync_queue_mode:
+            return
+        self.sync_queue.enqueue(collection, representation_ids, site_name,
+                                priority)
+
+    def dequeue_sync(self, collection, representation_ids, site_name=None):
+        """Remove sync jobs of representations from queue in queue mode."""
+        if not self.sync_queue_mode:
+            return
+        self.sync_queue.remove(collection, representation_ids, site_name)
+
+    def get_queued_representations(self, collection, active_site,
+                                   remote_site, limit=0):
+        """
+            Get representations of pending jobs from sync queue.
+
+            Replacement of 'get_sync_representations' in queue mode. Queue
+            is filled from all representations by full scan only when
+            'queue_reconcile_interval' elapsed since last scan of project.
+            Only representations matching state of sites are returned, jobs
+            are removed only for deleted representations.
+
+        Args:
+            collection (string): project name
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+            limit (int): max count of jobs, 0 for no limit
+
+        Returns:
+            (list) of dictionaries, ordered by priority
+        """
+        last_reconcile = self._last_reconcile.get(collection)
+        if (
+            last_reconcile is None
+            or time.time() - last_reconcile >= self.queue_reconcile_interval
+        ):
+            self.reconcile_sync_queue(collection, active_site, remote_site)
+
+        # Jobs are shared by all machines and their representations must
+        #   match the same site state as in 'get_sync_representations'
+        #   (e.g. upload only from site which already has the files)
+        match = self._get_sync_match(collection, active_site, remote_site)
+        database = self.connection.database[collection]
+        sites = [active_site, remote_site]
+        # pull only few more jobs than needed, next page is pulled only if
+        #   not enough representations match
+        page_size = self.QUEUE_CHUNK_SIZE
+        if limit:
+            page_size = min(limit * 2, page_size)
+
+        representations = []
+        # representation may have jobs of both sites
+        used_ids = set()
+        last_job = None
+        while True:
+            chunk = self.sync_queue.pull(collection, sites, page_size,
+                                         last_job)
+            if not chunk:
+                break
+            last_job = chunk[-1]
+            representation_ids = {
+                job["representation_id"]
+                for job in chunk
+                if job["representation_id"] not in used_ids
+            }
+            query = dict(match)
+            query["_id"] = {"$in": list(representation_ids)}
+            representations_by_id = {
+                repre["_id"]: repre
+                for repre in database.find(query)
+            }
+
+            # representations were deleted
+            missing_ids = representation_ids - set(representations_by_id)
+            if missing_ids:
+                existing_ids = database.distinct(
+                    "_id", {"_id": {"$in": list(missing_ids)}}
+                )
+                self.sync_queue.remove(
+                    collection, missing_ids - set(existing_ids)
+                )
+
+            for job in chunk:
+                representation = representations_by_id.pop(
+                    job["representation_id"], None)
+                if representation is None:
+                    continue
+                used_ids.add(representation["_id"])
+                representation["priority"] = job["priority"]
+                representations.append(representation)
+                if limit and len(representations) >= limit:
+                    return representations
+
+            if len(chunk) < page_size:
+                break
+        return representations
+
+    @time_function
+    def reconcile_sync_queue(self, collection, active_site, remote_site):
+        """
+            Push jobs of all representations which should be synchronized.
+
+            Catches changes made without pushing jobs (e.g. older clients or
+            manual changes in DB). Job is pushed for site which misses files,
+            'remote_site' for upload and 'active_site' for download.
+        """
+        self._last_reconcile[collection] = time.time()
+        representations = self.get_sync_representations(collection,
+                                                        active_site,
+                                                        remote_site)
+        retries_arr = self._get_retries_arr(collection)
+        ids_by_site_priority = {}
+        for repre in representations:
+            site_names = self._get_sites_to_sync(
+                repre, active_site, remote_site, retries_arr)
+            for site_name in site_names:
+                key = (site_name, repre.get("priority"))
+                ids_by_site_priority.setdefault(key, []).append(repre["_id"])
+
+        for (site_name, priority), representation_ids in (
+                ids_by_site_priority.items()):
+            self.sync_queue.enqueue(collection, representation_ids,
+                                    site_name, priority)
+        log.debug("Reconciled sync queue of {}".format(collection))
+
+    def _get_sites_to_sync(self, representation, active_site, remote_site,
+                           retries_arr):
+        """
+            Sites of 'representation' which should receive files.
+
+            Same split as in '_get_sync_match', upload to 'remote_site' when
+            'active_site' has files and download to 'active_site' when
+            'remote_site' has them.
+
+        Args:
+            representation (dict): with 'files' and their 'sites'
+            active_site (string): identifier of current active site
+            remote_site (string): identifier of remote site
+            retries_arr (list): allowed values of 'tries'
+
+        Returns:
+            (list) of site names
+        """
+        created = set()
+        pending = set()
+        for file in representation.get("files") or []:
+            for site in file.get("sites") or []:
+                site_name = site.get("name")
+                if "created_dt" in site:
+                    created.add(site_name)
+                elif site.get("tries") in retries_arr:
+                    pending.add(site_name)
+
+        site_names = []
+        if active_site in created and remote_site in pending:
+            site_names.append(remote_site)
+        if remote_site in created and active_site in pending:
+            site_names.append(active_site)
+        return site_names
+
+    def finish_sync_jobs(self, collection, representation_ids, sites):
+        """
+            Remove jobs of representations which don't need any sync.
+
+            Jobs are shared by all machines so state of sites is checked in
+            DB, not by result of check on this machine. Job of site is
+            finished when no file has record of the site which wasn't
+            synchronized yet and still can be retried.
+
+        Args:
+            collection (string): project name
+            representation_ids (list): of ObjectId
+            sites (list): of site names
+        """
+        if not representation_ids:
+            return
+        retries_arr = self._get_retries_arr(collection)
+        database = self.connection.database[collection]
+        for site_name in sites:
+            pending_ids = set(database.distinct("_id", {
+                "_id": {"$in": list(representation_ids)},
+                "files.sites": {
+                    "$elemMatch": {
+                        "name": site_name,
+                        "created_dt": {"$exists": False},
+                        "tries": {"$in": retries_arr}
+                    }
+                }
+            }))
+            self.sync_queue.remove(
+                collection,
+                set(representation_ids) - pending_ids,
+                site_name
+            )
+
+    def flush_db_updates(self, only_due=False):
+        """
+            Write buffered updates of sites to DB.
+
+        Args:
+            only_due (bool): write only if flush interval elapsed
+        """
+        if self.write_buffer is None:
+            return
+        if only_due:
+            self.write_buffer.flush_if_due()
+        else:
+            self.write_buffer.flush()
+
     def _get_file_info(self, files, _id):
         """
             Return record from list of records which name matches to 'provider'
@@ -1281,6 +1576,11 @@ class SyncServerModule(OpenPypeModule, ITrayModule):
             self._add_site(collection, query, representation, elem, site_name,
                            force)
 
+        if remove:
+            self.dequeue_sync(collection, [query["_id"]], site_name)
+        elif not pause:
+            self.enqueue_sync(collection, [query["_id"]], site_name)
+
     def _update_site(self, collection, query, update, arr_filter):
         """
             Auxiliary method to call update_one function on DB
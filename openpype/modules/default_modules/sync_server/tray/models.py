@@ -1,4 +1,5 @@
 import os
+import threading
 import attr
 from bson.objectid import ObjectId
 
@@ -36,16 +37,107 @@ class ProjectModel(QtCore.QAbstractListModel):
         return len(self._header)
 
 
+def _get_doc_value(doc, field):
+    """Value of 'field' (may be dotted path) in document or None."""
+    value = doc
+    for key in field.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _get_row_ranges(rows):
+    """Split sorted row indexes to ranges of consecutive rows."""
+    ranges = []
+    for row in rows:
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+    return ranges
+
+
+class _QueryWorker(QtCore.QObject):
+    """
+        Runs aggregate queries of model in background thread.
+
+        Only the latest request is processed, request which didn't start yet
+        is replaced by newer one. Thread ends when idle for a while.
+    """
+    IDLE_TIMEOUT = 30  # in seconds
+
+    query_finished = QtCore.Signal(object)
+
+    def __init__(self, parent=None):
+        super(_QueryWorker, self).__init__(parent)
+        self._condition = threading.Condition()
+        self._request = None
+        self._thread = None
+
+    def request(self, request_id, collection, pipeline):
+        with self._condition:
+            self._request = (request_id, collection, pipeline)
+            self._condition.notify()
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run)
+                self._thread.daemon = True
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if self._request is None:
+                    self._condition.wait(self.IDLE_TIMEOUT)
+                if self._request is None:
+                    self._thread = None
+                    return
+                request_id, collection, pipeline = self._request
+                self._request = None
+
+            result = None
+            try:
+                result = list(collection.aggregate(pipeline))
+            except Exception:
+                log.warning("Query of sync status failed", exc_info=True)
+
+            try:
+                self.query_finished.emit({
+                    "request_id": request_id,
+                    "result": result
+                })
+            except RuntimeError:
+                # model was already deleted
+                with self._condition:
+                    self._thread = None
+                return
+
+
 class _SyncRepresentationModel(QtCore.QAbstractTableModel):
 
     COLUMN_LABELS = []
 
     PAGE_SIZE = 20  # default page size to query for
     REFRESH_SEC = 5000  # in seconds, requery DB for new status
+    # unique field of row, last sort key for keyset pagination
+    KEYSET_FIELD = "_id"
 
     refresh_started = QtCore.Signal()
     refresh_finished = QtCore.Signal()
 
+    def _init_loading(self):
+        """
+            Prepares background loading of records.
+
+            Queries run in worker thread, results are processed in
+            '_on_query_finished' in GUI thread.
+        """
+        self._request_id = 0
+        self._request_kind = None
+        self._last_sort_values = None
+        self._query_worker = _QueryWorker(self)
+        self._query_worker.query_finished.connect(self._on_query_finished)
+
     @property
     def dbcon(self):
         """
@@ -125,7 +217,9 @@ class _SyncRepresentationModel(QtCore.QAbstractTableModel):
             Runs periodically (every X seconds) or by demand (change of
             sorting, filtering etc.)
 
-            Emits 'modelReset' signal.
+            Query runs in background, model is reset ('modelReset' signal)
+            when finished. If 'load_records' is passed, already loaded records
+            are updated in place and only changed rows emit 'dataChanged'.
 
             Args:
                 representations (PaginationResult object): pass result of
@@ -136,35 +230,162 @@ class _SyncRepresentationModel(QtCore.QAbstractTableModel):
         """
         if self.is_editing or not self.is_running:
             return
+
+        if representations:
+            self._reset_records(representations)
+            return
+
+        kind = "update" if load_records else "reset"
+        self._request_query(kind, load_records)
+
+    def _request_query(self, kind, limit=0, after=None):
+        """
+            Starts query in background thread.
+
+            Args:
+                kind (str): 'reset' - replace all records, 'update' - update
+                    loaded records, 'page' - append next page of records
+                limit (int): how many records should be queried
+                after (dict): sort values of last loaded record, records
+                    after it are queried
+        """
+        self._request_id += 1
+        self._request_kind = kind
+        self.query = self.get_query(limit, after)
+        self._query_worker.request(self._request_id, self.dbcon, self.query)
+
+    def _on_query_finished(self, data):
+        # result of older request (sort or filter was changed meanwhile)
+        if data["request_id"] != self._request_id:
+            return
+
+        kind = self._request_kind
+        self._request_kind = None
+        result = data["result"]
+        if result is None:
+            return
+
+        representations = iter(result)
+        if kind == "reset":
+            self._reset_records(representations)
+
+        elif kind == "update":
+            if not self.is_editing:
+                self._update_records(representations)
+
+        elif kind == "page":
+            self._append_records(representations)
+
+    def _reset_records(self, representations):
         self.refresh_started.emit()
         self.beginResetModel()
         self._data = []
         self._rec_loaded = 0
 
-        if not representations:
-            self.query = self.get_query(load_records)
-            representations = self.dbcon.aggregate(self.query)
-
         self.add_page_records(self.active_site, self.remote_site,
                               representations)
         self.endResetModel()
         self.refresh_finished.emit()
 
+    def _update_records(self, representations):
+        """
+            Replaces loaded records, emits 'dataChanged' for changed rows.
+
+            Model is reset if records were added, removed or reordered.
+        """
+        items = self.prepare_page_records(self.active_site, self.remote_site,
+                                          representations)
+        if [item._id for item in items] != [item._id for item in self._data]:
+            self.refresh_started.emit()
+            self.beginResetModel()
+            self._data = items
+            self._rec_loaded = len(items)
+            self.endResetModel()
+            self.refresh_finished.emit()
+            return
+
+        changed_rows = [
+            row
+            for row, (old_item, new_item) in enumerate(zip(self._data, items))
+            if old_item != new_item
+        ]
+        self._data = items
+        last_column = self.columnCount() - 1
+        for first_row, last_row in _get_row_ranges(changed_rows):
+            self.dataChanged.emit(self.index(first_row, 0),
+                                  self.index(last_row, last_column))
+
+    def _append_records(self, representations):
+        items = self.prepare_page_records(self.active_site, self.remote_site,
+                                          representations)
+        if not items:
+            return
+
+        first_row = len(self._data)
+        self.beginInsertRows(QtCore.QModelIndex(),
+                             first_row,
+                             first_row + len(items) - 1)
+        self._data.extend(items)
+        self._rec_loaded = len(self._data)
+        self.endInsertRows()
+
+    def add_page_records(self, local_site, remote_site, representations):
+        """
+            Process all records from 'representation' and add them to storage.
+
+            Args:
+                local_site (str): name of local site (mine)
+                remote_site (str): name of cloud provider (theirs)
+                representations (Mongo Cursor) - mimics result set, 1 object
+                    with paginatedResults array and totalCount array
+        """
+        items = self.prepare_page_records(local_site, remote_site,
+                                          representations)
+        self._data.extend(items)
+        self._rec_loaded = len(self._data)
+
+    def _read_page_result(self, representations):
+        """
+            Returns documents of page from result of aggregate query.
+
+            Stores total count of records and sort values of last document
+            for next page.
+        """
+        result = next(representations)
+        count = 0
+        total_count = result.get("totalCount")
+        if total_count:
+            count = total_count.pop().get('count')
+        self._total_records = count
+
+        repres = result.get("paginatedResults") or []
+        if repres:
+            last_repre = repres[-1]
+            self._last_sort_values = {
+                field: _get_doc_value(last_repre, field)
+                for field in self.get_sort()
+            }
+        return repres
+
     def tick(self):
         """
             Triggers refresh of model.
 
             Because of pagination, prepared (sorting, filtering) query needs
-            to be run on DB every X seconds.
+            to be run on DB every X seconds. Skipped if previous query is
+            still running.
         """
-        self.refresh(representations=None, load_records=self._rec_loaded)
+        if self._request_kind is None:
+            self.refresh(representations=None,
+                         load_records=self._rec_loaded)
         self.timer.start(self.REFRESH_SEC)
 
     def canFetchMore(self, _index):
         """
             Check if there are more records than currently loaded
         """
-        # 'skip' might be suboptimal when representation hits 500k+
+        if self._request_kind is not None:
+            return False
         return self._total_records > self._rec_loaded
 
     def fetchMore(self, index):
@@ -172,21 +393,73 @@ class _SyncRepresentationModel(QtCore.QAbstractTableModel):
             Add more record to model.
 
             Called when 'canFetchMore' returns true, which means there are
-            more records in DB than loaded.
+            more records in DB than loaded. Only next page after last loaded
+            record is queried, records are added when query finishes.
         """
         log.debug("fetchMore")
-        items_to_fetch = min(self._total_records - self._rec_loaded,
-                             self.PAGE_SIZE)
-        self.query = self.get_query(self._rec_loaded)
-        representations = self.dbcon.aggregate(self.query)
-        self.beginInsertRows(index,
-                             self._rec_loaded,
-                             self._rec_loaded + items_to_fetch - 1)
+        self._request_query("page", self.PAGE_SIZE, self._last_sort_values)
 
-        self.add_page_records(self.active_site, self.remote_site,
-                              representations)
+    def get_sort(self):
+        """
+            Returns sort with unique 'KEYSET_FIELD' as last key.
 
-        self.endInsertRows()
+            Returns:
+                (dict)
+        """
+        sort = {
+            key: value
+            for key, value in self.sort.items()
+            if key != self.KEYSET_FIELD
+        }
+        sort[self.KEYSET_FIELD] = 1
+        return sort
+
+    def get_keyset_match(self, after):
+        """
+            Returns '$match' condition for records after last loaded record.
+
+            Compares all sort keys so pagination doesn't need to skip already
+            loaded records. Aggregation comparison is used because it
+            compares values of different types same way as '$sort'.
+
+            Args:
+                after (dict): sort values of last loaded record
+            Returns:
+                (dict)
+        """
+        fields = list(self.get_sort().items())
+        branches = []
+        for idx, (field, order) in enumerate(fields):
+            conditions = [
+                {'$eq': [{'$ifNull': ['$' + prev_field, None]},
+                         after[prev_field]]}
+                for prev_field, _ in fields[:idx]
+            ]
+            operator = '$gt' if order == 1 else '$lt'
+            conditions.append(
+                {operator: [{'$ifNull': ['$' + field, None]}, after[field]]}
+            )
+            branches.append({'$and': conditions})
+        return {'$expr': {'$or': branches}}
+
+    def get_page_part(self, limit, after=None):
+        """
+            Returns '$facet' stage with records of page and total count.
+
+            Args:
+                limit (int): how many records should be returned
+                after (dict): sort values of last loaded record
+        """
+        paginated = []
+        if after:
+            paginated.append({'$match': self.get_keyset_match(after)})
+        paginated.append({'$limit': limit})
+        return {
+            '$facet': {
+                'paginatedResults': paginated,
+                'totalCount': [{'$count': 'count'}]
+            }
+        }
 
     def sort(self, index, order):
         """
@@ -222,14 +495,7 @@ class _SyncRepresentationModel(QtCore.QAbstractTableModel):
         # add default one
         self.sort['_id'] = 1
 
-        self.query = self.get_query()
-        # import json
-        # log.debug(json.dumps(self.query, indent=4).\
-        #           replace('False', 'false').\
-        #           replace('True', 'true').replace('None', 'null'))
-
-        representations = self.dbcon.aggregate(self.query)
-        self.refresh(representations)
+        self.refresh()
 
     def set_word_filter(self, word_filter):
         """
@@ -445,6 +711,7 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
         self.is_editing = False
 
         self._word_filter = None
+        self._init_loading()
 
         if not self._project or self._project == lib.DUMMY_PROJECT:
             return
@@ -460,12 +727,10 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
         self.query = self.get_query()
         self.default_query = list(self.get_query())
 
-        representations = self.dbcon.aggregate(self.query)
-        self.refresh(representations)
-
+        # first records are loaded in background when running
         self.timer = QtCore.QTimer()
         self.timer.timeout.connect(self.tick)
-        self.timer.start(self.REFRESH_SEC)
+        self.timer.start(0)
 
     def data(self, index, role):
         item = self._data[index.row()]
@@ -516,22 +781,20 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
         if role == Qt.UserRole:
             return item._id
 
-    def add_page_records(self, local_site, remote_site, representations):
+    def prepare_page_records(self, local_site, remote_site, representations):
         """
-            Process all records from 'representation' and add them to storage.
+            Process all records from 'representation' to model items.
 
             Args:
                 local_site (str): name of local site (mine)
                 remote_site (str): name of cloud provider (theirs)
                 representations (Mongo Cursor) - mimics result set, 1 object
                     with paginatedResults array and totalCount array
+            Returns:
+                (list) of SyncRepresentation
         """
-        result = representations.next()
-        count = 0
-        total_count = result.get("totalCount")
-        if total_count:
-            count = total_count.pop().get('count')
-        self._total_records = count
+        items = []
+        repres = self._read_page_result(representations)
 
         local_provider = lib.translate_provider_for_icon(self.sync_server,
                                                          self.project,
@@ -540,7 +803,7 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                                                           self.project,
                                                           remote_site)
 
-        for repre in result.get("paginatedResults"):
+        for repre in repres:
             files = repre.get("files", [])
             if isinstance(files, dict):  # aggregate returns dictionary
                 files = [files]
@@ -589,10 +852,10 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                 files[0].get('path')
             )
 
-            self._data.append(item)
-            self._rec_loaded += 1
+            items.append(item)
+        return items
 
-    def get_query(self, limit=0):
+    def get_query(self, limit=0, after=None):
         """
             Returns basic aggregate query for main table.
 
@@ -620,6 +883,8 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                     Should be overridden by value of loaded records for refresh
                     functionality (got more records by scrolling, refresh
                     shouldn't reset that)
+                after (dict): sort values of last loaded record, only
+                    records after it are returned (keyset pagination)
         """
         if limit == 0:
             limit = SyncRepresentationSummaryModel.PAGE_SIZE
@@ -746,16 +1011,10 @@ class SyncRepresentationSummaryModel(_SyncRepresentationModel):
                 {"$match": self.column_filtering}
             )
 
-        aggr.extend(
-            [{"$sort": self.sort},
-             {
-                '$facet': {
-                    'paginatedResults': [{'$skip': self._rec_loaded},
-                                         {'$limit': limit}],
-                    'totalCount': [{'$count': 'count'}]
-                }
-             }]
-        )
+        aggr.extend([
+            {"$sort": self.get_sort()},
+            self.get_page_part(limit, after)
+        ])
 
         return aggr
 
@@ -920,6 +1179,8 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
     ]
 
     PAGE_SIZE = 30
+    # rows are files of single representation
+    KEYSET_FIELD = "files._id"
     DEFAULT_SORT = {
         "files.path": 1
     }
@@ -978,6 +1239,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
 
         self.is_editing = False
         self.edit_icon = qtawesome.icon("fa.edit", color="white")
+        self._init_loading()
 
         self.sync_server = sync_server
         # TODO think about admin mode
@@ -988,12 +1250,11 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
         self.sort = self.DEFAULT_SORT
 
         self.query = self.get_query()
-        representations = self.dbcon.aggregate(self.query)
-        self.refresh(representations)
 
+        # first records are loaded in background when running
         self.timer = QtCore.QTimer()
         self.timer.timeout.connect(self.tick)
-        self.timer.start(SyncRepresentationSummaryModel.REFRESH_SEC)
+        self.timer.start(0)
 
     def data(self, index, role):
         item = self._data[index.row()]
@@ -1044,23 +1305,20 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
         if role == Qt.UserRole:
             return item._id
 
-    def add_page_records(self, local_site, remote_site, representations):
+    def prepare_page_records(self, local_site, remote_site, representations):
         """
-            Process all records from 'representation' and add them to storage.
+            Process all records from 'representation' to model items.
 
             Args:
                 local_site (str): name of local site (mine)
                 remote_site (str): name of cloud provider (theirs)
                 representations (Mongo Cursor) - mimics result set, 1 object
                     with paginatedResults array and totalCount array
+            Returns:
+                (list) of SyncRepresentationDetail
         """
-        # representations is a Cursor, get first
-        result = representations.next()
-        count = 0
-        total_count = result.get("totalCount")
-        if total_count:
-            count = total_count.pop().get('count')
-        self._total_records = count
+        items = []
+        repres = self._read_page_result(representations)
 
         local_provider = lib.translate_provider_for_icon(self.sync_server,
                                                          self.project,
@@ -1069,7 +1327,7 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
                                                           self.project,
                                                           remote_site)
 
-        for repre in result.get("paginatedResults"):
+        for repre in repres:
             # log.info("!!! repre:: {}".format(repre))
             files = repre.get("files", [])
             if isinstance(files, dict):  # aggregate returns dictionary
@@ -1117,16 +1375,21 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
                     file.get('path')
 
                 )
-                self._data.append(item)
-                self._rec_loaded += 1
+                items.append(item)
+        return items
 
-    def get_query(self, limit=0):
+    def get_query(self, limit=0, after=None):
         """
             Gets query that gets used when no extra sorting, filtering or
             projecting is needed.
 
             Called for basic table view.
 
+            Args:
+                limit (int): how many records should be returned
+                after (dict): sort values of last loaded record, only
+                    records after it are returned (keyset pagination)
+
             Returns:
                 [(dict)] - list with single dict - appropriate for aggregate
                     function for MongoDB
@@ -1250,14 +1513,8 @@ class SyncRepresentationDetailModel(_SyncRepresentationModel):
             print(self.column_filtering)
 
         aggr.extend([
-            {"$sort": self.sort},
-            {
-                '$facet': {
-                    'paginatedResults': [{'$skip': self._rec_loaded},
-                                         {'$limit': limit}],
-                    'totalCount': [{'$count': 'count'}]
-                }
-            }
+            {"$sort": self.get_sort()},
+            self.get_page_part(limit, after)
         ])
 
         return aggr
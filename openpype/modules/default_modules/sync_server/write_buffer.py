@@ -0,0 +1,166 @@
+"""Write-behind buffer of site updates stored to representations.
+
+Each processed file triggers multiple writes to DB (progress ticks, success
+or failure). Updates are collected in the buffer keyed by file and site,
+only the latest state of each key is kept and all pending updates are
+written with single 'bulk_write' per project.
+"""
+import time
+import threading
+import collections
+
+from pymongo import UpdateOne
+
+from openpype.lib import PypeLogger
+
+log = PypeLogger().get_logger("SyncServer")
+
+# kinds of updates with final state of file on site, progress tick
+# cannot overwrite them
+FINAL_KINDS = ("success", "error")
+
+
+class SyncWriteBuffer(object):
+    """Coalesce site updates of representations and write them in bulk.
+
+    Args:
+        get_collection (callable): Returns DB collection for project name.
+        flush_interval (float): Max seconds pending updates wait in buffer.
+        batch_size (int): Flush immediately when count of pending updates
+            reaches this size.
+    """
+
+    def __init__(self, get_collection, flush_interval=5, batch_size=500):
+        self._get_collection = get_collection
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+
+        self._lock = threading.RLock()
+        self._pending = collections.OrderedDict()
+        self._last_flush = time.time()
+
+        self.requested = 0
+        self.coalesced = 0
+        self.written = 0
+        self.bulk_writes = 0
+
+    @property
+    def writes_avoided(self):
+        """Count of DB requests saved against writing each update."""
+        return self.requested - self.bulk_writes
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, collection, query, update, arr_filter, kind,
+            representation_id, file_id, site):
+        """Add update of site record, replaces pending update of same key.
+
+        Args:
+            collection (str): project name
+            query (dict): query of representation
+            update (dict): update of site record
+            arr_filter (list): array filters of update
+            kind (str): 'success', 'error' or 'progress'
+            representation_id (ObjectId): id of representation
+            file_id (ObjectId): id of file
+            site (str): name of site
+        """
+        key = (collection, representation_id, file_id, site)
+        with self._lock:
+            self.requested += 1
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+                if kind == "progress" and pending["kind"] in FINAL_KINDS:
+                    return
+                self._pending.pop(key)
+                update = self._merge_updates(pending["update"], update)
+
+            self._pending[key] = {
+                "collection": collection,
+                "kind": kind,
+                "query": query,
+                "update": update,
+                "arr_filter": arr_filter
+            }
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+
+    @staticmethod
+    def _merge_updates(previous, update):
+        """Single update with same result as 'previous' and 'update'.
+
+        Fields of 'previous' untouched by 'update' are kept (e.g. transfer
+        checkpoint stored with progress is not lost by failure).
+        """
+        touched_keys = set()
+        for values in update.values():
+            touched_keys.update(values.keys())
+
+        merged = {
+            operator: dict(values)
+            for operator, values in update.items()
+        }
+        for operator, values in previous.items():
+            for field, value in values.items():
+                if field not in touched_keys:
+                    merged.setdefault(operator, {})[field] = value
+        return merged
+
+    def flush_if_due(self):
+        """Flush pending updates if 'flush_interval' elapsed."""
+        if time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write all pending updates, one 'bulk_write' per project."""
+        with self._lock:
+            pending = self._pending
+            self._pending = collections.OrderedDict()
+            self._last_flush = time.time()
+
+            items_by_collection = collections.OrderedDict()
+            for key, item in pending.items():
+                items_by_collection.setdefault(
+                    item["collection"], []
+                ).append((key, item))
+
+            for collection, items in items_by_collection.items():
+                operations = [
+                    UpdateOne(item["query"], item["update"], upsert=True,
+                              array_filters=item["arr_filter"])
+                    for _, item in items
+                ]
+                try:
+                    self._get_collection(collection).bulk_write(
+                        operations, ordered=True
+                    )
+                except Exception:
+                    log.warning(
+                        "Writing of {} sync updates to '{}' failed, will be"
+                        " retried with next flush".format(
+                            len(operations), collection
+                        ), exc_info=True
+                    )
+                    self._requeue(items)
+                    continue
+                self.bulk_writes += 1
+                self.written += len(operations)
+
+        if pending:
+            log.debug(self.report())
+
+    def _requeue(self, items):
+        """Return not written updates to buffer, newer updates are kept."""
+        for key, item in items:
+            if key not in self._pending:
+                self._pending[key] = item
+
+    def report(self):
+        """Short message about written updates and avoided writes."""
+        return (
+            "Sync updates: {} requested, {} coalesced, {} written in {}"
+            " bulk writes ({} writes avoided)"
+        ).format(self.requested, self.coalesced, self.written,
+                 self.bulk_writes, self.writes_avoided)
@@ -6,7 +6,7 @@ from Qt import QtWidgets, QtCore, QtGui
 from avalon import api, style
 from avalon.api import AvalonMongoDB
 
-from openpype.api import Anatomy, config
+from openpype.api import get_anatomy, config
 from openpype import resources
 
 from openpype.lib.delivery import (
@@ -59,7 +59,7 @@ class DeliveryOptionsDialog(QtWidgets.QDialog):
         super(DeliveryOptionsDialog, self).__init__(parent=parent)
 
         project = contexts[0]["project"]["name"]
-        self.anatomy = Anatomy(project)
+        self.anatomy = get_anatomy(project)
         self._representations = None
         self.log = log
         self.currently_uploaded = 0
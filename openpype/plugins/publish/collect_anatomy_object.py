@@ -7,7 +7,7 @@ Provides:
     context -> anatomy (pype.api.Anatomy)
 """
 import os
-from openpype.api import Anatomy
+from openpype.api import get_anatomy
 import pyblish.api
 
 
@@ -25,7 +25,7 @@ class CollectAnatomyObject(pyblish.api.ContextPlugin):
                 "Could not initialize project's Anatomy."
             )
 
-        context.data["anatomy"] = Anatomy(project_name)
+        context.data["anatomy"] = get_anatomy(project_name)
 
         self.log.info(
             "Anatomy object collected for project \"{}\".".format(project_name)
@@ -15,6 +15,7 @@ import openpype
 import openpype.api
 from openpype.lib import (
     get_pype_execute_args,
+    ffprobe_streams,
     should_decompress,
     get_decompress_dir,
     decompress,
@@ -69,6 +70,9 @@ class ExtractBurnin(openpype.api.Extractor):
     profiles = None
     options = None
 
+    # Render burnins in current process if burnin script can be imported
+    render_in_process = True
+
     def process(self, instance):
         # ffmpeg doesn't support multipart exrs
         if instance.data.get("multipartExr") is True:
@@ -166,6 +170,9 @@ class ExtractBurnin(openpype.api.Extractor):
             first_output = True
 
             files_to_delete = []
+            variants = []
+            decompressed_dir = ""
+            decompressed_input_path = None
             for filename_suffix, burnin_def in repre_burnin_defs.items():
                 new_repre = copy.deepcopy(repre)
 
@@ -198,10 +205,12 @@ class ExtractBurnin(openpype.api.Extractor):
                 # Prepare paths and files for process.
                 self.input_output_paths(new_repre, temp_data, filename_suffix)
 
-                decompressed_dir = ''
+                # Decompress input only once for all burnin definitions
                 full_input_path = temp_data["full_input_path"]
-                do_decompress = should_decompress(full_input_path)
-                if do_decompress:
+                if (
+                    decompressed_input_path is None
+                    and should_decompress(full_input_path)
+                ):
                     decompressed_dir = get_decompress_dir()
 
                     decompress(
@@ -214,54 +223,17 @@ class ExtractBurnin(openpype.api.Extractor):
 
                     # input path changed, 'decompressed' added
                     input_file = os.path.basename(full_input_path)
-                    temp_data["full_input_path"] = os.path.join(
+                    decompressed_input_path = os.path.join(
                         decompressed_dir,
                         input_file)
 
-                # Data for burnin script
-                script_data = {
-                    "input": temp_data["full_input_path"],
-                    "output": temp_data["full_output_path"],
-                    "burnin_data": burnin_data,
-                    "options": copy.deepcopy(burnin_options),
-                    "values": burnin_values,
-                    "full_input_path": temp_data["full_input_paths"][0],
-                    "first_frame": temp_data["first_frame"]
-                }
-
-                self.log.debug(
-                    "script_data: {}".format(json.dumps(script_data, indent=4))
-                )
-
-                # Dump data to string
-                dumped_script_data = json.dumps(script_data)
-
-                # Store dumped json to temporary file
-                temporary_json_file = tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".json", delete=False
-                )
-                temporary_json_file.write(dumped_script_data)
-                temporary_json_file.close()
-                temporary_json_filepath = temporary_json_file.name.replace(
-                    "\\", "/"
-                )
-
-                # Prepare subprocess arguments
-                args = list(executable_args)
-                args.append(temporary_json_filepath)
-                self.log.debug("Executing: {}".format(" ".join(args)))
-
-                # Run burnin script
-                process_kwargs = {
-                    "logger": self.log,
-                    "env": {}
-                }
-                if platform.system().lower() == "windows":
-                    process_kwargs["creationflags"] = CREATE_NO_WINDOW
+                if decompressed_input_path:
+                    temp_data["full_input_path"] = decompressed_input_path
 
-                openpype.api.run_subprocess(args, **process_kwargs)
-                # Remove the temporary json
-                os.remove(temporary_json_filepath)
+                variants.append({
+                    "output": temp_data["full_output_path"],
+                    "values": burnin_values
+                })
 
                 for filepath in temp_data["full_input_paths"]:
                     filepath = filepath.replace("\\", "/")
@@ -271,6 +243,21 @@ class ExtractBurnin(openpype.api.Extractor):
                 # Add new representation to instance
                 instance.data["representations"].append(new_repre)
 
+            # Data for burnin script
+            script_data = {
+                "input": temp_data["full_input_path"],
+                "variants": variants,
+                "burnin_data": burnin_data,
+                "options": copy.deepcopy(burnin_options),
+                "full_input_path": temp_data["full_input_paths"][0],
+                "first_frame": temp_data["first_frame"],
+                # Source is probed only once for all variants
+                "streams": ffprobe_streams(
+                    temp_data["full_input_paths"][0], self.log
+                )
+            }
+            self.render_burnins(script_data, executable_args)
+
             # Remove source representation
             # NOTE we maybe can keep source representation if necessary
             instance.data["representations"].remove(repre)
@@ -281,9 +268,75 @@ class ExtractBurnin(openpype.api.Extractor):
                     os.remove(filepath)
                     self.log.debug("Removed: \"{}\"".format(filepath))
 
-            if do_decompress and os.path.exists(decompressed_dir):
+            if decompressed_dir and os.path.exists(decompressed_dir):
                 shutil.rmtree(decompressed_dir)
 
+    def render_burnins(self, script_data, executable_args):
+        """Render all burnin variants of one representation.
+
+        Variants are rendered in current process with single ffmpeg process
+        when burnin script can be imported (Python 3 with OpenTimelineIO).
+        Otherwise burnin script is launched once in OpenPype process.
+
+        Args:
+            script_data (dict): Data for burnin script.
+            executable_args (list): Arguments launching burnin script.
+        """
+        self.log.debug(
+            "script_data: {}".format(json.dumps(script_data, indent=4))
+        )
+        otio_burnin = None
+        if self.render_in_process and six.PY3:
+            try:
+                from openpype.scripts import otio_burnin
+            except ImportError:
+                self.log.debug(
+                    "Burnin script can't be imported in current process.",
+                    exc_info=True
+                )
+
+        if otio_burnin is not None:
+            otio_burnin.burnin_variants_from_data(
+                script_data["input"],
+                script_data["variants"],
+                copy.deepcopy(script_data["burnin_data"]),
+                options=script_data["options"],
+                full_input_path=script_data["full_input_path"],
+                first_frame=script_data["first_frame"],
+                streams=script_data["streams"]
+            )
+            return
+
+        # Dump data to string
+        dumped_script_data = json.dumps(script_data)
+
+        # Store dumped json to temporary file
+        temporary_json_file = tempfile.NamedTemporaryFile(
+            mode="w", suffix=".json", delete=False
+        )
+        temporary_json_file.write(dumped_script_data)
+        temporary_json_file.close()
+        temporary_json_filepath = temporary_json_file.name.replace(
+            "\\", "/"
+        )
+
+        # Prepare subprocess arguments
+        args = list(executable_args)
+        args.append(temporary_json_filepath)
+        self.log.debug("Executing: {}".format(" ".join(args)))
+
+        # Run burnin script
+        process_kwargs = {
+            "logger": self.log,
+            "env": {}
+        }
+        if platform.system().lower() == "windows":
+            process_kwargs["creationflags"] = CREATE_NO_WINDOW
+
+        openpype.api.run_subprocess(args, **process_kwargs)
+        # Remove the temporary json
+        os.remove(temporary_json_filepath)
+
     def _get_burnin_options(self):
         # Prepare burnin options
         burnin_options = copy.deepcopy(self.default_options)
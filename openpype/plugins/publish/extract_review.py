@@ -2,12 +2,18 @@ import os
 import re
 import copy
 import json
+import time
 
 from abc import ABCMeta, abstractmethod
 import six
 
 import clique
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None
+
 import pyblish.api
 import openpype.api
 from openpype.lib import (
@@ -62,6 +68,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
     # Preset attributes
     profiles = None
 
+    # How many ffmpeg processes can run at once
+    concurrent_jobs = 1
+    # Decode input once for multiple outputs with the same input arguments
+    #   using ffmpeg's 'split' filter and multiple outputs in one process
+    decode_once = False
+
     def process(self, instance):
         self.log.debug(str(instance.data["representations"]))
         # Skip review when requested.
@@ -127,6 +139,8 @@ class ExtractReview(pyblish.api.InstancePlugin):
             definition["filename_suffix"] = filename_suffix
             profile_outputs.append(definition)
 
+        # Prepare all ffmpeg jobs first so they can run at once
+        jobs = []
         # Loop through representations
         for repre in tuple(instance.data["representations"]):
             repre_name = str(repre.get("name"))
@@ -171,6 +185,17 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 ).format(str(tags)))
                 continue
 
+            files_to_clean = []
+            if self.input_is_sequence(repre):
+                self.log.info("Filling gaps in sequence.")
+                files_to_clean = self.fill_sequence_gaps(
+                    repre["files"],
+                    repre["stagingDir"],
+                    instance.data["frameStart"],
+                    instance.data["frameEnd"]
+                )
+            repre_jobs = []
+            unsupported_input = False
             for _output_def in outputs:
                 output_def = copy.deepcopy(_output_def)
                 # Make sure output definition has "tags" key
@@ -195,63 +220,228 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
                 temp_data = self.prepare_temp_data(
                     instance, repre, output_def)
-                files_to_clean = []
-                if temp_data["input_is_sequence"]:
-                    self.log.info("Filling gaps in sequence.")
-                    files_to_clean = self.fill_sequence_gaps(
-                        temp_data["origin_repre"]["files"],
-                        new_repre["stagingDir"],
-                        temp_data["frame_start"],
-                        temp_data["frame_end"])
 
                 try:  # temporary until oiiotool is supported cross platform
-                    ffmpeg_args = self._ffmpeg_arguments(
+                    ffmpeg_arg_parts = self._ffmpeg_argument_parts(
                         output_def, instance, new_repre, temp_data
                     )
                 except ZeroDivisionError:
                     if 'exr' in temp_data["origin_repre"]["ext"]:
                         self.log.debug("Unsupported compression on input " +
                                        "files. Skipping!!!")
-                        return
+                        unsupported_input = True
+                        break
                     raise NotImplementedError
 
-                subprcs_cmd = " ".join(ffmpeg_args)
+                repre_jobs.append({
+                    "new_repre": new_repre,
+                    "output_def": output_def,
+                    "temp_data": temp_data,
+                    "arg_parts": ffmpeg_arg_parts
+                })
 
-                # run subprocess
-                self.log.debug("Executing: {}".format(subprcs_cmd))
+            if repre_jobs:
+                # Filled gaps are removed after last job of representation
+                repre_jobs[-1]["files_to_clean"] = files_to_clean
+                jobs.extend(repre_jobs)
+            else:
+                self._remove_files(files_to_clean)
 
-                openpype.api.run_subprocess(
-                    subprcs_cmd, shell=True, logger=self.log
-                )
+            # Skip all other outputs
+            if unsupported_input:
+                break
 
-                # delete files added to fill gaps
-                if files_to_clean:
-                    for f in files_to_clean:
-                        os.unlink(f)
-
-                output_name = output_def["filename_suffix"]
-                if temp_data["without_handles"]:
-                    output_name += "_noHandles"
-
-                new_repre.update({
-                    "name": output_def["filename_suffix"],
-                    "outputName": output_name,
-                    "outputDef": output_def,
-                    "frameStartFtrack": temp_data["output_frame_start"],
-                    "frameEndFtrack": temp_data["output_frame_end"]
-                })
+        self.run_ffmpeg_jobs(jobs)
+
+        # Add new representations in order of output definitions
+        for job in jobs:
+            new_repre = job["new_repre"]
+            output_def = job["output_def"]
+            temp_data = job["temp_data"]
+
+            output_name = output_def["filename_suffix"]
+            if temp_data["without_handles"]:
+                output_name += "_noHandles"
+
+            new_repre.update({
+                "name": output_def["filename_suffix"],
+                "outputName": output_name,
+                "outputDef": output_def,
+                "frameStartFtrack": temp_data["output_frame_start"],
+                "frameEndFtrack": temp_data["output_frame_end"]
+            })
+
+            # Force to pop these key if are in new repre
+            new_repre.pop("preview", None)
+            new_repre.pop("thumbnail", None)
+            if "clean_name" in new_repre.get("tags", []):
+                new_repre.pop("outputName")
+
+            # adding representation
+            self.log.debug(
+                "Adding new representation: {}".format(new_repre)
+            )
+            instance.data["representations"].append(new_repre)
+
+    def _remove_files(self, filepaths):
+        for filepath in filepaths:
+            os.unlink(filepath)
+
+    def run_ffmpeg_jobs(self, jobs):
+        """Run prepared ffmpeg jobs.
+
+        Jobs with the same input arguments are merged to one ffmpeg process
+        if 'decode_once' is enabled. Processes run in a pool of
+        'concurrent_jobs' size. Files filling gaps of input sequences are
+        removed when all jobs using them are finished.
 
-                # Force to pop these key if are in new repre
-                new_repre.pop("preview", None)
-                new_repre.pop("thumbnail", None)
-                if "clean_name" in new_repre.get("tags", []):
-                    new_repre.pop("outputName")
+        Args:
+            jobs (list): Prepared jobs with ffmpeg arguments parts.
+        """
+        if not jobs:
+            return
 
-                # adding representation
+        commands = []
+        if self.decode_once:
+            for job_group in self.group_jobs_by_input(jobs):
+                commands.append(self.merged_ffmpeg_args(job_group))
+        else:
+            for job in jobs:
+                commands.append(self.ffmpeg_full_args(*job["arg_parts"]))
+
+        # Files filling gaps must exist until all processes are finished
+        files_to_clean = []
+        for job in jobs:
+            files_to_clean.extend(job.get("files_to_clean") or [])
+
+        concurrent_jobs = max(1, int(self.concurrent_jobs or 1))
+        if ThreadPoolExecutor is None:
+            concurrent_jobs = 1
+
+        start = time.time()
+        try:
+            if concurrent_jobs == 1 or len(commands) == 1:
+                for command in commands:
+                    self._run_ffmpeg(command)
+            else:
                 self.log.debug(
-                    "Adding new representation: {}".format(new_repre)
+                    "Running {} ffmpeg processes ({} at once)".format(
+                        len(commands), concurrent_jobs
+                    )
+                )
+                # Threads only wait for ffmpeg processes
+                with ThreadPoolExecutor(concurrent_jobs) as executor:
+                    futures = [
+                        executor.submit(self._run_ffmpeg, command)
+                        for command in commands
+                    ]
+                    # Raise first error in order of jobs
+                    for future in futures:
+                        future.result()
+        finally:
+            self._remove_files(files_to_clean)
+
+        self.log.debug(
+            "{} outputs rendered with {} ffmpeg processes in {:.2f}s".format(
+                len(jobs), len(commands), time.time() - start
+            )
+        )
+
+    def _run_ffmpeg(self, ffmpeg_args):
+        subprcs_cmd = " ".join(ffmpeg_args)
+
+        # run subprocess
+        self.log.debug("Executing: {}".format(subprcs_cmd))
+
+        openpype.api.run_subprocess(
+            subprcs_cmd, shell=True, logger=self.log
+        )
+
+    def group_jobs_by_input(self, jobs):
+        """Group jobs which can be processed with one ffmpeg process.
+
+        Jobs are grouped when they have the same input arguments, only one
+        input and no audio filters. Filters must not use labeled pads as
+        these would clash in combined filter graph.
+
+        Returns:
+            list: Groups of jobs. Order of jobs is kept.
+        """
+        groups = []
+        groups_by_input = {}
+        for job in jobs:
+            input_args, video_filters, audio_filters, output_args = (
+                job["arg_parts"]
+            )
+            key = None
+            mergeable = (
+                not audio_filters
+                and len([arg for arg in input_args if arg.startswith("-i ")])
+                == 1
+                and not any("[" in value for value in video_filters)
+                and not any(
+                    arg.startswith(("-map", "-filter_complex", "-lavfi"))
+                    for arg in output_args
                 )
-                instance.data["representations"].append(new_repre)
+            )
+            if mergeable:
+                key = tuple(input_args)
+
+            if key is not None and key in groups_by_input:
+                groups_by_input[key].append(job)
+                continue
+
+            group = [job]
+            groups.append(group)
+            if key is not None:
+                groups_by_input[key] = group
+        return groups
+
+    def merged_ffmpeg_args(self, jobs):
+        """Arguments of one ffmpeg process rendering multiple outputs.
+
+        Input is decoded once and split into filter chain of each output.
+
+        Args:
+            jobs (list): Jobs with the same input arguments.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        if len(jobs) == 1:
+            return self.ffmpeg_full_args(*jobs[0]["arg_parts"])
+
+        input_args = jobs[0]["arg_parts"][0]
+        filter_chains = []
+        output_parts = []
+        for idx, job in enumerate(jobs):
+            _, video_filters, audio_filters, output_args = job["arg_parts"]
+            video_filters = list(video_filters)
+            output_args = self.move_filter_args(
+                output_args, video_filters, list(audio_filters)
+            )
+            filter_chains.append("[in{0}]{1}[out{0}]".format(
+                idx, ",".join(video_filters) or "null"
+            ))
+            map_args = ["-map", "\"[out{}]\"".format(idx)]
+            if not job["temp_data"]["output_ext_is_image"]:
+                map_args.extend(["-map", "0:a?"])
+            output_parts.append(map_args + output_args)
+
+        split_filter = "[0:v]split={}{}".format(
+            len(jobs),
+            "".join("[in{}]".format(idx) for idx in range(len(jobs)))
+        )
+        all_args = []
+        all_args.append("\"{}\"".format(self.ffmpeg_path))
+        all_args.extend(input_args)
+        all_args.append("-filter_complex")
+        all_args.append("\"{}\"".format(
+            ";".join([split_filter] + filter_chains)
+        ))
+        for output_args in output_parts:
+            all_args.extend(output_args)
+        return all_args
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -349,6 +539,25 @@ class ExtractReview(pyblish.api.InstancePlugin):
     def _ffmpeg_arguments(self, output_def, instance, new_repre, temp_data):
         """Prepares ffmpeg arguments for expected extraction.
 
+        Args:
+            output_def (dict): Currently processed output definition.
+            instance (Instance): Currently processed instance.
+            new_repre (dict): Representation representing output of this
+                process.
+            temp_data (dict): Base data for successful process.
+
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def, instance, new_repre, temp_data
+        ))
+
+    def _ffmpeg_argument_parts(
+        self, output_def, instance, new_repre, temp_data
+    ):
+        """Prepares parts of ffmpeg arguments for expected extraction.
+
         Prepares input and output arguments based on output definition and
         input files.
 
@@ -358,6 +567,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             new_repre (dict): Representation representing output of this
                 process.
             temp_data (dict): Base data for successful process.
+
+        Returns:
+            tuple: Input arguments, video filters, audio filters and output
+                arguments.
         """
 
         # Get FFmpeg arguments from profile presets
@@ -541,7 +754,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "\"{}\"".format(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -589,6 +802,38 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self.move_filter_args(
+            output_args, video_filters, audio_filters
+        )
+
+        all_args = []
+        all_args.append("\"{}\"".format(self.ffmpeg_path))
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append("-filter:v")
+            all_args.append("\"{}\"".format(",".join(video_filters)))
+
+        if audio_filters:
+            all_args.append("-filter:a")
+            all_args.append("\"{}\"".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def move_filter_args(self, output_args, video_filters, audio_filters):
+        """Move filters from output arguments to lists of filters.
+
+        Args:
+            output_args (list): Output arguments.
+            video_filters (list): Video filters where are video filters from
+                output arguments added.
+            audio_filters (list): Audio filters where are audio filters from
+                output arguments added.
+
+        Returns:
+            list: Output arguments without filters.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -606,28 +851,15 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
 
-        all_args = []
-        all_args.append("\"{}\"".format(self.ffmpeg_path))
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v")
-            all_args.append("\"{}\"".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a")
-            all_args.append("\"{}\"".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def fill_sequence_gaps(self, files, staging_dir, start_frame, end_frame):
         # type: (list, str, int, int) -> list
-        """Fill missing files in sequence by duplicating existing ones.
+        """Fill missing files in sequence by linking existing ones.
 
-        This will take nearest frame file and copy it with so as to fill
-        gaps in sequence. Last existing file there is is used to for the
-        hole ahead.
+        Each hole is filled with nearest previous existing frame. Files are
+        hardlinked (or symlinked) so no data are copied, copy is used only
+        when filesystem does not support links.
 
         Args:
             files (list): List of representation files.
@@ -646,64 +878,60 @@ class ExtractReview(pyblish.api.InstancePlugin):
         collections = clique.assemble(files)[0]
         assert len(collections) == 1, "Multiple collections found."
         col = collections[0]
+        indexes = sorted(col.indexes)
         # do nothing if sequence is complete
-        if list(col.indexes)[0] == start_frame and \
-                list(col.indexes)[-1] == end_frame and \
-                col.is_contiguous():
+        if (
+            indexes[0] == start_frame
+            and indexes[-1] == end_frame
+            and col.is_contiguous()
+        ):
             return []
 
-        holes = col.holes()
-
-        # generate ideal sequence
-        complete_col = clique.assemble(
-            [("{}{:0" + str(col.padding) + "d}{}").format(
-                col.head, f, col.tail
-            ) for f in range(start_frame, end_frame)]
-        )[0][0]  # type: clique.Collection
-
-        new_files = {}
-        last_existing_file = None
-
-        for idx in holes.indexes:
-            # get previous existing file
-            test_file = os.path.normpath(os.path.join(
-                staging_dir,
-                ("{}{:0" + str(complete_col.padding) + "d}{}").format(
-                    complete_col.head, idx - 1, complete_col.tail)))
-            if os.path.isfile(test_file):
-                new_files[idx] = test_file
-                last_existing_file = test_file
-            else:
-                if not last_existing_file:
-                    # previous file is not found (sequence has a hole
-                    # at the beginning. Use first available frame
-                    # there is.
-                    try:
-                        last_existing_file = list(col)[0]
-                    except IndexError:
-                        # empty collection?
-                        raise AssertionError(
-                            "Invalid sequence collected")
-                new_files[idx] = os.path.normpath(
-                    os.path.join(staging_dir, last_existing_file))
-
+        filename_template = "{}{{:0{}d}}{}".format(
+            col.head, col.padding, col.tail
+        )
         files_to_clean = []
-        if new_files:
-            # so now new files are dict with missing frame as a key and
-            # existing file as a value.
-            for frame, file in new_files.items():
-                self.log.info(
-                    "Filling gap {} with {}".format(frame, file))
+        # Holes are between consecutive existing frames
+        for previous_idx, next_idx in zip(indexes, indexes[1:]):
+            if next_idx - previous_idx < 2:
+                continue
 
+            src = os.path.normpath(os.path.join(
+                staging_dir, filename_template.format(previous_idx)
+            ))
+            self.log.debug("Filling gap {}-{} with {}".format(
+                previous_idx + 1, next_idx - 1, src
+            ))
+            for frame in range(previous_idx + 1, next_idx):
                 hole = os.path.join(
-                    staging_dir,
-                    ("{}{:0" + str(col.padding) + "d}{}").format(
-                        col.head, frame, col.tail))
-                speedcopy.copyfile(file, hole)
+                    staging_dir, filename_template.format(frame)
+                )
+                self.link_frame(src, hole)
                 files_to_clean.append(hole)
 
+        self.log.info("Filled {} missing frames.".format(len(files_to_clean)))
         return files_to_clean
 
+    def link_frame(self, src, dst):
+        """Create file with content of source file without copying data.
+
+        Hardlink is tried first, then symlink and file is copied only if
+        links are not supported.
+        """
+        try:
+            os.link(src, dst)
+            return
+        except (OSError, AttributeError):
+            pass
+
+        try:
+            os.symlink(src, dst)
+            return
+        except (OSError, AttributeError, NotImplementedError):
+            pass
+
+        speedcopy.copyfile(src, dst)
+
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
 
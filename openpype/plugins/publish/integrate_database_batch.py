@@ -0,0 +1,20 @@
+import pyblish.api
+
+
+class IntegrateDatabaseBatch(pyblish.api.ContextPlugin):
+    """Write database documents of all integrated instances at once.
+
+    Documents are collected by 'IntegrateAssetNew' when it has enabled
+    'batch_database_writes'. Written changes are reverted if writing fails.
+    """
+
+    label = "Integrate Database Batch"
+    order = pyblish.api.IntegratorOrder + 0.005
+
+    def process(self, context):
+        batch = context.data.get("integrateDatabaseBatch")
+        if batch is None or batch.discarded:
+            return
+
+        batch.commit()
+        self.log.info(batch.report())
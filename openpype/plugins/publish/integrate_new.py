@@ -1,5 +1,4 @@
 import os
-from os.path import getsize
 import logging
 import sys
 import copy
@@ -19,12 +18,8 @@ from datetime import datetime
 # from pype.modules import ModulesManager
 from openpype.lib.profiles_filtering import filter_profiles
 from openpype.lib import prepare_template_data
-
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
+from openpype.lib.file_transfer import FileTransferEngine, content_hashes
+from openpype.lib.database_batch import DatabaseWriteBatch
 
 log = logging.getLogger(__name__)
 
@@ -108,30 +103,110 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
     default_template_name = "publish"
     template_name_profiles = None
 
+    # Transfer engine options
+    transfer_workers = 4
+    transfer_max_retries = 3
+    transfer_verify_checksum = False
+
+    # Write database documents of all instances at once
+    #   - documents are written by 'IntegrateDatabaseBatch' plugin
+    batch_database_writes = False
+
+    # Hardlink files with the same content as already published files
+    #   instead of copying them
+    content_hash_deduplication = False
+
     # file_url : file_size of all published and uploaded files
     integrated_file_sizes = {}
+    # file_url : content hash of all published files
+    integrated_content_hashes = {}
 
     TMP_FILE_EXT = 'tmp'  # suffix to denote temporary files, use without '.'
 
     def process(self, instance):
         self.integrated_file_sizes = {}
+        self.integrated_content_hashes = {}
         if [ef for ef in self.exclude_families
                 if instance.data["family"] in ef]:
             return
 
+        batch = self.get_database_batch(instance.context)
+        self._validate_database_batch(batch)
         try:
-            self.register(instance)
+            self.register(instance, batch)
+            # Batch callbacks would never be called if batch was discarded
+            self._validate_database_batch(batch)
             self.log.info("Integrated Asset in to the database ...")
             self.log.info("instance.data: {}".format(instance.data))
-            self.handle_destination_files(self.integrated_file_sizes,
-                                          'finalize')
+            if batch is None:
+                self.handle_destination_files(self.integrated_file_sizes,
+                                              'finalize')
+            else:
+                # Files are finalized when documents are written
+                integrated_file_sizes = dict(self.integrated_file_sizes)
+                batch.on_commit(lambda: self.handle_destination_files(
+                    integrated_file_sizes, 'finalize'
+                ))
+                batch.on_rollback(lambda: self.handle_destination_files(
+                    integrated_file_sizes, 'remove'
+                ))
         except Exception:
             # clean destination
             self.log.critical("Error when registering", exc_info=True)
             self.handle_destination_files(self.integrated_file_sizes, 'remove')
+            # Nothing from the context is integrated
+            if batch is not None:
+                batch.discard()
             six.reraise(*sys.exc_info())
 
-    def register(self, instance):
+    def _validate_database_batch(self, batch):
+        """Raise error if shared batch was discarded by another instance."""
+        if batch is not None and batch.discarded:
+            raise AssertionError((
+                "Database writes of context were discarded because"
+                " integration of other instance failed."
+            ))
+
+    def get_database_batch(self, context):
+        """Batch of database writes shared by all instances of context.
+
+        Documents of all instances are queued and prefetched at once when
+        'batch_database_writes' is enabled.
+
+        Returns:
+            DatabaseWriteBatch: Batch or None if batching is disabled.
+        """
+        if not self.batch_database_writes:
+            return None
+
+        batch = context.data.get("integrateDatabaseBatch")
+        if batch is not None:
+            return batch
+
+        io.install()
+        batch = DatabaseWriteBatch(
+            io._database[io.Session["AVALON_PROJECT"]], logger=self.log
+        )
+        prefetch_items = []
+        for instance in context:
+            asset_entity = instance.data.get("assetEntity")
+            subset_name = instance.data.get("subset")
+            version_number = instance.data.get("version")
+            if (
+                not instance.data.get("publish", True)
+                or not asset_entity
+                or not subset_name
+                or version_number is None
+            ):
+                continue
+            prefetch_items.append(
+                (asset_entity["_id"], subset_name, version_number)
+            )
+        batch.prefetch(prefetch_items)
+        context.data["integrateDatabaseBatch"] = batch
+        return batch
+
+    def register(self, instance, batch=None):
         # Required environment variables
         anatomy_data = instance.data["anatomyData"]
 
@@ -192,7 +267,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             )
         )
 
-        subset = self.get_subset(asset_entity, instance)
+        subset = self.get_subset(asset_entity, instance, batch)
         instance.data["subsetEntity"] = subset
 
         version_number = instance.data["version"]
@@ -216,66 +291,17 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         new_repre_names_low = [_repre["name"].lower() for _repre in repres]
 
-        existing_version = io.find_one({
-            'type': 'version',
-            'parent': subset["_id"],
-            'name': version_number
-        })
-
-        if existing_version is None:
-            version_id = io.insert_one(version).inserted_id
+        if batch is not None:
+            version, existing_repres = self.write_version_to_batch(
+                instance, subset, version, new_repre_names_low, batch
+            )
         else:
-            # Check if instance have set `append` mode which cause that
-            # only replicated representations are set to archive
-            append_repres = instance.data.get("append", False)
-
-            # Update version data
-            # TODO query by _id and
-            io.update_many({
-                'type': 'version',
-                'parent': subset["_id"],
-                'name': version_number
-            }, {
-                '$set': version
-            })
-            version_id = existing_version['_id']
-
-            # Find representations of existing version and archive them
-            current_repres = list(io.find({
-                "type": "representation",
-                "parent": version_id
-            }))
-            bulk_writes = []
-            for repre in current_repres:
-                if append_repres:
-                    # archive only duplicated representations
-                    if repre["name"].lower() not in new_repre_names_low:
-                        continue
-                # Representation must change type,
-                # `_id` must be stored to other key and replaced with new
-                # - that is because new representations should have same ID
-                repre_id = repre["_id"]
-                bulk_writes.append(DeleteOne({"_id": repre_id}))
-
-                repre["orig_id"] = repre_id
-                repre["_id"] = io.ObjectId()
-                repre["type"] = "archived_representation"
-                bulk_writes.append(InsertOne(repre))
-
-            # bulk updates
-            if bulk_writes:
-                io._database[io.Session["AVALON_PROJECT"]].bulk_write(
-                    bulk_writes
-                )
-
-        version = io.find_one({"_id": version_id})
+            version, existing_repres = self.write_version(
+                instance, subset, version, new_repre_names_low
+            )
+        version_id = version["_id"]
         instance.data["versionEntity"] = version
 
-        existing_repres = list(io.find({
-            "parent": version_id,
-            "type": "archived_representation"
-        }))
-
         instance.data['version'] = version['name']
 
         intent_value = instance.context.data.get("intent")
@@ -585,17 +611,17 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             }
             self.log.debug("__ representations: {}".format(representations))
 
-        # Remove old representations if there are any (before insertion of new)
-        if existing_repres:
-            repre_ids_to_remove = []
-            for repre in existing_repres:
-                repre_ids_to_remove.append(repre["_id"])
-            io.delete_many({"_id": {"$in": repre_ids_to_remove}})
-
         for rep in instance.data["representations"]:
             self.log.debug("__ rep: {}".format(rep))
 
-        io.insert_many(representations)
+        if batch is not None:
+            self.write_representations_to_batch(
+                instance, representations, existing_repres, batch
+            )
+        else:
+            self.write_representations(
+                instance, representations, existing_repres
+            )
         instance.data["published_representations"] = (
             published_representations
         )
@@ -614,14 +640,25 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 its size in bytes
         """
         # store destination url and size for reporting and rollback
-        integrated_file_sizes = {}
-        transfers = list(instance.data.get("transfers", list()))
-        for src, dest in transfers:
-            if os.path.normpath(src) != os.path.normpath(dest):
-                dest = self.get_dest_temp_url(dest)
-                self.copy_file(src, dest)
-                # TODO needs to be updated during site implementation
-                integrated_file_sizes[dest] = os.path.getsize(dest)
+        transfers = []
+        for src, dest in instance.data.get("transfers", list()):
+            if os.path.normpath(src) == os.path.normpath(dest):
+                continue
+            dest = self.get_dest_temp_url(dest)
+            # Skip files integrated for previous representations
+            if dest not in self.integrated_file_sizes:
+                transfers.append((src, dest))
+
+        engine = self.create_transfer_engine()
+        linked_file_sizes = {}
+        if self.content_hash_deduplication and transfers:
+            transfers, linked_file_sizes = self.deduplicate_transfers(
+                instance, transfers, engine
+            )
+
+        # TODO needs to be updated during site implementation
+        integrated_file_sizes = engine.transfer(transfers)
+        integrated_file_sizes.update(linked_file_sizes)
 
         # Produce hardlinked copies
         # Note: hardlink can only be produced between two files on the same
@@ -640,6 +677,125 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         return integrated_file_sizes
 
+    def deduplicate_transfers(self, instance, transfers, engine):
+        """Hardlink already published files with the same content.
+
+        Content hash of each source is compared with content hashes stored
+        in 'files' of published representations. Matching published file is
+        hardlinked to destination instead of copying the source. Hardlink
+        can't be created between different filesystems so these transfers
+        are copied.
+
+        Args:
+            instance (pyblish.api.Instance): Integrated instance.
+            transfers (list): Pairs of source and temporary destination.
+            engine (FileTransferEngine): Engine used for transfers.
+
+        Returns:
+            tuple: Transfers which must be copied and dictionary with sizes
+                of hardlinked destinations.
+        """
+        src_hashes = content_hashes(
+            [src for src, _ in transfers], self.transfer_workers
+        )
+        published_paths = self.find_published_files(
+            instance, set(src_hashes.values())
+        )
+        engine.create_directories(dst for _, dst in transfers)
+
+        remaining_transfers = []
+        linked_file_sizes = {}
+        for src, dst in transfers:
+            file_hash = src_hashes[src]
+            self.integrated_content_hashes[dst] = file_hash
+            published_path = published_paths.get(file_hash)
+            if published_path:
+                try:
+                    if os.path.lexists(dst):
+                        os.remove(dst)
+                    os.link(published_path, dst)
+                    linked_file_sizes[dst] = os.path.getsize(dst)
+                    self.log.debug("Hardlinked published file {} -> {}".format(
+                        published_path, dst
+                    ))
+                    continue
+
+                except OSError:
+                    self.log.debug(
+                        "Hardlink failed, file will be copied {} -> {}".format(
+                            published_path, dst
+                        ),
+                        exc_info=True
+                    )
+            remaining_transfers.append((src, dst))
+
+        saved_bytes = sum(linked_file_sizes.values())
+        context = instance.context
+        context.data["deduplicatedBytes"] = (
+            context.data.get("deduplicatedBytes", 0) + saved_bytes
+        )
+        self.log.info((
+            "Deduplicated {} of {} files, {} bytes were not copied"
+            " ({} bytes in whole publish)."
+        ).format(
+            len(linked_file_sizes), len(transfers), saved_bytes,
+            context.data["deduplicatedBytes"]
+        ))
+        return remaining_transfers, linked_file_sizes
+
+    def find_published_files(self, instance, file_hashes):
+        """Paths to published files by their content hash.
+
+        Only existing files with size matching database record are used.
+
+        Args:
+            instance (pyblish.api.Instance): Integrated instance.
+            file_hashes (set): Content hashes to look for.
+
+        Returns:
+            dict: Absolute path of published file by content hash.
+        """
+        if not file_hashes:
+            return {}
+
+        anatomy = instance.context.data["anatomy"]
+        repre_docs = io.find(
+            {
+                "type": "representation",
+                "files.content_hash": {"$in": list(file_hashes)}
+            },
+            {"files": True}
+        )
+        output = {}
+        for repre_doc in repre_docs:
+            for file_info in repre_doc.get("files") or []:
+                file_hash = file_info.get("content_hash")
+                if file_hash not in file_hashes or file_hash in output:
+                    continue
+
+                path = os.path.normpath(anatomy.fill_root(file_info["path"]))
+                if (
+                    os.path.exists(path)
+                    and os.path.getsize(path) == file_info.get("size")
+                ):
+                    output[file_hash] = path
+        return output
+
+    def create_transfer_engine(self):
+        """Transfer engine with options of the plugin."""
+        return FileTransferEngine(
+            max_workers=self.transfer_workers,
+            max_retries=self.transfer_max_retries,
+            verify_checksum=self.transfer_verify_checksum,
+            progress_callback=self._on_transfer_progress,
+            logger=self.log
+        )
+
+    def _on_transfer_progress(self, src, dst, finished, total):
+        self.log.debug("Transferred {}/{} {} -> {}".format(
+            finished, total, src, dst
+        ))
+
     def copy_file(self, src, dst):
         """ Copy given source to destination
 
@@ -649,37 +805,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         Returns:
             None
         """
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        self.log.debug("Copying file ... {} -> {}".format(src, dst))
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                six.reraise(*sys.exc_info())
-
-        # copy file with speedcopy and check if size of files are simetrical
-        while True:
-            if not shutil._samefile(src, dst):
-                copyfile(src, dst)
-            else:
-                self.log.critical(
-                    "files are the same {} to {}".format(src, dst)
-                )
-                os.remove(dst)
-                try:
-                    shutil.copyfile(src, dst)
-                    self.log.debug("Copying files with shutil...")
-                except OSError as e:
-                    self.log.critical("Cannot copy {} to {}".format(src, dst))
-                    self.log.critical(e)
-                    six.reraise(*sys.exc_info())
-            if str(getsize(src)) in str(getsize(dst)):
-                break
+        self.create_transfer_engine().transfer([(src, dst)])
 
     def hardlink_file(self, src, dst):
         dirname = os.path.dirname(dst)
@@ -695,14 +821,159 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         filelink.create(src, dst, filelink.HARDLINK)
 
-    def get_subset(self, asset, instance):
-        subset_name = instance.data["subset"]
-        subset = io.find_one({
-            "type": "subset",
-            "parent": asset["_id"],
-            "name": subset_name
+    def write_version(self, instance, subset, version, new_repre_names_low):
+        """Insert or update version document and archive its representations.
+
+        Returns:
+            tuple: Version document and archived representations.
+        """
+        existing_version = io.find_one({
+            'type': 'version',
+            'parent': subset["_id"],
+            'name': version["name"]
         })
 
+        if existing_version is None:
+            version_id = io.insert_one(version).inserted_id
+        else:
+            # Check if instance have set `append` mode which cause that
+            # only replicated representations are set to archive
+            append_repres = instance.data.get("append", False)
+
+            # Update version data
+            # TODO query by _id and
+            io.update_many({
+                'type': 'version',
+                'parent': subset["_id"],
+                'name': version["name"]
+            }, {
+                '$set': version
+            })
+            version_id = existing_version['_id']
+
+            # Find representations of existing version and archive them
+            current_repres = list(io.find({
+                "type": "representation",
+                "parent": version_id
+            }))
+            bulk_writes = []
+            for repre in current_repres:
+                if append_repres:
+                    # archive only duplicated representations
+                    if repre["name"].lower() not in new_repre_names_low:
+                        continue
+                # Representation must change type,
+                # `_id` must be stored to other key and replaced with new
+                # - that is because new representations should have same ID
+                repre_id = repre["_id"]
+                bulk_writes.append(DeleteOne({"_id": repre_id}))
+
+                repre["orig_id"] = repre_id
+                repre["_id"] = io.ObjectId()
+                repre["type"] = "archived_representation"
+                bulk_writes.append(InsertOne(repre))
+
+            # bulk updates
+            if bulk_writes:
+                io._database[io.Session["AVALON_PROJECT"]].bulk_write(
+                    bulk_writes
+                )
+
+        version = io.find_one({"_id": version_id})
+        existing_repres = list(io.find({
+            "parent": version_id,
+            "type": "archived_representation"
+        }))
+        return version, existing_repres
+
+    def write_version_to_batch(
+        self, instance, subset, version, new_repre_names_low, batch
+    ):
+        """Batch mode variant of 'write_version'."""
+        existing_version = batch.find_version(subset["_id"], version["name"])
+        if existing_version is None:
+            batch.insert_one("version", version)
+        else:
+            version_id = existing_version["_id"]
+            batch.update_one("version", version_id, {"$set": version})
+            version = dict(existing_version, **version)
+            self.archive_representations(
+                instance, version_id, new_repre_names_low, batch
+            )
+
+        existing_repres = batch.find_representations(
+            version["_id"], "archived_representation"
+        )
+        return version, existing_repres
+
+    def write_representations(
+        self, instance, representations, existing_repres
+    ):
+        """Replace archived representations with new representations."""
+        # Remove old representations if there are any (before insertion of new)
+        if existing_repres:
+            io.delete_many({
+                "_id": {"$in": [repre["_id"] for repre in existing_repres]}
+            })
+        io.insert_many(representations)
+        self.enqueue_sync_jobs(instance, representations)
+
+    def write_representations_to_batch(
+        self, instance, representations, existing_repres, batch
+    ):
+        """Batch mode variant of 'write_representations'."""
+        if existing_repres:
+            batch.delete_many(
+                "representation", [repre["_id"] for repre in existing_repres]
+            )
+        batch.insert_many("representation", representations)
+        batch.on_commit(
+            lambda: self.enqueue_sync_jobs(instance, representations)
+        )
+
+    def archive_representations(
+        self, instance, version_id, new_repre_names_low, batch
+    ):
+        """Queue archivation of representations of existing version.
+
+        Batch mode variant of archivation in 'register'.
+        """
+        # Check if instance have set `append` mode which cause that
+        # only replicated representations are set to archive
+        append_repres = instance.data.get("append", False)
+
+        current_repres = batch.find_representations(version_id)
+        repre_ids_to_remove = []
+        archived_repres = []
+        for repre in current_repres:
+            if append_repres:
+                # archive only duplicated representations
+                if repre["name"].lower() not in new_repre_names_low:
+                    continue
+            repre_id = repre["_id"]
+            repre_ids_to_remove.append(repre_id)
+
+            archived_repre = copy.deepcopy(repre)
+            archived_repre["orig_id"] = repre_id
+            archived_repre["_id"] = io.ObjectId()
+            archived_repre["type"] = "archived_representation"
+            archived_repres.append(archived_repre)
+
+        if archived_repres:
+            batch.delete_many("representation", repre_ids_to_remove)
+            batch.insert_many("representation", archived_repres)
+
+    def get_subset(self, asset, instance, batch=None):
+        subset_name = instance.data["subset"]
+        if batch is not None:
+            subset = batch.find_subset(asset["_id"], subset_name)
+        else:
+            subset = io.find_one({
+                "type": "subset",
+                "parent": asset["_id"],
+                "name": subset_name
+            })
+
         if subset is None:
             self.log.info("Subset '%s' not found, creating ..." % subset_name)
             self.log.debug("families.  %s" % instance.data.get('families'))
@@ -718,7 +989,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                 if _family not in families:
                     families.append(_family)
 
-            _id = io.insert_one({
+            subset = {
                 "schema": "openpype:subset-3.0",
                 "type": "subset",
                 "name": subset_name,
@@ -726,23 +997,31 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                     "families": families
                 },
                 "parent": asset["_id"]
-            }).inserted_id
-
-            subset = io.find_one({"_id": _id})
+            }
+            if batch is not None:
+                batch.insert_one("subset", subset)
+            else:
+                _id = io.insert_one(subset).inserted_id
+                subset = io.find_one({"_id": _id})
 
-        self._set_subset_group(instance, subset["_id"])
+        self._set_subset_group(instance, subset["_id"], batch)
 
         # Update families on subset.
         families = [instance.data["family"]]
         families.extend(instance.data.get("families", []))
-        io.update_many(
-            {"type": "subset", "_id": io.ObjectId(subset["_id"])},
-            {"$set": {"data.families": families}}
-        )
+        if batch is not None:
+            batch.update_one(
+                "subset", subset["_id"], {"$set": {"data.families": families}}
+            )
+        else:
+            io.update_many(
+                {"type": "subset", "_id": io.ObjectId(subset["_id"])},
+                {"$set": {"data.families": families}}
+            )
 
         return subset
 
-    def _set_subset_group(self, instance, subset_id):
+    def _set_subset_group(self, instance, subset_id, batch=None):
         """
             Mark subset as belonging to group in DB.
 
@@ -751,6 +1030,7 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             Args:
                 instance (dict): processed instance
                 subset_id (str): DB's subset _id
+                batch (DatabaseWriteBatch): Batch of database writes.
 
         """
         # add group if available
@@ -795,6 +1075,12 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         if instance.data.get("subsetGroup") or filled_template:
             subset_group = instance.data.get('subsetGroup') or filled_template
+            if batch is not None:
+                batch.update_one(
+                    "subset", subset_id,
+                    {'$set': {'data.subsetGroup': subset_group}}
+                )
+                return
 
             io.update_many({
                 'type': 'subset',
@@ -946,6 +1232,9 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
                                                integrated_file_sizes[dest],
                                                file_hash,
                                                instance=instance)
+            content_hash = self.integrated_content_hashes.get(dest)
+            if content_hash:
+                file_info["content_hash"] = content_hash
             output_resources.append(file_info)
 
         return output_resources
@@ -1028,6 +1317,46 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
 
         return rec
 
+    def enqueue_sync_jobs(self, instance, representations):
+        """Push sync jobs of published representations to sync queue.
+
+        Used only when Site Sync runs in queue mode. Jobs are created for
+        sites where files are not present yet. Failure is not fatal, sync
+        server finds representations during reconciliation.
+        """
+        sync_server_settings = (
+            instance.context.data["system_settings"]["modules"]["sync_server"]
+        )
+        if (
+            not sync_server_settings["enabled"]
+            or not sync_server_settings.get("sync_queue_mode")
+        ):
+            return
+
+        site_names = set()
+        for representation in representations:
+            for file_info in representation.get("files", []):
+                for site in file_info.get("sites", []):
+                    if "created_dt" not in site:
+                        site_names.add(site["name"])
+        if not site_names:
+            return
+
+        try:
+            from openpype.modules import load_modules
+            load_modules()
+            from openpype_modules.sync_server.sync_queue import SyncQueue
+
+            sync_queue = SyncQueue()
+            representation_ids = [repre["_id"] for repre in representations]
+            for site_name in site_names:
+                sync_queue.enqueue(io.Session["AVALON_PROJECT"],
+                                   representation_ids, site_name)
+        except Exception:
+            self.log.warning(
+                "Sync jobs of representations were not queued", exc_info=True
+            )
+
     def handle_destination_files(self, integrated_file_sizes, mode):
         """ Clean destination files
             Called when error happened during integrating to DB or to disk
@@ -248,6 +248,61 @@ class PypeCommands:
 
         project_manager.main()
 
+    @staticmethod
+    def report_modules(timing=False):
+        from openpype.modules import ModulesManager
+
+        manager = ModulesManager()
+        for module in sorted(manager.modules, key=lambda m: m.name):
+            print("[{}] {} ({})".format(
+                "X" if module.enabled else " ",
+                module.name,
+                module.__class__.__name__
+            ))
+
+        for module_name, manifest in sorted(
+            manager.get_disabled_manifests().items()
+        ):
+            print("[ ] {} ({}, not imported)".format(
+                module_name, manifest["class"]
+            ))
+
+        if timing:
+            print("")
+            manager.print_report()
+
+    @staticmethod
+    def ensure_database_indexes(projects=None):
+        from openpype.lib.database_indexes import ensure_indexes
+
+        for project_name, index_names in ensure_indexes(
+            project_names=projects or None
+        ).items():
+            print(">>> {}: {}".format(project_name, ", ".join(index_names)))
+
+    @staticmethod
+    def advise_database_indexes(projects=None):
+        from openpype.lib.database_indexes import advise_indexes
+
+        scans = 0
+        for project_name, results in advise_indexes(
+            project_names=projects or None
+        ).items():
+            print(">>> {}".format(project_name))
+            for result in results:
+                if result["collscan"]:
+                    scans += 1
+                    plan = "COLLECTION SCAN"
+                else:
+                    plan = "index {}".format(", ".join(result["indexes"]))
+                print("    {}: {}".format(result["label"], plan))
+
+        if scans:
+            print((
+                "!!! {} queries scan whole collection,"
+                " run 'db ensure-indexes'"
+            ).format(scans))
+
     def texture_copy(self, project, asset, path):
         pass
 
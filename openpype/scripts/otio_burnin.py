@@ -1,6 +1,7 @@
 import os
 import sys
 import re
+import copy
 import subprocess
 import platform
 import json
@@ -413,29 +414,7 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             args=args,
             overwrite=overwrite
         )
-        print("Launching command: {}".format(command))
-
-        proc = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            shell=True
-        )
-
-        _stdout, _stderr = proc.communicate()
-        if _stdout:
-            for line in _stdout.split(b"\r\n"):
-                print(line.decode("utf-8"))
-
-        # This will probably never happen as ffmpeg use stdout
-        if _stderr:
-            for line in _stderr.split(b"\r\n"):
-                print(line.decode("utf-8"))
-
-        if proc.returncode != 0:
-            raise RuntimeError(
-                "Failed to render '{}': {}'".format(output, command)
-            )
+        _run_command(command, [output])
         if is_sequence:
             output = output % kwargs.get("duration")
 
@@ -445,6 +424,74 @@ class ModifiedBurnins(ffmpeg_burnins.Burnins):
             )
 
 
+def _run_command(command, outputs):
+    print("Launching command: {}".format(command))
+
+    proc = subprocess.Popen(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        shell=True
+    )
+
+    _stdout, _stderr = proc.communicate()
+    if _stdout:
+        for line in _stdout.split(b"\r\n"):
+            print(line.decode("utf-8"))
+
+    # This will probably never happen as ffmpeg use stdout
+    if _stderr:
+        for line in _stderr.split(b"\r\n"):
+            print(line.decode("utf-8"))
+
+    if proc.returncode != 0:
+        raise RuntimeError(
+            "Failed to render '{}': {}'".format(", ".join(outputs), command)
+        )
+
+
+def variants_command(burnins, outputs, args=None, overwrite=False):
+    """Generate one FFMPEG command rendering multiple burnin variants.
+
+    Input is decoded only once and split to filter chain of each variant.
+    All burnins must be created for the same source.
+
+    :param list burnins: ModifiedBurnins objects, one for each output
+    :param list outputs: output files
+    :param str args: additional FFMPEG arguments used for each output
+    :param bool overwrite: overwrite the outputs if they exist
+    :returns: completed command
+    :rtype: str
+    """
+    burnin = burnins[0]
+    args = args or ""
+    input_args = list(burnin.input_args)
+    if burnin.first_frame is not None:
+        start_number_arg = "-start_number {}".format(burnin.first_frame)
+        input_args.append(start_number_arg)
+        if "start_number" not in args:
+            args = " ".join((start_number_arg, args)).strip()
+
+    labels_in = "".join("[in{}]".format(idx) for idx in range(len(burnins)))
+    filter_chains = ["[0:v]split={}{}".format(len(burnins), labels_in)]
+    output_args = []
+    for idx, (_burnin, output) in enumerate(zip(burnins, outputs)):
+        filter_chains.append("[in{0}]{1}[out{0}]".format(
+            idx, _burnin.filter_string or "null"
+        ))
+        output_arg = '-map "[out{}]" -map 0:a? {}'.format(idx, args).strip()
+        if overwrite:
+            output_arg += " -y"
+        output_args.append('{} "{}"'.format(output_arg, output))
+
+    command = '"{}"'.format(ffmpeg_path)
+    if input_args:
+        command += " {}".format(" ".join(input_args))
+    return '{} -i "{}" -filter_complex "{}" {}'.format(
+        command, burnin.source, ";".join(filter_chains), " ".join(output_args)
+    )
+
+
 def example(input_path, output_path):
     options_init = {
         'opacity': 1,
@@ -530,6 +577,102 @@ def burnins_from_data(
     if full_input_path:
         streams = _streams(full_input_path)
 
+    burnin = prepare_burnins(
+        input_path, data, streams, options, burnin_values, first_frame
+    )
+    ffmpeg_args_str = " ".join(get_burnin_codec_args(burnin, codec_data))
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def burnin_variants_from_data(
+    input_path, variants, data,
+    codec_data=None, options=None, overwrite=True,
+    full_input_path=None, first_frame=None, streams=None
+):
+    """Render multiple burnin variants of one input from single decode pass.
+
+    Arguments are the same as for `burnins_from_data` except output path and
+    burnin values which are defined per variant. Ffprobe runs only once
+    and only when streams are not passed.
+
+    Args:
+        variants (list): Dictionaries with "output" (path to output file)
+            and "values" (positioned burnin values).
+        streams (list): Ffprobe streams of input.
+    """
+    if not streams:
+        streams = _streams(full_input_path or input_path)
+
+    burnins = []
+    outputs = []
+    variant_data = data
+    for variant in variants:
+        variant_data = copy.deepcopy(data)
+        burnins.append(prepare_burnins(
+            input_path, variant_data, streams, options,
+            variant["values"], first_frame
+        ))
+        outputs.append(variant["output"])
+
+    ffmpeg_args_str = " ".join(get_burnin_codec_args(burnins[0], codec_data))
+    if len(burnins) == 1:
+        burnins[0].render(
+            outputs[0], args=ffmpeg_args_str, overwrite=overwrite,
+            **variant_data
+        )
+        return
+
+    if not overwrite:
+        for output in outputs:
+            if os.path.exists(output):
+                raise RuntimeError("Destination '%s' exists, please "
+                                   "use overwrite" % output)
+
+    command = variants_command(
+        burnins, outputs, args=ffmpeg_args_str, overwrite=overwrite
+    )
+    _run_command(command, outputs)
+
+    for output in outputs:
+        if "%" in output:
+            output = output % variant_data.get("duration")
+
+        if not os.path.exists(output):
+            raise RuntimeError("Failed to generate file '%s'" % output)
+
+
+def get_burnin_codec_args(burnin, codec_data=None):
+    """Codec arguments for output based on source stream.
+
+    Args:
+        burnin (ModifiedBurnins): Burnins object with source streams.
+        codec_data (list): Codec arguments which should be used instead.
+    """
+    ffmpeg_args = []
+    if codec_data:
+        # Use codec definition from method arguments
+        ffmpeg_args = list(codec_data)
+        ffmpeg_args.append("-g 1")
+
+    else:
+        ffprobe_data = burnin._streams[0]
+        ffmpeg_args.extend(get_codec_args(ffprobe_data))
+    return ffmpeg_args
+
+
+def prepare_burnins(
+    input_path, data, streams=None, options=None, burnin_values=None,
+    first_frame=None
+):
+    """Create burnins object with filters for entered burnin values.
+
+    Entered data are modified with keys filled from streams.
+
+    Returns:
+        ModifiedBurnins: Burnins with filters ready to render.
+    """
     burnin = ModifiedBurnins(input_path, streams, options, first_frame)
 
     frame_start = data.get("frame_start")
@@ -560,7 +703,7 @@ def burnins_from_data(
     if source_timecode is not None:
         data[SOURCE_TIMECODE_KEY[1:-1]] = SOURCE_TIMECODE_KEY
 
-    for align_text, value in burnin_values.items():
+    for align_text, value in (burnin_values or {}).items():
         if not value:
             continue
 
@@ -639,21 +782,7 @@ def burnins_from_data(
         text = value.format(**data)
         burnin.add_text(text, align, frame_start, frame_end)
 
-    ffmpeg_args = []
-    if codec_data:
-        # Use codec definition from method arguments
-        ffmpeg_args = codec_data
-        ffmpeg_args.append("-g 1")
-
-    else:
-        ffprobe_data = burnin._streams[0]
-        ffmpeg_args.extend(get_codec_args(ffprobe_data))
-
-    # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
-    )
+    return burnin
 
 
 if __name__ == "__main__":
@@ -662,6 +791,20 @@ if __name__ == "__main__":
     with open(in_data_json_path, "r") as file_stream:
         in_data = json.load(file_stream)
 
+    if "variants" in in_data:
+        burnin_variants_from_data(
+            in_data["input"],
+            in_data["variants"],
+            in_data["burnin_data"],
+            codec_data=in_data.get("codec"),
+            options=in_data.get("options"),
+            full_input_path=in_data.get("full_input_path"),
+            first_frame=in_data.get("first_frame"),
+            streams=in_data.get("streams")
+        )
+        print("* Burnin script has finished")
+        sys.exit(0)
+
     burnins_from_data(
         in_data["input"],
         in_data["output"],
@@ -1,9 +1,11 @@
 import os
 import json
 import copy
+import hashlib
 import logging
 import collections
 import datetime
+import threading
 from abc import ABCMeta, abstractmethod
 import six
 import openpype
@@ -105,6 +107,22 @@ class SettingsHandler:
         """
         pass
 
+    @abstractmethod
+    def get_project_anatomy_version(self, project_name):
+        """Versions of studio and project anatomy overrides.
+
+        Should be cheap to call as it's used to validate caches of resolved
+        anatomy data.
+
+        Args:
+            project_name(str): Name of project for which data should be loaded.
+
+        Returns:
+            tuple: Versions of studio and project overrides. Version changes
+                on each change of overrides.
+        """
+        pass
+
 
 @six.add_metaclass(ABCMeta)
 class LocalSettingsHandler:
@@ -127,21 +145,70 @@ class LocalSettingsHandler:
         """Studio overrides of system settings."""
         pass
 
+    @abstractmethod
+    def get_local_settings_version(self):
+        """Version of local settings which changes on each save."""
+        pass
+
+
+def current_save_time():
+    """Current time rounded to precision of MongoDB dates (milliseconds)."""
+    now = datetime.datetime.now()
+    return now.replace(microsecond=(now.microsecond // 1000) * 1000)
+
+
+def document_version(document):
+    """Version of settings document used to validate cached values.
+
+    Returns:
+        tuple: Document existence and it's last saved time.
+    """
+    if not document:
+        return (False, None)
+    return (True, document.get("last_saved_time"))
+
+
+def anatomy_data_version(anatomy_data):
+    """Version of anatomy data converted from project document.
+
+    Project document is modified also out of settings (e.g. by ftrack
+    synchronization or project manager) without change of last saved time so
+    hash of converted data is used as version.
+
+    Returns:
+        tuple: Data existence and hash of data.
+    """
+    content = json.dumps(anatomy_data, sort_keys=True, default=str)
+    return (
+        bool(anatomy_data),
+        hashlib.sha1(content.encode("utf-8")).hexdigest()
+    )
+
 
 class CacheValues:
+    """Cached settings data.
+
+    Cache is outdated when `cache_lifetime` has passed or when was marked as
+    changed with `set_changed`. Outdated cache may be still valid if version
+    of it's source document did not change (see `is_version_valid`).
+    """
     cache_lifetime = 10
 
     def __init__(self):
         self.data = None
         self.creation_time = None
+        self.version = None
+        self.changed = False
 
     def data_copy(self):
         if not self.data:
             return {}
         return copy.deepcopy(self.data)
 
-    def update_data(self, data):
+    def update_data(self, data, version=None):
         self.data = data
+        self.version = version
+        self.changed = False
         self.creation_time = datetime.datetime.now()
 
     def update_from_document(self, document):
@@ -153,19 +220,103 @@ class CacheValues:
                 value = document["value"]
                 if value:
                     data = json.loads(value)
-        self.data = data
+        self.update_data(data, document_version(document))
 
     def to_json_string(self):
         return json.dumps(self.data or {})
 
+    def set_changed(self):
+        """Mark cache as outdated because source data has changed."""
+        self.changed = True
+
+    def touch(self):
+        """Data were validated so lifetime of cache can be restarted."""
+        self.creation_time = datetime.datetime.now()
+
+    def is_version_valid(self, version):
+        """Check if cached data match version of source document.
+
+        Document which exists but does not have stored last saved time can't
+        be validated.
+        """
+        if self.changed or self.data is None or self.version is None:
+            return False
+        exists, last_saved_time = version
+        if exists and last_saved_time is None:
+            return False
+        return version == self.version
+
     @property
     def is_outdated(self):
-        if self.creation_time is None:
+        if self.changed or self.creation_time is None:
             return True
         delta = (datetime.datetime.now() - self.creation_time).seconds
         return delta > self.cache_lifetime
 
 
+class SettingsChangeWatcher(threading.Thread):
+    """Watch collection with change stream and report changed documents.
+
+    Change streams are available only on replica sets and sharded clusters.
+    Watcher stops and `is_running` is set to False when server does not
+    support them, caches then fallback to version checks.
+
+    Args:
+        collection (pymongo.collection.Collection): Collection to watch.
+        callback (callable): Called with changed document on each change.
+    """
+
+    def __init__(self, collection, callback):
+        super(SettingsChangeWatcher, self).__init__()
+        self.daemon = True
+        self.collection = collection
+        self.callback = callback
+        self.is_running = False
+        self._stream = None
+        self._stream_ready = threading.Event()
+        self.log = logging.getLogger(self.__class__.__name__)
+
+    def start(self):
+        """Start watching and wait until change stream is opened."""
+        super(SettingsChangeWatcher, self).start()
+        self._stream_ready.wait()
+        return self.is_running
+
+    def stop(self):
+        self.is_running = False
+        if self._stream is not None:
+            self._stream.close()
+
+    def run(self):
+        from pymongo.errors import PyMongoError
+
+        try:
+            self._stream = self.collection.watch(full_document="updateLookup")
+            self.is_running = True
+
+        except PyMongoError:
+            self.log.info(
+                "Change streams are not supported by server.", exc_info=True
+            )
+
+        finally:
+            self._stream_ready.set()
+
+        try:
+            while self.is_running:
+                change = self._stream.try_next()
+                if change is None:
+                    continue
+                self.callback(change.get("fullDocument"))
+
+        except PyMongoError:
+            if self.is_running:
+                self.log.warning("Change stream failed.", exc_info=True)
+
+        finally:
+            self.is_running = False
+
+
 class MongoSettingsHandler(SettingsHandler):
     """Settings handler that use mongo for storing and loading of settings."""
     global_general_keys = ("openpype_path", "admin_password")
@@ -198,6 +349,92 @@ class MongoSettingsHandler(SettingsHandler):
         self.project_settings_cache = collections.defaultdict(CacheValues)
         self.project_anatomy_cache = collections.defaultdict(CacheValues)
 
+        self._change_watcher = None
+        self.cache_stats = {
+            "version_checks": 0,
+            "refetches": 0,
+            "refetches_avoided": 0
+        }
+
+    def start_change_stream(self):
+        """Invalidate caches from change stream of settings collection.
+
+        Cached values of settings collection are then refetched only when
+        they were changed. Useful for long running processes.
+
+        Returns:
+            bool: Change stream is running. Version checks of documents are
+                used if server does not support change streams.
+        """
+        if self._change_watcher is None or not self._change_watcher.is_running:
+            self._change_watcher = SettingsChangeWatcher(
+                self.collection, self._on_settings_change
+            )
+            self._change_watcher.start()
+        return self._change_watcher.is_running
+
+    def stop_change_stream(self):
+        if self._change_watcher is not None:
+            self._change_watcher.stop()
+            self._change_watcher = None
+
+    def _on_settings_change(self, document):
+        doc_type = (document or {}).get("type")
+        if not doc_type or doc_type in (
+            SYSTEM_SETTINGS_KEY, GLOBAL_SETTINGS_KEY
+        ):
+            self.system_settings_cache.set_changed()
+
+        if not doc_type or doc_type == PROJECT_SETTINGS_KEY:
+            for cache in tuple(self.project_settings_cache.values()):
+                cache.set_changed()
+
+        if not doc_type or doc_type == PROJECT_ANATOMY_KEY:
+            # Only default anatomy is stored in settings collection
+            self.project_anatomy_cache[None].set_changed()
+
+    def _is_cache_valid(self, cache, collection, query_filter, watched=True):
+        """Check if cached values are valid.
+
+        Full documents are not queried, only version of documents is checked
+        when cache lifetime has passed.
+
+        Args:
+            cache (CacheValues): Cache to validate.
+            collection (pymongo.collection.Collection): Collection where
+                documents are stored.
+            query_filter (dict): Filter to find source document.
+            watched (bool): Collection is watched by change stream.
+
+        Returns:
+            bool: Cached values can be used.
+        """
+        if (
+            watched
+            and self._change_watcher is not None
+            and self._change_watcher.is_running
+            and cache.data is not None
+        ):
+            valid = not cache.changed
+
+        elif not cache.is_outdated:
+            return True
+
+        else:
+            self.cache_stats["version_checks"] += 1
+            document = collection.find_one(
+                query_filter, {"last_saved_time": True}
+            )
+            valid = cache.is_version_valid(document_version(document))
+            if valid:
+                cache.touch()
+
+        if valid:
+            self.cache_stats["refetches_avoided"] += 1
+        else:
+            self.cache_stats["refetches"] += 1
+        return valid
+
     def _prepare_project_settings_keys(self):
         from .entities import ProjectSettings
         # Prepare anatomy keys and attribute keys
@@ -349,6 +586,7 @@ class MongoSettingsHandler(SettingsHandler):
             system_settings_data
         )
 
+        last_saved_time = current_save_time()
         # Store system settings
         self.collection.replace_one(
             {
@@ -356,10 +594,12 @@ class MongoSettingsHandler(SettingsHandler):
             },
             {
                 "type": SYSTEM_SETTINGS_KEY,
-                "data": system_settings_data
+                "data": system_settings_data,
+                "last_saved_time": last_saved_time
             },
             upsert=True
         )
+        self.system_settings_cache.version = (True, last_saved_time)
 
         # Store global settings
         self.collection.replace_one(
@@ -368,7 +608,8 @@ class MongoSettingsHandler(SettingsHandler):
             },
             {
                 "type": GLOBAL_SETTINGS_KEY,
-                "data": global_settings
+                "data": global_settings,
+                "last_saved_time": last_saved_time
             },
             upsert=True
         )
@@ -490,10 +731,16 @@ class MongoSettingsHandler(SettingsHandler):
             new_key = "config.{}".format(key)
             update_dict[new_key] = value
 
+        last_saved_time = current_save_time()
+        update_dict["last_saved_time"] = last_saved_time
+
         collection.update_one(
             {"type": "project"},
             {"$set": update_dict}
         )
+        # Version of project anatomy is hash of data converted from project
+        #   document so it must be queried again
+        data_cache.set_changed()
 
     def _save_project_data(self, project_name, doc_type, data_cache):
         is_default = bool(project_name is None)
@@ -501,10 +748,12 @@ class MongoSettingsHandler(SettingsHandler):
             "type": doc_type,
             "is_default": is_default
         }
+        last_saved_time = current_save_time()
         replace_data = {
             "type": doc_type,
             "data": data_cache.data,
-            "is_default": is_default
+            "is_default": is_default,
+            "last_saved_time": last_saved_time
         }
         if not is_default:
             replace_filter["project_name"] = project_name
@@ -515,10 +764,18 @@ class MongoSettingsHandler(SettingsHandler):
             replace_data,
             upsert=True
         )
+        data_cache.version = (True, last_saved_time)
 
     def get_studio_system_settings_overrides(self):
         """Studio overrides of system settings."""
-        if self.system_settings_cache.is_outdated:
+        # Global settings are always saved with system settings so it's
+        # enough to check only version of system settings
+        is_valid = self._is_cache_valid(
+            self.system_settings_cache,
+            self.collection,
+            {"type": SYSTEM_SETTINGS_KEY}
+        )
+        if not is_valid:
             system_settings_document = None
             globals_document = None
             docs = self.collection.find({
@@ -540,17 +797,26 @@ class MongoSettingsHandler(SettingsHandler):
             )
 
             self.system_settings_cache.update_from_document(merged_document)
+            self.system_settings_cache.version = document_version(
+                system_settings_document
+            )
         return self.system_settings_cache.data_copy()
 
     def _get_project_settings_overrides(self, project_name):
-        if self.project_settings_cache[project_name].is_outdated:
-            document_filter = {
-                "type": PROJECT_SETTINGS_KEY,
-            }
-            if project_name is None:
-                document_filter["is_default"] = True
-            else:
-                document_filter["project_name"] = project_name
+        document_filter = {
+            "type": PROJECT_SETTINGS_KEY,
+        }
+        if project_name is None:
+            document_filter["is_default"] = True
+        else:
+            document_filter["project_name"] = project_name
+
+        is_valid = self._is_cache_valid(
+            self.project_settings_cache[project_name],
+            self.collection,
+            document_filter
+        )
+        if not is_valid:
             document = self.collection.find_one(document_filter)
             self.project_settings_cache[project_name].update_from_document(
                 document
@@ -615,25 +881,54 @@ class MongoSettingsHandler(SettingsHandler):
         return output
 
     def _get_project_anatomy_overrides(self, project_name):
-        if self.project_anatomy_cache[project_name].is_outdated:
-            if project_name is None:
-                document_filter = {
-                    "type": PROJECT_ANATOMY_KEY,
-                    "is_default": True
-                }
-                document = self.collection.find_one(document_filter)
-                self.project_anatomy_cache[project_name].update_from_document(
-                    document
-                )
-            else:
-                collection = self.avalon_db.database[project_name]
-                project_doc = collection.find_one({"type": "project"})
-                self.project_anatomy_cache[project_name].update_data(
-                    self.project_doc_to_anatomy_data(project_doc)
-                )
-
+        self._validate_project_anatomy_cache(project_name)
         return self.project_anatomy_cache[project_name].data_copy()
 
+    def _validate_project_anatomy_cache(self, project_name):
+        """Make sure cached anatomy overrides are up to date."""
+        if project_name is not None:
+            self._validate_project_doc_anatomy_cache(project_name)
+            return
+
+        document_filter = {
+            "type": PROJECT_ANATOMY_KEY,
+            "is_default": True
+        }
+        is_valid = self._is_cache_valid(
+            self.project_anatomy_cache[project_name],
+            self.collection,
+            document_filter
+        )
+        if not is_valid:
+            document = self.collection.find_one(document_filter)
+            self.project_anatomy_cache[project_name].update_from_document(
+                document
+            )
+
+    def _validate_project_doc_anatomy_cache(self, project_name):
+        """Validate anatomy overrides stored in project document.
+
+        Project document is not in watched settings collection and it's last
+        saved time is not changed by all modifications (e.g. ftrack
+        synchronization or project manager). Document is queried again when
+        cache lifetime passes and converted data are compared by hash.
+        """
+        cache = self.project_anatomy_cache[project_name]
+        if cache.is_outdated:
+            self.cache_stats["version_checks"] += 1
+            project_doc = self.avalon_db.database[project_name].find_one(
+                {"type": "project"},
+                {"data": True, "config": True}
+            )
+            anatomy_data = self.project_doc_to_anatomy_data(project_doc)
+            version = anatomy_data_version(anatomy_data)
+            if cache.is_version_valid(version):
+                self.cache_stats["refetches_avoided"] += 1
+                cache.touch()
+            else:
+                self.cache_stats["refetches"] += 1
+                cache.update_data(anatomy_data, version)
+
     def get_studio_project_anatomy_overrides(self):
         """Studio overrides of default project anatomy data."""
         return self._get_project_anatomy_overrides(None)
@@ -651,6 +946,25 @@ class MongoSettingsHandler(SettingsHandler):
             return {}
         return self._get_project_anatomy_overrides(project_name)
 
+    def get_project_anatomy_version(self, project_name):
+        """Versions of studio and project anatomy overrides.
+
+        Versions of cached overrides are used so documents are queried only
+        when cache lifetime has passed.
+
+        Args:
+            project_name(str): Name of project for which data should be loaded.
+
+        Returns:
+            tuple: Versions of studio and project overrides.
+        """
+        self._validate_project_anatomy_cache(None)
+        output = [self.project_anatomy_cache[None].version, None]
+        if project_name:
+            self._validate_project_anatomy_cache(project_name)
+            output[1] = self.project_anatomy_cache[project_name].version
+        return tuple(output)
+
 
 class MongoLocalSettingsHandler(LocalSettingsHandler):
     """Settings handler that use mongo for store and load local settings.
@@ -697,7 +1011,8 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
         """
         data = data or {}
 
-        self.local_settings_cache.update_data(data)
+        last_saved_time = current_save_time()
+        self.local_settings_cache.update_data(data, (True, last_saved_time))
 
         self.collection.replace_one(
             {
@@ -707,19 +1022,39 @@ class MongoLocalSettingsHandler(LocalSettingsHandler):
             {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id,
-                "data": self.local_settings_cache.data
+                "data": self.local_settings_cache.data,
+                "last_saved_time": last_saved_time
             },
             upsert=True
         )
 
     def get_local_settings(self):
         """Local settings for local site id."""
+        self._validate_local_settings_cache()
+        return self.local_settings_cache.data_copy()
+
+    def _validate_local_settings_cache(self):
         if self.local_settings_cache.is_outdated:
-            document = self.collection.find_one({
+            document_filter = {
                 "type": LOCAL_SETTING_KEY,
                 "site_id": self.local_site_id
-            })
+            }
+            # Check version of document before whole document is queried
+            document = self.collection.find_one(
+                document_filter, {"last_saved_time": True}
+            )
+            if self.local_settings_cache.is_version_valid(
+                document_version(document)
+            ):
+                self.local_settings_cache.touch()
+            else:
+                document = self.collection.find_one(document_filter)
+                self.local_settings_cache.update_from_document(document)
 
-            self.local_settings_cache.update_from_document(document)
+    def get_local_settings_version(self):
+        """Version of cached local settings for local site id.
 
-        return self.local_settings_cache.data_copy()
+        Document is queried only when cache lifetime has passed.
+        """
+        self._validate_local_settings_cache()
+        return self.local_settings_cache.version
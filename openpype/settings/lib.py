@@ -290,6 +290,37 @@ def get_project_anatomy_overrides(project_name):
     return _SETTINGS_HANDLER.get_project_anatomy_overrides(project_name)
 
 
+@require_handler
+def enable_settings_change_stream():
+    """Refetch cached settings only when they are changed.
+
+    Settings collection is watched with change stream in background thread.
+    Meant for long running processes (e.g. tray or ftrack event server).
+
+    Returns:
+        bool: Change stream is running. Server does not support change
+            streams if returns False, then only cheap version checks of
+            settings documents are used.
+    """
+    return _SETTINGS_HANDLER.start_change_stream()
+
+
+@require_handler
+def get_settings_cache_stats():
+    """Counters of version checks, refetches and avoided refetches."""
+    return dict(_SETTINGS_HANDLER.cache_stats)
+
+
+@require_handler
+def get_project_anatomy_version(project_name):
+    return _SETTINGS_HANDLER.get_project_anatomy_version(project_name)
+
+
+@require_local_handler
+def get_local_settings_version():
+    return _LOCAL_SETTINGS_HANDLER.get_local_settings_version()
+
+
 @require_local_handler
 def save_local_settings(data):
     return _LOCAL_SETTINGS_HANDLER.save_local_settings(data)
@@ -7,9 +7,11 @@ an active window manager; such as via Travis-CI.
 """
 import os
 import sys
+import time
 import traceback
 import inspect
 import logging
+import collections
 
 from Qt import QtCore
 
@@ -20,6 +22,7 @@ import pyblish.lib
 import pyblish.version
 
 from . import util
+from . import settings
 from .constants import InstanceStates
 
 from openpype.api import get_project_settings
@@ -71,6 +74,9 @@ class Controller(QtCore.QObject):
         self.context = None
         self.plugins = {}
         self.optional_default = {}
+        # Wall time of processing and count of processed pairs per plugin
+        self.plugin_durations = collections.defaultdict(float)
+        self.plugin_process_counts = collections.defaultdict(int)
         self.instance_toggled.connect(self._on_instance_toggled)
 
     def reset_variables(self):
@@ -86,6 +92,10 @@ class Controller(QtCore.QObject):
         # Active pair
         self.current_pair = None
 
+        # Clear timing of previous run
+        self.plugin_durations.clear()
+        self.plugin_process_counts.clear()
+
         # Orders which changes GUI
         # - passing collectors order disables plugin/instance toggle
         self.collectors_order = None
@@ -240,6 +250,7 @@ class Controller(QtCore.QObject):
 
         self.processing["nextOrder"] = plugin.order
 
+        start = time.time()
         try:
             result = pyblish.plugin.process(plugin, self.context, instance)
             # Make note of the order at which the
@@ -252,8 +263,32 @@ class Controller(QtCore.QObject):
                 plugin.__name__, str(exc)
             ))
 
+        finally:
+            self.plugin_durations[plugin.__name__] += time.time() - start
+            self.plugin_process_counts[plugin.__name__] += 1
+
         return result
 
+    def log_plugin_durations(self):
+        """Log wall time of processed plugins from the longest."""
+        if not self.plugin_durations:
+            return
+
+        lines = ["Wall time of plugins (total {:.3f}s):".format(
+            sum(self.plugin_durations.values())
+        )]
+        for plugin_name, duration in sorted(
+            self.plugin_durations.items(),
+            key=lambda item: item[1],
+            reverse=True
+        ):
+            lines.append("{:>10.3f}s  {} ({}x)".format(
+                duration,
+                plugin_name,
+                self.plugin_process_counts[plugin_name]
+            ))
+        self.log.info("\n".join(lines))
+
     def _pair_yielder(self, plugins):
         for plugin in plugins:
             if (
@@ -358,8 +393,17 @@ class Controller(QtCore.QObject):
         """ Iterating inserted plugins with current context.
         Collectors do not contain instances, they are None when collecting!
         This process don't stop on one
+
+        With batch processing (see `settings.BatchProcessing`) are pairs
+        processed back-to-back and event loop is processed only when time
+        slice has passed. Otherwise each pair is deferred by fixed delay.
         """
-        def on_next():
+        def next_pair():
+            """Prepare next pair to process.
+
+            Returns:
+                bool: Pair is prepared, False when iteration has ended.
+            """
             self.log.debug("Looking for next pair to process")
             try:
                 self.current_pair = next(self.pair_generator)
@@ -369,14 +413,17 @@ class Controller(QtCore.QObject):
             except IterationBreak:
                 self.log.debug("Iteration break was raised")
                 self.is_running = False
+                self.log_plugin_durations()
                 self.was_stopped.emit()
-                return
+                return False
 
             except StopIteration:
                 self.log.debug("Iteration stop was raised")
                 self.is_running = False
+                self.log_plugin_durations()
                 # All pairs were processed successfully!
-                return util.defer(500, on_finished)
+                util.defer(500, on_finished)
+                return False
 
             except Exception as exc:
                 self.log.warning(
@@ -384,14 +431,20 @@ class Controller(QtCore.QObject):
                     exc_info=True
                 )
                 exc_msg = str(exc)
-                return util.defer(
+                util.defer(
                     500, lambda: on_unexpected_error(error=exc_msg)
                 )
+                return False
 
             self.about_to_process.emit(*self.current_pair)
-            util.defer(100, on_process)
+            return True
 
-        def on_process():
+        def process_pair():
+            """Process current pair.
+
+            Returns:
+                bool: Pair was processed, False on unexpected error.
+            """
             try:
                 self.log.debug(
                     "Processing pair: {}".format(str(self.current_pair))
@@ -410,11 +463,31 @@ class Controller(QtCore.QObject):
                     exc_info=True
                 )
                 exc_msg = str(exc)
-                return util.defer(
+                util.defer(
                     500, lambda: on_unexpected_error(error=exc_msg)
                 )
+                return False
+            return True
 
-            util.defer(10, on_next)
+        def on_next():
+            if next_pair():
+                util.defer(100, on_process)
+
+        def on_process():
+            if process_pair():
+                util.defer(10, on_next)
+
+        def on_next_batch():
+            slice_start = time.time()
+            while next_pair():
+                if not process_pair():
+                    return
+
+                elapsed = (time.time() - slice_start) * 1000
+                if elapsed >= settings.BatchTimeSlice:
+                    # Give event loop chance to process GUI events
+                    util.defer(1, on_next_batch)
+                    return
 
         def on_unexpected_error(error):
             # TODO this should be handled much differently
@@ -425,7 +498,10 @@ class Controller(QtCore.QObject):
             return util.defer(500, on_finished)
 
         self.is_running = True
-        util.defer(10, on_next)
+        if settings.BatchProcessing:
+            util.defer(10, on_next_batch)
+        else:
+            util.defer(10, on_next)
 
     def collect(self):
         """ Iterate and process Collect plugins
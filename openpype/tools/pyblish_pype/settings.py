@@ -25,3 +25,11 @@ TerminalFilters = {
 
 # Allow animations in GUI
 Animated = env_variable_to_bool("OPENPYPE_PYBLISH_ANIMATED", True)
+
+# Process plugin/instance pairs back-to-back and yield to Qt event loop only
+#   when time slice (in milliseconds) has passed. Each pair is deferred with
+#   fixed delay otherwise.
+BatchProcessing = env_variable_to_bool(
+    "OPENPYPE_PYBLISH_BATCH_PROCESSING", True
+)
+BatchTimeSlice = 50
@@ -15,6 +15,7 @@ from openpype.api import (
     get_system_settings
 )
 from openpype.lib import get_pype_execute_args
+from openpype.settings.lib import enable_settings_change_stream
 from openpype.modules import TrayModulesManager
 from openpype import style
 
@@ -319,6 +320,8 @@ class PypeTrayApplication(QtWidgets.QApplication):
 
 
 def main():
+    # Tray is long running process, refetch settings only when changed
+    enable_settings_change_stream()
     app = PypeTrayApplication()
     # TODO remove when pype.exe will have an icon
     if os.name == "nt":
@@ -24,7 +24,7 @@ from .model import (
 from .view import FilesView
 
 from openpype.lib import (
-    Anatomy,
+    get_anatomy,
     get_workdir,
     get_workfile_doc,
     create_workfile_doc,
@@ -428,7 +428,7 @@ class FilesWidget(QtWidgets.QWidget):
         self._task_type = None
 
         # Pype's anatomy object for current project
-        self.anatomy = Anatomy(io.Session["AVALON_PROJECT"])
+        self.anatomy = get_anatomy(io.Session["AVALON_PROJECT"])
         # Template key used to get work template from anatomy templates
         self.template_key = "work"
 
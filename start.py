@@ -834,12 +834,7 @@ def boot():
                 use_version, openpype_versions))
 
         _print("{}{}".format(
-            ">>> " if result[0] else "!!! ",
-            bootstrap.validate_openpype_version(
-                bootstrap.get_version_path_from_list(
-                    use_version, openpype_versions)
-            )[1])
-        )
+            ">>> " if result[0] else "!!! ", result[1]))
         sys.exit(1)
 
 
@@ -3,6 +3,7 @@
 import os
 import sys
 from collections import namedtuple
+from hashlib import sha256
 from pathlib import Path
 from zipfile import ZipFile
 from uuid import uuid4
@@ -387,3 +388,82 @@ def test_find_openpype(fix_bootstrap, tmp_path_factory, monkeypatch, printer):
     )
     assert result[-1].path == expected_path, ("not a latest version of "
                                               "OpenPype 4")
+
+
+def test_validate_openpype_version_cache(fix_bootstrap, tmp_path):
+    """Test that validated version is not hashed again."""
+    version_dir = tmp_path / "openpype-v3.0.0"
+    version_dir.mkdir()
+    checksums = []
+    for idx in range(10):
+        file_path = version_dir / f"file{idx}.py"
+        file_path.write_text(f"value = {idx}\n")
+        checksums.append(
+            f"{sha256(file_path.read_bytes()).hexdigest()}:{file_path.name}"
+        )
+    (version_dir / "checksums").write_text("\n".join(checksums))
+
+    zip_path = tmp_path / "openpype-v3.0.0.zip"
+    with ZipFile(zip_path, "w") as zip_file:
+        for file_path in version_dir.iterdir():
+            zip_file.write(file_path, file_path.name)
+
+    for version_path in (version_dir, zip_path):
+        assert fix_bootstrap.validate_openpype_version(version_path) == (
+            True, "All ok")
+        assert Path(f"{version_path}.validation").exists()
+
+        hashed = []
+        monkeypatch = pytest.MonkeyPatch()
+        monkeypatch.setattr(
+            "igniter.bootstrap_repos.sha256sum", hashed.append)
+        result = fix_bootstrap.validate_openpype_version(version_path)
+        monkeypatch.undo()
+        assert result[0]
+        assert result[1] != "All ok"
+        assert not hashed
+
+    # changed checksums invalidate cache
+    (version_dir / "checksums").write_text("\n".join(checksums[1:]))
+    result = fix_bootstrap.validate_openpype_version(version_dir)
+    assert not result[0]
+
+
+def test_version_manifest(fix_bootstrap, tmp_path_factory, monkeypatch):
+    """Test that unchanged versions are not opened again."""
+    repo_dir = tmp_path_factory.mktemp("repo")
+
+    def create_zip(version):
+        zip_path = repo_dir / f"openpype-v{version}.zip"
+        with ZipFile(zip_path, "w") as zip_file:
+            zip_file.writestr(
+                "openpype/version.py", f"__version__ = '{version}'\n")
+        # modification time of directory is not trusted if too recent
+        mtime = len(list(repo_dir.iterdir()))
+        os.utime(repo_dir, (mtime, mtime))
+        return zip_path
+
+    create_zip("3.0.0")
+    create_zip("3.1.0+staging")
+    result = fix_bootstrap.get_openpype_versions(repo_dir)
+    assert [str(v) for v in result] == ["3.0.0"]
+
+    opened = []
+
+    def is_openpype_in_zip(self, zip_item, detected_version):
+        opened.append(zip_item.name)
+        return True
+
+    monkeypatch.setattr(
+        BootstrapRepos, "_is_openpype_in_zip", is_openpype_in_zip)
+    # new instance uses persistent manifest
+    bootstrap = BootstrapRepos()
+    bootstrap.data_dir = fix_bootstrap.data_dir
+    result = bootstrap.get_openpype_versions(repo_dir, staging=True)
+    assert [str(v) for v in result] == ["3.1.0+staging"]
+    assert not opened
+
+    create_zip("3.2.0")
+    result = bootstrap.get_openpype_versions(repo_dir)
+    assert [str(v) for v in result] == ["3.0.0", "3.2.0"]
+    assert opened == ["openpype-v3.2.0.zip"]
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""Test suite for Anatomy templates formatting."""
+import copy
+import time
+
+import pytest
+
+from openpype.lib import anatomy as anatomy_lib
+from openpype.lib.profiling import measure_allocations
+from openpype.settings import PROJECT_ANATOMY_KEY
+from openpype.settings.lib import (
+    get_default_settings,
+    clear_metadata_from_settings
+)
+
+
+@pytest.fixture
+def anatomy(monkeypatch):
+    data = get_default_settings()[PROJECT_ANATOMY_KEY]
+    clear_metadata_from_settings(data)
+    monkeypatch.setattr(
+        anatomy_lib, "get_anatomy_settings",
+        lambda *args, **kwargs: data
+    )
+    return anatomy_lib.Anatomy("test_project")
+
+
+@pytest.fixture
+def fill_data():
+    return {
+        "project": {"name": "test_project", "code": "tp"},
+        "hierarchy": "seq/sh010",
+        "asset": "sh010",
+        "task": "comp",
+        "family": "render",
+        "subset": "renderMain",
+        "version": 3,
+        "output": "beauty",
+        "frame": 1001,
+        "ext": "exr"
+    }
+
+
+def test_format_single(anatomy, fill_data):
+    result = anatomy.format_single("publish.path", fill_data)
+    expected = anatomy.format_all(fill_data)["publish"]["path"]
+    assert result == expected
+    assert result.rootless == expected.rootless
+
+    group = anatomy.format_single(["publish"], fill_data)
+    assert group["path"] == expected
+
+    with pytest.raises(anatomy_lib.TemplateMissingKey):
+        anatomy.format_single("publish.not_existing", fill_data)
+
+    fill_data.pop("ext")
+    with pytest.raises(anatomy_lib.TemplateUnsolved):
+        anatomy.format_single("publish.path", fill_data)
+
+    result = anatomy.format_single("publish.path", fill_data, strict=False)
+    assert not result.solved
+    assert "ext" in result.missing_keys
+
+
+def _patch_legacy_formatting(monkeypatch):
+    """Format templates the way it was done before compilation.
+
+    Templates were parsed with regexes on each format and fill data were
+    deep copied for each formatted template.
+    """
+    templates_cls = anatomy_lib.Templates
+    orig_format = templates_cls._format
+
+    def _format(self, orig_template, data):
+        return orig_format(self, orig_template, copy.deepcopy(data))
+
+    monkeypatch.setattr(templates_cls, "_format", _format)
+    monkeypatch.setattr(
+        templates_cls, "compile_template",
+        lambda self, template: anatomy_lib.CompiledTemplate(template)
+    )
+
+
+@pytest.mark.slow
+def test_format_single_benchmark(anatomy, fill_data, monkeypatch, printer):
+    """Formatting of single template must be much faster than format_all."""
+    frames = range(1001, 1501)
+
+    # Full 'format_all' before templates were compiled
+    with monkeypatch.context() as patch:
+        _patch_legacy_formatting(patch)
+        start = time.perf_counter()
+        for frame in frames:
+            fill_data["frame"] = frame
+            anatomy.format_all(copy.deepcopy(fill_data))["publish"]["path"]
+        format_all_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for frame in frames:
+        fill_data["frame"] = frame
+        anatomy.format_single("publish.path", fill_data)
+    format_single_time = time.perf_counter() - start
+
+    printer("format_all: {:.4f}s format_single: {:.4f}s".format(
+        format_all_time, format_single_time
+    ))
+    assert format_all_time >= format_single_time * 10
+
+
+def test_data_view(anatomy):
+    data = anatomy.data
+    assert data["templates"] == anatomy["templates"]
+    assert set(data.keys()) == set(anatomy.keys())
+    assert isinstance(data["templates"], anatomy_lib.FrozenDict)
+
+    with pytest.raises(TypeError):
+        data["templates"]["work"]["file"] = "{asset}"
+
+    copied = data.to_dict()
+    copied["templates"]["work"]["file"] = "{asset}"
+    assert anatomy["templates"]["work"]["file"] != "{asset}"
+
+
+def test_data_view_allocations(anatomy, printer):
+    def copied_access():
+        for _ in range(100):
+            anatomy.get("roots")
+
+    def view_access():
+        for _ in range(100):
+            anatomy.data.get("roots")
+
+    _, copied_peak = measure_allocations(copied_access)
+    _, view_peak = measure_allocations(view_access)
+    printer("copy getter: {}B view: {}B".format(copied_peak, view_peak))
+    assert view_peak < copied_peak
+
+
+def test_anatomy_cache(anatomy, monkeypatch):
+    versions = {"project": None}
+    monkeypatch.setattr(
+        anatomy_lib, "get_project_anatomy_version",
+        lambda project_name: (None, versions["project"])
+    )
+    monkeypatch.setattr(
+        anatomy_lib, "get_local_settings_version", lambda: None
+    )
+
+    cache = anatomy_lib.AnatomyCache()
+    first = cache.get("test_project")
+    for _ in range(50):
+        assert cache.get("test_project") is first
+    assert cache.get("test_project", "studio") is not first
+    assert cache.stats()["hits"] == 50
+    assert cache.stats()["misses"] == 2
+
+    versions["project"] = (True, "c0ffee")
+    assert cache.get("test_project") is not first
+    assert cache.stats()["misses"] == 3
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched database writes of publish context."""
+import copy
+
+import pytest
+from bson.objectid import ObjectId
+from pymongo import InsertOne, UpdateOne, DeleteOne, DeleteMany, ReplaceOne
+
+from openpype.lib.database_batch import DatabaseWriteBatch
+
+
+def _matches(doc, query):
+    for key, value in query.items():
+        if key == "$or":
+            if not any(_matches(doc, item) for item in value):
+                return False
+        elif isinstance(value, dict) and "$in" in value:
+            if doc.get(key) not in value["$in"]:
+                return False
+        elif doc.get(key) != value:
+            return False
+    return True
+
+
+class FakeCollection(object):
+    """Minimal in-memory collection with requests counter."""
+
+    def __init__(self, fail_on_bulk=None):
+        self.docs = {}
+        self.requests = 0
+        self.bulk_calls = 0
+        self.fail_on_bulk = fail_on_bulk
+
+    def find(self, query):
+        self.requests += 1
+        return [
+            copy.deepcopy(doc)
+            for doc in self.docs.values()
+            if _matches(doc, query)
+        ]
+
+    def find_one(self, query):
+        self.requests += 1
+        for doc in self.docs.values():
+            if _matches(doc, query):
+                return copy.deepcopy(doc)
+        return None
+
+    def bulk_write(self, operations, ordered=True):
+        self.requests += 1
+        self.bulk_calls += 1
+        if self.bulk_calls == self.fail_on_bulk:
+            # Apply part of operations before failure
+            operations = operations[:1]
+
+        for operation in operations:
+            if isinstance(operation, InsertOne):
+                doc = copy.deepcopy(operation._doc)
+                self.docs[doc["_id"]] = doc
+            elif isinstance(operation, UpdateOne):
+                doc = self.docs[operation._filter["_id"]]
+                for key, value in operation._doc["$set"].items():
+                    target = doc
+                    parts = key.split(".")
+                    for part in parts[:-1]:
+                        target = target.setdefault(part, {})
+                    target[parts[-1]] = value
+            elif isinstance(operation, DeleteOne):
+                self.docs.pop(operation._filter["_id"], None)
+            elif isinstance(operation, DeleteMany):
+                for doc_id in operation._filter["_id"]["$in"]:
+                    self.docs.pop(doc_id, None)
+            elif isinstance(operation, ReplaceOne):
+                self.docs[operation._filter["_id"]] = copy.deepcopy(
+                    operation._doc
+                )
+
+        if self.bulk_calls == self.fail_on_bulk:
+            raise RuntimeError("Connection lost")
+
+
+def _publish(batch, asset_id, count):
+    """Queue documents similar to integrator for multiple instances."""
+    batch.prefetch([
+        (asset_id, "model{}".format(idx), 1)
+        for idx in range(count)
+    ])
+    for idx in range(count):
+        subset_name = "model{}".format(idx)
+        subset = batch.find_subset(asset_id, subset_name)
+        if subset is None:
+            subset = {
+                "type": "subset", "name": subset_name, "parent": asset_id,
+                "data": {"families": ["model"]}
+            }
+            batch.insert_one("subset", subset)
+        batch.update_one(
+            "subset", subset["_id"], {"$set": {"data.subsetGroup": "main"}}
+        )
+
+        version = batch.find_version(subset["_id"], 1)
+        if version is None:
+            version = {"type": "version", "name": 1, "parent": subset["_id"]}
+            batch.insert_one("version", version)
+        else:
+            repre_ids = [
+                repre["_id"]
+                for repre in batch.find_representations(version["_id"])
+            ]
+            batch.delete_many("representation", repre_ids)
+
+        batch.insert_many("representation", [
+            {"type": "representation", "name": name, "parent": version["_id"]}
+            for name in ("abc", "ma")
+        ])
+
+
+def test_batch_commit():
+    asset_id = ObjectId()
+    collection = FakeCollection()
+    batch = DatabaseWriteBatch(collection)
+    _publish(batch, asset_id, 100)
+    batch.commit()
+
+    assert batch.committed
+    docs = list(collection.docs.values())
+    assert len([doc for doc in docs if doc["type"] == "subset"]) == 100
+    assert len([doc for doc in docs if doc["type"] == "version"]) == 100
+    assert len(
+        [doc for doc in docs if doc["type"] == "representation"]
+    ) == 200
+    assert all(
+        doc["data"]["subsetGroup"] == "main"
+        for doc in docs
+        if doc["type"] == "subset"
+    )
+    # One prefetch query and one write per stage
+    assert collection.requests == 4
+    assert batch.round_trips == collection.requests
+    assert batch.round_trips_saved > 400
+
+    # Republish of the same versions replaces representations
+    batch = DatabaseWriteBatch(collection)
+    _publish(batch, asset_id, 100)
+    batch.commit()
+    docs = list(collection.docs.values())
+    assert len(
+        [doc for doc in docs if doc["type"] == "representation"]
+    ) == 200
+
+
+def test_batch_rollback():
+    asset_id = ObjectId()
+    collection = FakeCollection()
+    batch = DatabaseWriteBatch(collection)
+    _publish(batch, asset_id, 5)
+    batch.commit()
+    original_docs = copy.deepcopy(collection.docs)
+
+    collection.fail_on_bulk = collection.bulk_calls + 2
+    batch = DatabaseWriteBatch(collection)
+    rolled_back = []
+    batch.on_rollback(lambda: rolled_back.append(True))
+    _publish(batch, asset_id, 10)
+    with pytest.raises(RuntimeError):
+        batch.commit()
+
+    assert rolled_back
+    assert not batch.committed
+    assert collection.docs == original_docs
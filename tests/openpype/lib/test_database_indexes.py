@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""Test suite for indexes of project collections.
+
+Tests with database require running mongod, url is taken from
+'OPENPYPE_MONGO' or local server on default port is used.
+"""
+import os
+import uuid
+
+import pytest
+import pymongo
+
+from openpype.lib.database_indexes import (
+    ensure_indexes,
+    advise_indexes,
+    explain_query,
+    get_registered_queries,
+    _plan_stages
+)
+
+
+@pytest.fixture
+def database():
+    url = os.environ.get("OPENPYPE_MONGO") or "mongodb://localhost:27017"
+    client = pymongo.MongoClient(url, serverSelectionTimeoutMS=500)
+    try:
+        client.server_info()
+    except pymongo.errors.PyMongoError:
+        pytest.skip("MongoDB is not available on {}".format(url))
+
+    database_name = "test_indexes_{}".format(uuid.uuid4().hex[:8])
+    yield client[database_name]
+    client.drop_database(database_name)
+    client.close()
+
+
+def test_plan_stages():
+    plan = {
+        "stage": "LIMIT",
+        "inputStage": {
+            "stage": "FETCH",
+            "inputStage": {"stage": "IXSCAN", "indexName": "type_name"}
+        }
+    }
+    assert _plan_stages(plan) == [
+        ("LIMIT", None), ("FETCH", None), ("IXSCAN", "type_name")
+    ]
+
+
+def test_ensure_indexes(database):
+    project_name = "test_project"
+    collection = database[project_name]
+    collection.insert_one({"type": "project", "name": project_name})
+    collection.insert_many([
+        {"type": "asset", "name": "sh{:03d}".format(idx)}
+        for idx in range(10)
+    ])
+    # Not a project collection
+    database["other"].insert_one({"type": "asset"})
+
+    results = advise_indexes(database)
+    assert list(results.keys()) == [project_name]
+    assert all(result["collscan"] for result in results[project_name])
+
+    output = ensure_indexes(database)
+    assert list(output.keys()) == [project_name]
+    # Repeated call doesn't fail
+    ensure_indexes(database, [project_name])
+
+    for query_def in get_registered_queries():
+        result = explain_query(collection, query_def)
+        assert not result["collscan"], query_def.label
+        assert result["indexes"]
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""Test suite for file transfer engine."""
+import os
+import time
+import errno
+import shutil
+
+import pytest
+
+from openpype.lib import file_transfer
+from openpype.lib.file_transfer import (
+    FileTransferEngine,
+    FileTransferError,
+    content_hash,
+    content_hashes
+)
+
+
+def _create_sequence(staging_dir, frame_count, size=1024):
+    os.makedirs(staging_dir)
+    content = os.urandom(size)
+    paths = []
+    for frame in range(1001, 1001 + frame_count):
+        path = os.path.join(
+            staging_dir, "renderMain.{:04d}.exr".format(frame)
+        )
+        with open(path, "wb") as stream:
+            stream.write(content)
+        paths.append(path)
+    return paths
+
+
+def _transfers(paths, publish_dir):
+    return [
+        (path, os.path.join(publish_dir, os.path.basename(path)))
+        for path in paths
+    ]
+
+
+def test_transfer(tmp_path):
+    paths = _create_sequence(str(tmp_path / "staging"), 20)
+    transfers = _transfers(paths, str(tmp_path / "publish" / "v001"))
+
+    progress = []
+    engine = FileTransferEngine(
+        max_workers=4,
+        verify_checksum=True,
+        progress_callback=lambda *args: progress.append(args)
+    )
+    sizes = engine.transfer(transfers)
+
+    assert len(sizes) == len(transfers)
+    assert len(progress) == len(transfers)
+    for src, dst in transfers:
+        assert sizes[dst] == os.path.getsize(src)
+        with open(src, "rb") as src_stream, open(dst, "rb") as dst_stream:
+            assert src_stream.read() == dst_stream.read()
+
+
+def test_transfer_retry_limit(tmp_path, monkeypatch):
+    paths = _create_sequence(str(tmp_path / "staging"), 1)
+    transfers = _transfers(paths, str(tmp_path / "publish"))
+
+    engine = FileTransferEngine(max_retries=2)
+    attempts = []
+
+    def failing_verify(src, dst):
+        attempts.append(dst)
+        return False
+
+    monkeypatch.setattr(engine, "verify", failing_verify)
+    with pytest.raises(FileTransferError):
+        engine.transfer(transfers)
+    assert len(attempts) == 3
+
+
+def test_fast_copy_unsupported_method(tmp_path, monkeypatch):
+    src = _create_sequence(str(tmp_path / "staging"), 1)[0]
+    dst = str(tmp_path / "staging" / "copy.exr")
+
+    engine = FileTransferEngine()
+    devices, _ = engine._copy_methods(src, dst)
+    engine._methods_by_devices[devices] = ["reflink", "copy"]
+
+    errors = [errno.ENOSPC, errno.EOPNOTSUPP]
+
+    def failing_reflink(src, dst):
+        raise OSError(errors.pop(0), "Reflink failed")
+
+    monkeypatch.setitem(file_transfer.COPY_METHODS, "reflink", failing_reflink)
+
+    # Error of the file doesn't disable method
+    assert engine.fast_copy(src, dst) == "copy"
+    assert engine._methods_by_devices[devices] == ["reflink", "copy"]
+
+    assert engine.fast_copy(src, dst) == "copy"
+    assert engine._methods_by_devices[devices] == ["copy"]
+    with open(src, "rb") as src_stream, open(dst, "rb") as dst_stream:
+        assert src_stream.read() == dst_stream.read()
+
+
+def _sequential_transfer(transfers):
+    """Previous behavior of integrator.
+
+    Sequential copy with 'makedirs' and size verification for each file.
+    """
+    for src, dst in transfers:
+        try:
+            os.makedirs(os.path.dirname(dst))
+        except OSError:
+            pass
+        if not shutil._samefile(src, dst):
+            shutil.copyfile(src, dst)
+        assert os.path.getsize(src) == os.path.getsize(dst)
+
+
+@pytest.mark.slow
+def test_transfer_sequence_benchmark(tmp_path, printer):
+    """Integrate synthetic 5000 frame sequence."""
+    paths = _create_sequence(str(tmp_path / "staging"), 5000, 64 * 1024)
+    publish_dir = str(tmp_path / "publish")
+
+    # Best of repeated runs, pending writes of previous run are flushed
+    #   so they don't slow down the other method
+    sync = getattr(os, "sync", lambda: None)
+    sequential_times = []
+    engine_times = []
+    for _ in range(5):
+        transfers = _transfers(paths, publish_dir)
+        sync()
+        start = time.perf_counter()
+        _sequential_transfer(transfers)
+        sequential_times.append(time.perf_counter() - start)
+        shutil.rmtree(publish_dir)
+
+        engine = FileTransferEngine(max_workers=8)
+        sync()
+        start = time.perf_counter()
+        sizes = engine.transfer(transfers)
+        engine_times.append(time.perf_counter() - start)
+        shutil.rmtree(publish_dir)
+        assert len(sizes) == 5000
+
+    sequential_time = min(sequential_times)
+    engine_time = min(engine_times)
+    printer("sequential: {:.3f}s engine: {:.3f}s methods: {}".format(
+        sequential_time, engine_time, engine.method_counts
+    ))
+    assert engine_time < sequential_time
+
+
+def test_content_hashes(tmp_path):
+    paths = _create_sequence(str(tmp_path / "staging"), 10)
+    other_path = str(tmp_path / "other.exr")
+    with open(other_path, "wb") as stream:
+        stream.write(b"other content")
+
+    hashes = content_hashes(paths + [other_path], max_workers=4)
+    assert len(hashes) == 11
+    # Frames have the same content
+    assert len({hashes[path] for path in paths}) == 1
+    assert hashes[other_path] != hashes[paths[0]]
+    assert hashes[other_path] == content_hash(other_path)
+    assert hashes[other_path].split(":")[0] in ("xxh3_128", "blake2b", "sha1")
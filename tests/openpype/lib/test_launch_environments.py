@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Test suite for cache of computed launch environments."""
+import os
+import json
+
+import pytest
+
+pytest.importorskip("acre")
+
+from openpype.lib import applications  # noqa: E402
+
+
+ENV_DEFINITIONS = [
+    {
+        "APP_ROOT": "/apps/app",
+        "PATH": ["{APP_ROOT}/bin", "{PATH}"]
+    },
+    {
+        "TOOL_ROOT": "{APP_ROOT}/tools"
+    }
+]
+
+
+def test_launch_environments_cache(tmp_path):
+    env = {"PATH": "/usr/bin", "HOME": "/home/user"}
+    cache = applications.LaunchEnvironmentsCache(str(tmp_path))
+
+    result = cache.compute(ENV_DEFINITIONS, env)
+    assert result == applications._compute_environments(ENV_DEFINITIONS, env)
+    assert result["TOOL_ROOT"] == "/apps/app/tools"
+    assert env == {"PATH": "/usr/bin", "HOME": "/home/user"}
+    assert cache.stats()["misses"] == 1
+
+    # Not referenced environments don't affect the cache
+    other_env = dict(env, HOME="/home/other")
+    assert cache.compute(ENV_DEFINITIONS, other_env)["HOME"] == "/home/other"
+    assert cache.stats()["hits"] == 1
+
+    # Referenced environment is part of key
+    result = cache.compute(ENV_DEFINITIONS, dict(env, PATH="/bin"))
+    assert result["PATH"].endswith("/bin")
+    assert cache.stats()["misses"] == 2
+
+    # Persisted cache is used by new cache object
+    new_cache = applications.LaunchEnvironmentsCache(str(tmp_path))
+    assert new_cache.compute(ENV_DEFINITIONS, env) == (
+        applications._compute_environments(ENV_DEFINITIONS, env)
+    )
+    assert new_cache.stats() == {"hits": 1, "misses": 0, "cached": 1}
+
+
+def test_launch_environments_cache_dynamic_keys(tmp_path):
+    env_definitions = [{"{APP_NAME}_ROOT": "/apps"}]
+    cache = applications.LaunchEnvironmentsCache(str(tmp_path))
+
+    # Environment referenced only by key is part of cache key
+    cache.compute(env_definitions, {"APP_NAME": "maya"})
+    cache.compute(env_definitions, {"APP_NAME": "nuke"})
+    assert cache.stats()["misses"] == 2
+    cache.compute(env_definitions, {"APP_NAME": "maya"})
+    assert cache.stats()["hits"] == 1
+
+
+def test_launch_environments_cache_prune(tmp_path):
+    cache = applications.LaunchEnvironmentsCache(str(tmp_path))
+    cache.max_cache_files = 2
+
+    for job_id in range(4):
+        env = {"PATH": "/usr/bin", "JOB_ID": str(job_id)}
+        definitions = [{"JOB_DIR": "/jobs/{JOB_ID}"}]
+        cache.compute(definitions, env)
+        filenames = os.listdir(str(tmp_path))
+        assert len(filenames) == min(job_id + 1, 2)
+
+    # Only hash of key is stored, not values of environments
+    for filename in filenames:
+        with open(os.path.join(str(tmp_path), filename), "r") as stream:
+            data = json.load(stream)
+        assert data["key"] == os.path.splitext(filename)[0]
+        assert "/usr/bin" not in json.dumps(data)
+
+    # Not used files are removed
+    cache.max_cache_age = 0
+    cache.prune()
+    assert os.listdir(str(tmp_path)) == []
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+"""Throughput benchmark of ftrack event processor.
+
+Replays events stored by event storer. Recorded events can be exported from
+'ftrack_events' collection with 'mongoexport --jsonArray' and passed with
+'OPENPYPE_FTRACK_EVENTS_REPLAY' environment variable, otherwise synthetic
+status changes of 500 tasks are used.
+
+Requires running mongod ('OPENPYPE_MONGO' or local server) and ftrack_api.
+"""
+import os
+import uuid
+import time
+import datetime
+import threading
+
+import pytest
+import pymongo
+from bson import json_util
+
+ftrack_api = pytest.importorskip("ftrack_api")
+
+
+class FakeSocket(object):
+    def sendall(self, data):
+        pass
+
+
+def _recorded_events():
+    path = os.environ.get("OPENPYPE_FTRACK_EVENTS_REPLAY")
+    if path:
+        with open(path, "r") as stream:
+            events = json_util.loads(stream.read())
+        for event in events:
+            event.pop("_id", None)
+        return events
+
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "topic": "ftrack.update",
+            "data": {"entities": [{
+                "entityType": "task",
+                "entityId": str(uuid.uuid4()),
+                "action": "update",
+                "keys": ["statusid"],
+                "changes": {"statusid": {"new": "1", "old": "2"}}
+            }]},
+            "source": {"user": {"username": "benchmark"}},
+            "target": "",
+            "in_reply_to_event": None,
+            "sent": None
+        }
+        for _ in range(500)
+    ]
+
+
+@pytest.fixture
+def mongo_env(monkeypatch):
+    url = os.environ.get("OPENPYPE_MONGO") or "mongodb://localhost:27017"
+    client = pymongo.MongoClient(url, serverSelectionTimeoutMS=500)
+    try:
+        client.server_info()
+    except pymongo.errors.PyMongoError:
+        pytest.skip("MongoDB is not available on {}".format(url))
+
+    database_name = "test_ftrack_events_{}".format(uuid.uuid4().hex[:8])
+    monkeypatch.setenv("OPENPYPE_MONGO", url)
+    monkeypatch.setenv("OPENPYPE_DATABASE_NAME", database_name)
+    yield client[database_name]["ftrack_events"]
+    client.drop_database(database_name)
+    client.close()
+
+
+def _replay(collection, events, **hub_attributes):
+    from openpype.modules import load_modules
+    load_modules()
+    from openpype_modules.ftrack.ftrack_server.lib import ProcessEventHub
+
+    handled = []
+
+    class BenchmarkEventHub(ProcessEventHub):
+        def _handle(self, event, synchronous=False):
+            if event["topic"] != "ftrack.meta.disconnected":
+                handled.append(event)
+                if len(handled) == len(events):
+                    self._event_queue.put(ftrack_api.event.base.Event(
+                        topic="ftrack.meta.disconnected"
+                    ))
+            return super(BenchmarkEventHub, self)._handle(event, synchronous)
+
+    hub = BenchmarkEventHub(
+        "https://benchmark.ftrackapp.com", "benchmark", "key",
+        sock=FakeSocket()
+    )
+    for key, value in hub_attributes.items():
+        setattr(hub, key, value)
+
+    def store():
+        # Same write as event storer does
+        time.sleep(0.5)
+        for event_data in events:
+            event_data = dict(event_data)
+            event_data["pype_data"] = {
+                "stored": datetime.datetime.utcnow(),
+                "is_processed": False
+            }
+            collection.replace_one(
+                {"id": event_data["id"]}, event_data, upsert=True
+            )
+
+    collection.delete_many({})
+    storer = threading.Thread(target=store)
+    start = time.perf_counter()
+    storer.start()
+    hub.wait(duration=120)
+    storer.join()
+    elapsed = time.perf_counter() - start - 0.5
+
+    assert len(handled) == len(events)
+    assert collection.count_documents(
+        {"pype_data.is_processed": False}
+    ) == 0
+    return elapsed, hub
+
+
+def test_handle_results_and_acknowledge(mongo_env):
+    from openpype.modules import load_modules
+    load_modules()
+    from openpype_modules.ftrack.ftrack_server.lib import (
+        ProcessEventHub,
+        PartitionedWorkerPool
+    )
+
+    release = threading.Event()
+
+    class ConcurrentHandler(object):
+        concurrent_safe = True
+
+        def callback(self, event):
+            release.wait(5)
+            return "concurrent"
+
+    hub = ProcessEventHub(
+        "https://benchmark.ftrackapp.com", "benchmark", "key",
+        sock=FakeSocket()
+    )
+    hub._add_subscriber("topic=test", lambda event: "serial", None, 100)
+    hub._add_subscriber("topic=test", ConcurrentHandler().callback, None, 50)
+
+    # Synchronous events are handled only in this thread
+    hub._handler_pool = PartitionedWorkerPool(1)
+    event = ftrack_api.event.base.Event(topic="test")
+    release.set()
+    assert hub._handle(event, synchronous=True) == ["concurrent", "serial"]
+
+    # Stored event is acknowledged after worker finished
+    release.clear()
+    event = ftrack_api.event.base.Event(
+        topic="test", data={"_event_mongo_id": "stored_id"}
+    )
+    assert hub._handle(event) == ["serial"]
+    assert hub._acks == []
+    release.set()
+    hub._handler_pool.shutdown(timeout=5)
+    assert hub._acks == ["stored_id"]
+
+
+@pytest.mark.slow
+def test_event_processor_benchmark(mongo_env, printer):
+    events = _recorded_events()
+
+    # Polling with acknowledge of each event (previous behavior)
+    polling_time, polling_hub = _replay(
+        mongo_env, events, use_change_stream=False, ack_batch_size=1
+    )
+    push_time, push_hub = _replay(mongo_env, events)
+
+    printer((
+        "{} events - polling: {:.2f}s ({} acks), push: {:.2f}s ({} acks)"
+    ).format(
+        len(events), polling_time, polling_hub.ack_round_trips,
+        push_time, push_hub.ack_round_trips
+    ))
+    assert push_hub.ack_round_trips <= polling_hub.ack_round_trips
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Test suite for batched ftrack queries used by synchronization."""
+import re
+
+import pytest
+
+pytest.importorskip("ftrack_api")
+pytest.importorskip("avalon")
+
+
+class FakeQueryResult(object):
+    def __init__(self, entities):
+        self._entities = entities
+
+    def all(self):
+        return self._entities
+
+
+class FakeSession(object):
+    def __init__(self, existing_ids=None, values=None):
+        self.existing_ids = existing_ids
+        self.values = values or []
+        self.calls = []
+
+    def query(self, expression):
+        self.calls.append(expression)
+        entity_ids = re.findall(r"\"([^\"]+)\"", expression)
+        return FakeQueryResult([
+            {"id": entity_id}
+            for entity_id in entity_ids
+            if self.existing_ids is None or entity_id in self.existing_ids
+        ])
+
+    def call(self, queries):
+        self.calls.append(queries)
+        return [{"data": self.values}] + [{"data": []}] * (len(queries) - 1)
+
+
+@pytest.fixture
+def avalon_sync():
+    from openpype.modules import load_modules
+    load_modules()
+    from openpype_modules.ftrack.lib import avalon_sync
+    return avalon_sync
+
+
+def test_entities_are_queried_in_chunks(avalon_sync):
+    session = FakeSession(existing_ids={"a", "b", "c"})
+    batcher = avalon_sync.EntitiesQueryBatcher(
+        session, "select id from TypedContext where id in ({})"
+    )
+    batcher.chunk_size = 2
+    batcher.request(["a", "b", "c", "missing"])
+
+    assert batcher.get("a")["id"] == "a"
+    assert batcher.query_count == 2
+    # Memoized, also not existing entities
+    assert batcher.get("missing") is None
+    assert batcher.get("c")["id"] == "c"
+    assert len(session.calls) == 2
+
+
+def test_hierarchical_values_of_multiple_entities(avalon_sync):
+    session = FakeSession(values=[
+        {"value": 25.0, "configuration_id": "fps_id", "entity_id": "project"},
+        {"value": 30.0, "configuration_id": "fps_id", "entity_id": "shot"}
+    ])
+    hier_attrs = [{
+        "id": "fps_id",
+        "key": "fps",
+        "type_id": "number_id",
+        "default": 24,
+        "config": "{\"isdecimal\": false}"
+    }]
+    cust_attr_types = [{"id": "number_id", "name": "number"}]
+    entities = [
+        {"id": "shot", "link": [{"id": "project"}, {"id": "shot"}]},
+        {"id": "asset", "link": [{"id": "project"}, {"id": "asset"}]},
+        {"id": "other", "link": [{"id": "other"}]}
+    ]
+    values = avalon_sync.get_hierarchical_attributes_values_by_entity_id(
+        session, entities, hier_attrs, cust_attr_types
+    )
+    assert values == {
+        "shot": {"fps": 30},
+        "asset": {"fps": 25},
+        "other": {"fps": 24}
+    }
+    assert len(session.calls) == 1
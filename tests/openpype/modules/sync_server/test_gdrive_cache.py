@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Test suite for persistent cache of GDrive folders."""
+from openpype.modules.default_modules.sync_server.providers.gdrive_cache import (  # noqa: E501
+    GDriveFolderCache,
+    FOLDER_MIME_TYPE
+)
+
+
+class _Request(object):
+    def __init__(self, response):
+        self._response = response
+
+    def execute(self):
+        return self._response
+
+
+class FakeChanges(object):
+    """Changes feed with pages of changes stored by page token."""
+
+    def __init__(self):
+        self.token = 1
+        self.pages = {}
+        self.list_calls = 0
+
+    def getStartPageToken(self, **kwargs):
+        return _Request({"startPageToken": str(self.token)})
+
+    def list(self, pageToken, **kwargs):
+        self.list_calls += 1
+        changes = self.pages.get(pageToken, [])
+        return _Request({
+            "changes": changes,
+            "newStartPageToken": str(int(pageToken) + 1)
+        })
+
+
+class FakeService(object):
+    def __init__(self):
+        self._changes = FakeChanges()
+
+    def changes(self):
+        return self._changes
+
+
+def _folder_change(folder_id, name, parent):
+    return {
+        "fileId": folder_id,
+        "file": {
+            "id": folder_id,
+            "name": name,
+            "parents": [parent],
+            "mimeType": FOLDER_MIME_TYPE
+        }
+    }
+
+
+def _names(folders):
+    return {folder["id"]: folder["name"] for folder in folders}
+
+
+def test_folder_cache(tmp_path):
+    path = str(tmp_path / "cache" / "gdrive.sqlite")
+    service = FakeService()
+    listings = []
+
+    def list_folders():
+        listings.append(True)
+        return [
+            {"id": "a", "name": "projects", "parents": ["root"]},
+            {"id": "b", "name": "test_project", "parents": ["a"]},
+        ]
+
+    cache = GDriveFolderCache(path)
+    folders = cache.sync(service, list_folders)
+    assert _names(folders) == {"a": "projects", "b": "test_project"}
+    assert len(listings) == 1
+    assert cache.start_page_token == "1"
+
+    # New process starts with changes since last sync only
+    service.changes().pages["1"] = [
+        _folder_change("c", "assets", "b"),
+        _folder_change("b", "renamed_project", "a"),
+        {"fileId": "a", "removed": True},
+        {
+            "fileId": "f",
+            "file": {"id": "f", "name": "file.exr", "mimeType": "image/exr"}
+        },
+    ]
+    cache = GDriveFolderCache(path)
+    folders = cache.sync(service, list_folders)
+    assert len(listings) == 1
+    assert _names(folders) == {"b": "renamed_project", "c": "assets"}
+    assert cache.start_page_token == "2"
+
+    # Trashed folder is removed, created folder is stored immediately
+    service.changes().pages["2"] = [{
+        "fileId": "c",
+        "file": {"id": "c", "name": "assets", "trashed": True,
+                 "mimeType": FOLDER_MIME_TYPE}
+    }]
+    cache.add_folder("d", "shots", "b")
+    folders = cache.sync(service, list_folders)
+    assert _names(folders) == {"b": "renamed_project", "d": "shots"}
+    assert {"id": "d", "name": "shots", "parents": ["b"]} in folders
+
+    cache.clear()
+    cache.sync(service, list_folders)
+    assert len(listings) == 2
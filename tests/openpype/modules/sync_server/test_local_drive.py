@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Test suite for chunked and resumable copy of local drive provider."""
+import os
+
+import pytest
+
+from openpype.modules.default_modules.sync_server.providers.local_drive import (  # noqa: E501
+    LocalDriveHandler
+)
+
+
+class FakeServer(object):
+    LOG_PROGRESS_SEC = 0
+
+    def __init__(self, fail_after=None):
+        self.updates = []
+        self.fail_after = fail_after
+
+    def update_db(self, progress=None, resume_info=None, **kwargs):
+        self.updates.append((progress, resume_info))
+        if self.fail_after and len(self.updates) >= self.fail_after:
+            raise IOError("Connection to target lost")
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    monkeypatch.setattr(LocalDriveHandler, "CHUNK_SIZE", 1024)
+    monkeypatch.setattr(LocalDriveHandler, "RESUMABLE_SIZE", 4096)
+    return LocalDriveHandler("test_project", "studio")
+
+
+def _upload(handler, server, source_path, target_path, file):
+    return handler.upload_file(source_path, target_path, server,
+                               "test_project", file, {}, "studio",
+                               overwrite=True)
+
+
+def test_resumed_copy(handler, tmp_path):
+    source_path = str(tmp_path / "texture.tx")
+    target_path = str(tmp_path / "target" / "texture.tx")
+    os.makedirs(os.path.dirname(target_path))
+    content = os.urandom(10 * 1024)
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+
+    server = FakeServer(fail_after=4)
+    file = {"sites": [{"name": "studio"}]}
+    with pytest.raises(IOError):
+        _upload(handler, server, source_path, target_path, file)
+    assert not os.path.exists(target_path)
+
+    # checkpoint stored in DB is part of site record on next attempt
+    _, resume_info = server.updates[-1]
+    assert resume_info["offset"] == 4 * 1024
+    file["sites"][0]["resume"] = resume_info
+
+    server = FakeServer()
+    assert _upload(handler, server, source_path, target_path, file) == \
+        "texture.tx"
+    # copy continued from checkpoint
+    assert len(server.updates) == 6
+    assert not os.path.exists(target_path + handler.TEMP_SUFFIX)
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
+
+
+def test_invalid_checkpoint(handler, tmp_path):
+    source_path = str(tmp_path / "texture.tx")
+    target_path = str(tmp_path / "texture_copy.tx")
+    content = os.urandom(8 * 1024)
+    with open(source_path, "wb") as stream:
+        stream.write(content)
+    with open(target_path + handler.TEMP_SUFFIX, "wb") as stream:
+        stream.write(os.urandom(4 * 1024))
+
+    resume_info = {
+        "offset": 4 * 1024,
+        "checksum": "0" * 40,
+        "size": len(content),
+        "mtime": os.path.getmtime(source_path)
+    }
+    file = {"sites": [{"name": "studio", "resume": resume_info}]}
+    server = FakeServer()
+    _upload(handler, server, source_path, target_path, file)
+
+    assert len(server.updates) == 8
+    with open(target_path, "rb") as stream:
+        assert stream.read() == content
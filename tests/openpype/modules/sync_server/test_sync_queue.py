@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""Test suite for queue mode of sync server.
+
+Requires running mongod ('OPENPYPE_MONGO' or local server) and avalon.
+"""
+import os
+import time
+import uuid
+import datetime
+
+import pytest
+import pymongo
+from bson.objectid import ObjectId
+
+pytest.importorskip("avalon")
+
+from openpype.modules.default_modules.sync_server.sync_queue import (  # noqa: E402, E501
+    SyncQueue
+)
+from openpype.modules.default_modules.sync_server.sync_server_module import (  # noqa: E402, E501
+    SyncServerModule
+)
+
+PROJECT_NAME = "TestProject"
+
+
+class FakeConnection(object):
+    def __init__(self, database):
+        self.database = database
+        self.Session = {}
+
+    def aggregate(self, pipeline):
+        collection = self.database[self.Session["AVALON_PROJECT"]]
+        return collection.aggregate(pipeline)
+
+
+@pytest.fixture
+def database():
+    url = os.environ.get("OPENPYPE_MONGO") or "mongodb://localhost:27017"
+    client = pymongo.MongoClient(url, serverSelectionTimeoutMS=500)
+    try:
+        client.server_info()
+    except pymongo.errors.PyMongoError:
+        pytest.skip("MongoDB is not available on {}".format(url))
+
+    database_name = "test_sync_queue_{}".format(uuid.uuid4().hex[:8])
+    yield client[database_name]
+    client.drop_database(database_name)
+    client.close()
+
+
+def _module(database):
+    module = SyncServerModule.__new__(SyncServerModule)
+    module._connection = FakeConnection(database)
+    module._sync_project_settings = {
+        PROJECT_NAME: {"config": {"retry_cnt": 3}}
+    }
+    module.sync_queue_mode = True
+    module.queue_reconcile_interval = 3600
+    module._sync_queue = SyncQueue(database["sync_queue"])
+    module._last_reconcile = {}
+    return module
+
+
+def _representation(synced_site, missing_site):
+    return {
+        "_id": ObjectId(),
+        "type": "representation",
+        "files": [{
+            "_id": ObjectId(),
+            "sites": [
+                {"name": synced_site, "created_dt": datetime.datetime.now()},
+                {"name": missing_site}
+            ]
+        }]
+    }
+
+
+def _job_sites(database):
+    return {
+        (job["representation_id"], job["site"])
+        for job in database["sync_queue"].find()
+    }
+
+
+def test_reconcile_and_finish_download_jobs(database):
+    module = _module(database)
+    upload = _representation("studio", "gdrive")
+    download = _representation("gdrive", "studio")
+    database[PROJECT_NAME].insert_many([upload, download])
+
+    module.reconcile_sync_queue(PROJECT_NAME, "studio", "gdrive")
+    assert _job_sites(database) == {
+        (upload["_id"], "gdrive"),
+        (download["_id"], "studio")
+    }
+
+    # Pending jobs are kept
+    repre_ids = [upload["_id"], download["_id"]]
+    module.finish_sync_jobs(PROJECT_NAME, repre_ids, ["studio", "gdrive"])
+    assert _job_sites(database) == {
+        (upload["_id"], "gdrive"),
+        (download["_id"], "studio")
+    }
+
+    # Failed download still can be retried
+    database[PROJECT_NAME].update_one(
+        {"_id": download["_id"]},
+        {"$set": {"files.0.sites.1.tries": 1}}
+    )
+    module.finish_sync_jobs(PROJECT_NAME, repre_ids, ["studio", "gdrive"])
+    assert (download["_id"], "studio") in _job_sites(database)
+
+    database[PROJECT_NAME].update_one(
+        {"_id": download["_id"]},
+        {"$set": {"files.0.sites.1.created_dt": datetime.datetime.now()}}
+    )
+    module.finish_sync_jobs(PROJECT_NAME, repre_ids, ["studio", "gdrive"])
+    assert _job_sites(database) == {(upload["_id"], "gdrive")}
+
+
+def test_queued_representations_pages(database, monkeypatch):
+    module = _module(database)
+    monkeypatch.setattr(module, "QUEUE_CHUNK_SIZE", 4)
+    representations = [
+        _representation("studio", "gdrive") for _ in range(10)
+    ]
+    database[PROJECT_NAME].insert_many(representations)
+    module._last_reconcile[PROJECT_NAME] = time.time()
+
+    # Jobs of deleted representations are removed while paging
+    module.sync_queue.enqueue(
+        PROJECT_NAME, [repre["_id"] for repre in representations], "gdrive"
+    )
+    module.sync_queue.enqueue(
+        PROJECT_NAME, [ObjectId() for _ in range(5)], "gdrive", 100
+    )
+    module.sync_queue.enqueue(
+        PROJECT_NAME, [representations[-1]["_id"]], "studio", 90
+    )
+
+    result = module.get_queued_representations(
+        PROJECT_NAME, "studio", "gdrive", limit=3)
+    assert [repre["_id"] for repre in result] == [
+        representations[-1]["_id"],
+        representations[0]["_id"],
+        representations[1]["_id"]
+    ]
+    assert result[0]["priority"] == 90
+    # Jobs of deleted representations were removed
+    assert database["sync_queue"].count_documents({"priority": 100}) == 0
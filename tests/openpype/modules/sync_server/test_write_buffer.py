@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""Test suite for write-behind buffer of sync server updates."""
+from openpype.modules.default_modules.sync_server.write_buffer import (
+    SyncWriteBuffer
+)
+
+
+class FakeCollection(object):
+    def __init__(self, fail=False):
+        self.bulk_writes = []
+        self.fail = fail
+
+    def bulk_write(self, operations, ordered=True):
+        if self.fail:
+            raise RuntimeError("Connection lost")
+        self.bulk_writes.append(operations)
+
+
+def _add(buffer, collection, file_id, kind, value):
+    query = {"_id": "repre"}
+    update = {"$set": {"files.$[f].sites.$[s].{}".format(kind): value}}
+    arr_filter = [{"s.name": "studio"}, {"f._id": file_id}]
+    buffer.add(collection, query, update, arr_filter, kind,
+               "repre", file_id, "studio")
+
+
+def test_write_buffer():
+    collections = {"ProjectA": FakeCollection(), "ProjectB": FakeCollection()}
+    buffer = SyncWriteBuffer(collections.get, batch_size=100)
+
+    for file_idx in range(10):
+        for progress in (0.1, 0.5, 0.9):
+            _add(buffer, "ProjectA", file_idx, "progress", progress)
+        _add(buffer, "ProjectA", file_idx, "success", file_idx)
+        # late progress tick doesn't overwrite final state
+        _add(buffer, "ProjectA", file_idx, "progress", 1.0)
+    _add(buffer, "ProjectB", 0, "error", "failed")
+
+    assert len(buffer) == 11
+    buffer.flush()
+    assert len(buffer) == 0
+
+    operations = collections["ProjectA"].bulk_writes[0]
+    assert len(collections["ProjectA"].bulk_writes) == 1
+    assert len(operations) == 10
+    assert all(
+        "files.$[f].sites.$[s].success" in operation._doc["$set"]
+        for operation in operations
+    )
+    assert len(collections["ProjectB"].bulk_writes) == 1
+    assert buffer.requested == 51
+    assert buffer.written == 11
+    assert buffer.writes_avoided == 49
+
+
+def test_write_buffer_batch_size_and_retry():
+    collection = FakeCollection(fail=True)
+    buffer = SyncWriteBuffer(lambda _: collection, batch_size=5)
+
+    for file_idx in range(5):
+        _add(buffer, "ProjectA", file_idx, "progress", 0.5)
+    # failed flush keeps updates for next flush
+    assert len(buffer) == 5
+    assert buffer.bulk_writes == 0
+
+    collection.fail = False
+    _add(buffer, "ProjectA", 0, "success", 0)
+    assert len(buffer) == 0
+    assert len(collection.bulk_writes) == 1
+    assert len(collection.bulk_writes[0]) == 5
+
+
+def test_write_buffer_keeps_checkpoint():
+    collection = FakeCollection()
+    buffer = SyncWriteBuffer(lambda _: collection)
+
+    query = {"_id": "repre"}
+    arr_filter = [{"s.name": "studio"}, {"f._id": 0}]
+    buffer.add("ProjectA", query, {"$set": {
+        "files.$[f].sites.$[s].progress": 0.5,
+        "files.$[f].sites.$[s].resume": {"offset": 1024}
+    }}, arr_filter, "progress", "repre", 0, "studio")
+    buffer.add("ProjectA", query, {"$set": {
+        "files.$[f].sites.$[s].progress": "",
+        "files.$[f].sites.$[s].error": "failed"
+    }}, arr_filter, "error", "repre", 0, "studio")
+    buffer.flush()
+
+    operation = collection.bulk_writes[0][0]
+    assert operation._doc["$set"] == {
+        "files.$[f].sites.$[s].progress": "",
+        "files.$[f].sites.$[s].error": "failed",
+        "files.$[f].sites.$[s].resume": {"offset": 1024}
+    }
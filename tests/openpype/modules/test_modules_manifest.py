@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Test suite for lazy loading of OpenPype modules with manifest."""
+import sys
+import json
+import textwrap
+
+import pytest
+
+from openpype.modules import base
+
+
+MODULE_CODE = textwrap.dedent("""
+    from openpype.modules import OpenPypeModule
+
+
+    class ExampleModule(OpenPypeModule):
+        name = "example"
+
+        def initialize(self, modules_settings):
+            self.enabled = modules_settings[self.name]["enabled"]
+
+        def connect_with_modules(self, enabled_modules):
+            pass
+""")
+
+
+@pytest.fixture
+def modules_dir(tmp_path, monkeypatch):
+    module_dir = tmp_path / "example_module"
+    module_dir.mkdir()
+    (module_dir / "__init__.py").write_text(MODULE_CODE)
+    (module_dir / "manifest.json").write_text(json.dumps({
+        "name": "example",
+        "class": "ExampleModule",
+        "interfaces": [],
+        "settings_key": "example"
+    }))
+
+    monkeypatch.setattr(base, "get_module_dirs", lambda: [str(tmp_path)])
+    base.load_interfaces()
+    monkeypatch.setattr(base._LoadCache, "modules_loaded", True)
+    for key in ("openpype_modules", "openpype_modules.example_module"):
+        monkeypatch.delitem(sys.modules, key, raising=False)
+    monkeypatch.setattr(sys, "meta_path", list(sys.meta_path))
+    base._load_modules()
+    yield tmp_path
+    for key in tuple(sys.modules.keys()):
+        if key.startswith("openpype_modules.example_module"):
+            sys.modules.pop(key)
+
+
+def test_disabled_module_is_not_imported(modules_dir):
+    manager = base.ModulesManager(
+        _system_settings={"modules": {"example": {"enabled": False}}}
+    )
+    assert "openpype_modules.example_module" not in sys.modules
+    assert not manager.modules
+    assert list(manager.get_disabled_manifests()) == ["example"]
+
+    # Disabled module is initialized on access
+    module = manager.modules_by_name["example"]
+    assert not module.enabled
+    assert "openpype_modules.example_module" in sys.modules
+    assert manager.modules_by_name.get("missing") is None
+
+
+def test_enabled_module_is_imported(modules_dir):
+    manager = base.ModulesManager(
+        _system_settings={"modules": {"example": {"enabled": True}}}
+    )
+    assert [module.name for module in manager.get_enabled_modules()] == [
+        "example"
+    ]
+    assert "ExampleModule" in manager._report["Import"]
+
+
+def test_lazy_module_import_statement(modules_dir):
+    from openpype_modules.example_module import ExampleModule
+
+    assert ExampleModule.name == "example"